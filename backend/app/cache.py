@@ -0,0 +1,150 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_MAX_ENTRIES = 512
+
+# Invalidation tags: every cached response lists the tables it was built from
+EMPLOYEES = "employees"
+DEPARTMENTS = "departments"
+ROLES = "roles"
+
+
+class CacheEntry(NamedTuple):
+    body: bytes
+    etag: str
+    tags: frozenset
+    expires_at: float
+
+
+def _etag(body: bytes) -> str:
+    return f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+
+# ---------------------------
+# TTL + LRU Response Cache
+# ---------------------------
+class ResponseCache:
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # Bumped by invalidate(); a response computed across a bump may predate the write
+        self._generations: Dict[str, int] = {}
+        # Called with the invalidated tags on every write (e.g. the live dashboard feed)
+        self.listeners: List[Callable[[Tuple[str, ...]], None]] = []
+
+    def get(self, key) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def generation(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        return tuple(self._generations.get(tag, 0) for tag in sorted(tags))
+
+    def set(
+        self,
+        key,
+        body: bytes,
+        tags: Iterable[str],
+        generation: Optional[Tuple[int, ...]] = None
+    ) -> CacheEntry:
+        tags = frozenset(tags)
+        entry = CacheEntry(body, _etag(body), tags, time.monotonic() + self.ttl)
+
+        # Invalidated while it was being computed: serve it once, don't keep it
+        if generation is not None and generation != self.generation(tags):
+            return entry
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, *tags: str):
+        for tag in tags:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+        stale = [key for key, entry in self._entries.items() if entry.tags.intersection(tags)]
+        for key in stale:
+            del self._entries[key]
+        for listener in self.listeners:
+            listener(tags)
+
+    def clear(self):
+        self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+# ---------------------------
+# Serialization
+# ---------------------------
+@lru_cache(maxsize=None)
+def type_adapter(response_model) -> TypeAdapter:
+    # Built once per model; also used by app.responses
+    return TypeAdapter(response_model)
+
+
+def _serialize(data: Any, response_model=None) -> bytes:
+    if response_model is None:
+        return json.dumps(jsonable_encoder(data), separators=(",", ":")).encode()
+
+    adapter = type_adapter(response_model)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [c.strip() for c in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+# ---------------------------
+# Cached JSON Endpoint Helper
+# ---------------------------
+async def cached_json(
+    request: Request,
+    tags: Iterable[str],
+    compute: Callable[[], Awaitable[Any]],
+    response_model=None
+) -> Response:
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+
+    entry = response_cache.get(key)
+    if entry is None:
+        # Read before compute: a write committed meanwhile must not be cached over
+        generation = response_cache.generation(tags)
+        data = await compute()
+        body = _serialize(data, response_model)
+        if getattr(request.state, "replica_read", False):
+            # A lagging replica can return rows from before the last invalidation, which
+            # would then be served to everyone until the TTL ran out
+            entry = CacheEntry(body, _etag(body), frozenset(tags), 0.0)
+        else:
+            entry = response_cache.set(key, body, tags, generation)
+
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
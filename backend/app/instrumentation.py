@@ -0,0 +1,132 @@
+import asyncio
+import contextvars
+import json
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from fastapi import Request
+from sqlalchemy import event
+
+from app.config import settings
+
+logger = logging.getLogger("fasthr.sql")
+
+MAX_LOGGED_SQL = 1000
+MAX_LOGGED_STATEMENTS = 5
+
+# The request's RequestStats are left on the ASGI scope for outer middleware (app.metrics)
+SQL_STATS_SCOPE_KEY = "fasthr.sql_stats"
+
+
+# ---------------------------
+# Per-request SQL Stats
+# ---------------------------
+class RequestStats:
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.by_statement = Counter()
+        self.slow: List[Tuple[float, str]] = []
+
+    def record(self, statement: str, seconds: float):
+        self.statements += 1
+        self.db_seconds += seconds
+        self.by_statement[statement] += 1
+        if seconds * 1000 >= settings.slow_query_ms:
+            self.slow.append((seconds, statement))
+
+    def repeated(self) -> List[Tuple[str, int]]:
+        threshold = settings.repeated_statement_threshold
+        return [(sql, n) for sql, n in self.by_statement.most_common() if n >= threshold]
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("fasthr_request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def detached_task(coro) -> asyncio.Task:
+    # Tasks copy the current context; start from an empty one so long-lived background
+    # work started during a request is not counted towards that request's stats
+    return contextvars.Context().run(asyncio.create_task, coro)
+
+
+# ---------------------------
+# Engine Hooks
+# ---------------------------
+def install_sql_hooks(target_engine):
+    # SQLAlchemy runs the sync events inside the request's context, so the ContextVar is visible
+    sync_engine = target_engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("fasthr_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _finish(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["fasthr_query_start"].pop()
+        stats = _current.get()
+        if stats is not None:
+            stats.record(statement, time.perf_counter() - started)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _failed(exception_context):
+        # after_cursor_execute does not fire for failed statements
+        starts = exception_context.connection.info.get("fasthr_query_start") if exception_context.connection else None
+        if starts:
+            starts.pop()
+
+
+# ---------------------------
+# Middleware
+# ---------------------------
+def _short(sql: str) -> str:
+    sql = " ".join(sql.split())
+    return sql if len(sql) <= MAX_LOGGED_SQL else sql[:MAX_LOGGED_SQL] + "..."
+
+
+async def sql_instrumentation(request: Request, call_next):
+    if not settings.sql_instrumentation:
+        return await call_next(request)
+
+    stats = RequestStats()
+    request.scope[SQL_STATS_SCOPE_KEY] = stats
+    token = _current.set(stats)
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        _current.reset(token)
+    total_ms = (time.perf_counter() - started) * 1000
+    db_ms = stats.db_seconds * 1000
+
+    # Streaming bodies (e.g. /employees/export) are measured up to the first byte
+    response.headers["Server-Timing"] = (
+        f'db;dur={db_ms:.1f};desc="{stats.statements} queries", app;dur={total_ms:.1f}'
+    )
+
+    repeated = stats.repeated()
+    if total_ms >= settings.slow_request_ms or repeated:
+        slowest = sorted(stats.slow, reverse=True)[:MAX_LOGGED_STATEMENTS]
+        logger.warning(json.dumps({
+            "event": "slow_request" if total_ms >= settings.slow_request_ms else "repeated_statements",
+            "method": request.method,
+            "path": request.url.path,
+            "route": getattr(request.scope.get("route"), "path", None),
+            "status": response.status_code,
+            "duration_ms": round(total_ms, 1),
+            "db_ms": round(db_ms, 1),
+            "statements": stats.statements,
+            "repeated": [
+                {"count": n, "sql": _short(sql)} for sql, n in repeated[:MAX_LOGGED_STATEMENTS]
+            ],
+            "slow_queries": [
+                {"ms": round(seconds * 1000, 1), "sql": _short(sql)} for seconds, sql in slowest
+            ],
+        }))
+    return response
@@ -0,0 +1,366 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Type
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal, read_session
+from app.instrumentation import detached_task
+from app.models.job import Job
+
+logger = logging.getLogger("fasthr.jobs")
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+UNFINISHED = (QUEUED, RUNNING)
+
+# Progress is written at most this often; the final state is always written
+PROGRESS_INTERVAL_SECONDS = 0.5
+
+
+class NoParams(BaseModel):
+    pass
+
+
+class JobKind(NamedTuple):
+    handler: Callable[..., Awaitable[Any]]
+    params_model: Type[BaseModel]
+    # Read-only kinds run on a read session (replica when configured)
+    read_only: bool
+    # Internal kinds are submitted by the app itself, never through POST /jobs
+    public: bool
+    # Releases what the params point at (e.g. a spooled upload) for a job that will never run
+    discard: Optional[Callable[[BaseModel], None]]
+
+
+JOB_KINDS: Dict[str, JobKind] = {}
+
+
+def job_kind(
+    name: str,
+    params_model: Type[BaseModel] = NoParams,
+    read_only: bool = False,
+    public: bool = True,
+    discard: Optional[Callable[[BaseModel], None]] = None
+):
+    # Handlers are `async def handler(db, params, job: JobContext) -> JSON-able result`
+    def register(handler):
+        JOB_KINDS[name] = JobKind(handler, params_model, read_only, public, discard)
+        return handler
+    return register
+
+
+def _discard(kind: str, params):
+    spec = JOB_KINDS.get(kind)
+    if spec is None or spec.discard is None:
+        return
+    try:
+        if not isinstance(params, BaseModel):
+            params = spec.params_model.model_validate(params or {})
+        spec.discard(params)
+    except Exception:
+        logger.exception("job kind %s: could not discard params", kind)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+async def _update_job(job_id: str, status_was: Optional[str] = None, **values):
+    # Short transaction of its own, so progress is visible while the job's session is busy
+    condition = Job.id == job_id
+    if status_was is not None:
+        # Final states never overwrite one another (e.g. a job already failed by a sweep)
+        condition = condition & (Job.status == status_was)
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(Job).where(condition).values(**values))
+        await db.commit()
+
+
+# ---------------------------
+# Progress Reporting (passed to handlers)
+# ---------------------------
+class JobContext:
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        # Latest reported progress; written with the final status even if throttled here
+        self.latest: Dict[str, Any] = {}
+        self._last_write = 0.0
+
+    async def progress(self, done: int, total: Optional[int] = None, message: Optional[str] = None):
+        self.latest = {"progress_done": done, "progress_total": total}
+        if message is not None:
+            self.latest["message"] = message[:255]
+
+        now = time.monotonic()
+        if now - self._last_write >= PROGRESS_INTERVAL_SECONDS:
+            self._last_write = now
+            await _update_job(self.job_id, **self.latest)
+
+
+# ---------------------------
+# Create / Fetch Jobs
+# ---------------------------
+def validate_params(kind: str, params: Optional[dict], internal: bool = False) -> BaseModel:
+    spec = JOB_KINDS.get(kind)
+    if spec is None or not (spec.public or internal):
+        raise HTTPException(400, f"Unknown job kind '{kind}'")
+    try:
+        return spec.params_model.model_validate(params or {})
+    except ValidationError as exc:
+        raise HTTPException(422, jsonable_encoder(exc.errors(include_url=False)))
+
+
+async def create_job(db: AsyncSession, kind: str, params: Optional[dict] = None, internal: bool = False) -> Job:
+    validated = validate_params(kind, params, internal)
+    job_runner.check_capacity()
+
+    job = Job(
+        id=uuid.uuid4().hex,
+        kind=kind,
+        status=QUEUED,
+        params=validated.model_dump(mode="json"),
+        progress_done=0,
+        created_at=_now(),
+        worker_id=job_runner.worker_id,
+        heartbeat_at=_now()
+    )
+    db.add(job)
+    await db.commit()
+
+    try:
+        job_runner.submit(job.id, kind, validated)
+    except HTTPException as exc:
+        # Filled up since check_capacity(): the row exists, so record why it never ran
+        job.status, job.error, job.finished_at = FAILED, str(exc.detail), _now()
+        await db.commit()
+        _discard(kind, validated)
+        raise
+    return job
+
+
+async def get_job(db: AsyncSession, job_id: str) -> Job:
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(404, "Job not found")
+    return job
+
+
+# ---------------------------
+# Jobs Left Behind by a Stopped Process (startup + every heartbeat)
+# ---------------------------
+def _stale(cutoff: datetime):
+    # Rows without a heartbeat fall back to when they started or were queued
+    return func.coalesce(Job.heartbeat_at, Job.started_at, Job.created_at) < cutoff
+
+
+async def recover_jobs(db: AsyncSession, runner: "JobRunner") -> Tuple[int, int]:
+    # A stale heartbeat means the runner holding the job is gone. A running job may have
+    # done part of its work, so it fails; a queued one never started and moves to `runner`,
+    # as many as its queue has room for. Returns (failed, requeued).
+    cutoff = _now() - timedelta(seconds=settings.job_stale_seconds)
+    result = await db.execute(
+        update(Job)
+        .where(Job.status == RUNNING, _stale(cutoff))
+        .values(status=FAILED, error="Abandoned: the process running it stopped", finished_at=_now())
+        .returning(Job.kind, Job.params)
+        .execution_options(synchronize_session=False)
+    )
+    abandoned = result.all()
+
+    claimed = []
+    slots = runner.free_slots()
+    if slots:
+        oldest = (
+            select(Job.id)
+            .where(Job.status == QUEUED, _stale(cutoff))
+            .order_by(Job.created_at)
+            .limit(slots)
+        )
+        # Conditions repeated so two runners sweeping at once cannot both claim a row
+        result = await db.execute(
+            update(Job)
+            .where(Job.id.in_(oldest.scalar_subquery()), Job.status == QUEUED, _stale(cutoff))
+            .values(worker_id=runner.worker_id, heartbeat_at=_now())
+            .returning(Job.id, Job.kind, Job.params)
+            .execution_options(synchronize_session=False)
+        )
+        claimed = result.all()
+    await db.commit()
+
+    for kind, params in abandoned:
+        _discard(kind, params)
+
+    requeued = 0
+    for job_id, kind, params in claimed:
+        try:
+            validated = validate_params(kind, params, internal=True)
+        except HTTPException as exc:
+            await _update_job(job_id, QUEUED, status=FAILED, error=str(exc.detail), finished_at=_now())
+            continue
+        try:
+            runner.submit(job_id, kind, validated)
+            requeued += 1
+        except HTTPException:
+            # Filled up meanwhile: the claim goes stale and the next sweep retries it
+            pass
+
+    if abandoned or requeued:
+        logger.warning("jobs of stopped processes: %d failed, %d requeued", len(abandoned), requeued)
+    return len(abandoned), requeued
+
+
+async def unfinished_job_params(db: AsyncSession, kind: str) -> List[dict]:
+    result = await db.execute(select(Job.params).where(Job.kind == kind, Job.status.in_(UNFINISHED)))
+    return [params or {} for params in result.scalars()]
+
+
+# ---------------------------
+# Bounded Worker Pool (in-process)
+# ---------------------------
+class JobRunner:
+    def __init__(self, workers: int, queue_size: int, heartbeat_seconds: float = 0.0):
+        self.workers = workers
+        self.queue_size = queue_size
+        # 0 = no heartbeat / recovery loop (e.g. tests driving recover_jobs themselves)
+        self.heartbeat_seconds = heartbeat_seconds
+        self.worker_id = f"{socket.gethostname()[:40]}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        # Queued in this process or running in it: the jobs it keeps a heartbeat on
+        self._held: Set[str] = set()
+
+    def start(self):
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [detached_task(self._worker()) for _ in range(self.workers)]
+        if self.heartbeat_seconds > 0:
+            self._tasks.append(detached_task(self._maintain()))
+
+    def free_slots(self) -> int:
+        if self._queue is None:
+            return 0
+        return self.queue_size - self._queue.qsize()
+
+    def check_capacity(self):
+        # Checked before the job row is written; create_job fails the row if submit() still loses the race
+        if self._queue is not None and self._queue.full():
+            raise HTTPException(503, "Job queue is full, retry later")
+
+    def submit(self, job_id: str, kind: str, params: BaseModel):
+        # Started lazily too, for apps run without startup events
+        self.start()
+        try:
+            self._queue.put_nowait((job_id, kind, params))
+        except asyncio.QueueFull:
+            raise HTTPException(503, "Job queue is full, retry later")
+        self._held.add(job_id)
+
+    async def stop(self):
+        # Jobs are not handed over on a clean shutdown: anything unfinished here is marked failed
+        unfinished = set(self._held)
+        while self._queue is not None and not self._queue.empty():
+            job_id, kind, params = self._queue.get_nowait()
+            # Running jobs clean up after themselves as they are cancelled; queued ones never start
+            _discard(kind, params)
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks, self._queue = [], None
+        self._held.clear()
+
+        if unfinished:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(Job)
+                    .where(Job.id.in_(unfinished), Job.status.in_(UNFINISHED))
+                    .values(status=FAILED, error="Interrupted by shutdown", finished_at=_now())
+                )
+                await db.commit()
+
+    async def heartbeat(self):
+        held = list(self._held)
+        if not held:
+            return
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(Job)
+                .where(Job.id.in_(held), Job.worker_id == self.worker_id, Job.status.in_(UNFINISHED))
+                .values(heartbeat_at=_now())
+            )
+            await db.commit()
+
+    async def _maintain(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                await self.heartbeat()
+                async with AsyncSessionLocal() as db:
+                    await recover_jobs(db, self)
+            except Exception:
+                logger.exception("job heartbeat / recovery failed")
+
+    async def _worker(self):
+        while True:
+            job_id, kind, params = await self._queue.get()
+            try:
+                await self._run(job_id, kind, params)
+            except Exception:
+                logger.exception("job %s (%s): could not record outcome", job_id, kind)
+            finally:
+                self._held.discard(job_id)
+                self._queue.task_done()
+
+    async def _run(self, job_id: str, kind: str, params: BaseModel):
+        spec = JOB_KINDS[kind]
+        async with AsyncSessionLocal() as db:
+            started = await db.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == QUEUED, Job.worker_id == self.worker_id)
+                .values(status=RUNNING, started_at=_now(), heartbeat_at=_now())
+            )
+            await db.commit()
+        if not started.rowcount:
+            # Claimed by another runner after this one missed its heartbeats; it runs it now
+            return
+
+        job = JobContext(job_id)
+        try:
+            session = read_session() if spec.read_only else AsyncSessionLocal()
+            async with session as db:
+                result = await asyncio.wait_for(
+                    spec.handler(db, params, job),
+                    settings.job_timeout_seconds
+                )
+            result = jsonable_encoder(result)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            if isinstance(exc, HTTPException):
+                error = str(exc.detail)
+            elif isinstance(exc, asyncio.TimeoutError):
+                error = f"Timed out after {settings.job_timeout_seconds:g}s"
+            else:
+                logger.exception("job %s (%s) failed", job_id, kind)
+                error = f"{type(exc).__name__}: {exc}"
+            await _update_job(job_id, RUNNING, status=FAILED, error=error, finished_at=_now(), **job.latest)
+            return
+
+        await _update_job(job_id, RUNNING, status=SUCCEEDED, result=result, finished_at=_now(), **job.latest)
+
+
+job_runner = JobRunner(settings.job_workers, settings.job_queue_size, settings.job_heartbeat_seconds)
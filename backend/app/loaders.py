@@ -0,0 +1,124 @@
+import asyncio
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+
+from sqlalchemy import event, select, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.employee import Employee
+from app.models.department import Department
+from app.models.role import Role
+
+LOADERS_KEY = "loaders"
+
+
+# ---------------------------
+# Batching Loader (one model, one session)
+# ---------------------------
+class BatchLoader:
+    def __init__(self, db: AsyncSession, model):
+        self.db = db
+        self.model = model
+        self._results: Dict[Hashable, asyncio.Future] = {}
+        self._pending: List[Hashable] = []
+        # The event loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    def load(self, key) -> "asyncio.Future":
+        # Loads made in the same event-loop tick share one query; results are memoized
+        future = self._results.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._results[key] = future
+        self._pending.append(key)
+        if len(self._pending) == 1:
+            loop.call_soon(self._start_dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable) -> list:
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+
+    def clear(self, key=None):
+        if key is None:
+            # Keep futures still waiting on a query; only drop settled results
+            self._results = {k: f for k, f in self._results.items() if not f.done()}
+        elif key in self._results and self._results[key].done():
+            del self._results[key]
+
+    def _match(self, keys: list):
+        column = self.model.id
+        if self.db.bind.dialect.name == "postgresql":
+            # One array parameter: the same prepared statement for any batch size
+            return column == any_(literal(keys, ARRAY(column.type)))
+        return column.in_(keys)
+
+    def _start_dispatch(self):
+        keys, self._pending = self._pending, []
+        batch = [(key, self._results[key]) for key in keys]
+        task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(lambda t: self._dispatched(t, batch))
+
+    def _fail(self, batch: list, settle):
+        for key, future in batch:
+            # Failures are not memoized; the next load retries
+            if self._results.get(key) is future:
+                del self._results[key]
+            if not future.done():
+                settle(future)
+
+    def _dispatched(self, task: asyncio.Task, batch: list):
+        self._tasks.discard(task)
+        if task.cancelled():
+            # Cancelled before or during the query (e.g. the request went away):
+            # cancel the waiting loads instead of leaving them pending forever
+            self._fail(batch, lambda future: future.cancel())
+
+    async def _dispatch(self, batch: list):
+        keys = [key for key, _ in batch]
+        try:
+            result = await self.db.execute(select(self.model).where(self._match(keys)))
+            found = {row.id: row for row in result.scalars().all()}
+        except Exception as exc:
+            self._fail(batch, lambda future: future.set_exception(exc))
+            return
+
+        for key, future in batch:
+            if not future.done():
+                future.set_result(found.get(key))
+
+
+# ---------------------------
+# Per-request Loaders (stored on the session)
+# ---------------------------
+class Loaders:
+    def __init__(self, db: AsyncSession):
+        self.employees = BatchLoader(db, Employee)
+        self.departments = BatchLoader(db, Department)
+        self.roles = BatchLoader(db, Role)
+
+    def clear(self):
+        self.employees.clear()
+        self.departments.clear()
+        self.roles.clear()
+
+
+def loaders_for(db: AsyncSession) -> Loaders:
+    # Sessions are opened per request (get_db / get_read_db), so this is request-scoped
+    loaders = db.info.get(LOADERS_KEY)
+    if loaders is None:
+        loaders = db.info[LOADERS_KEY] = Loaders(db)
+    return loaders
+
+
+# Writes may change or remove memoized rows
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_loaders(session: Session):
+    loaders: Optional[Loaders] = session.info.get(LOADERS_KEY)
+    if loaders is not None:
+        loaders.clear()
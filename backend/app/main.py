@@ -1,17 +1,39 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 
 # Routers
 from app.routers import employee as employee_router
 from app.routers import role as role_router
 from app.routers import department as department_router
+from app.routers import structure as structure_router
+from app.routers import dashboard as dashboard_router
+from app.routers import analytics as analytics_router
+from app.routers import system as system_router
+from app.routers import metrics as metrics_router
+from app.routers import jobs as jobs_router
 
 # Database
-from app.database import engine, Base
+from app.config import settings
+from app.database import engine, read_engine, AsyncSessionLocal, READ_YOUR_WRITES_COOKIE
+from app.instrumentation import install_sql_hooks, sql_instrumentation
+from app.metrics import MetricsMiddleware
+from app.migrations import maintenance_lock, upgrade_database
+from app.jobs import job_runner, recover_jobs
+from app.services.rollup_service import ensure_rollups
+from app.services.skill_service import ensure_skills
+from app.services.closure_service import ensure_closure
+from app.services.job_service import sweep_import_spool
 
 # Import all models for SQLAlchemy
 import app.models.employee
 import app.models.role
 import app.models.department
+import app.models.analytics_rollup
+import app.models.employee_skill
+import app.models.employee_closure
+import app.models.job
+
+# Register background job kinds
+import app.services.job_service
 
 app = FastAPI(title="FastHR")
 
@@ -19,9 +41,64 @@ app = FastAPI(title="FastHR")
 app.include_router(employee_router.router)
 app.include_router(role_router.router)
 app.include_router(department_router.router)
+app.include_router(structure_router.router)
+app.include_router(dashboard_router.router)
+app.include_router(analytics_router.router)
+app.include_router(system_router.router)
+app.include_router(metrics_router.router)
+app.include_router(jobs_router.router)
+
+# Statement count + DB time per request (Server-Timing, slow request log)
+install_sql_hooks(engine)
+if read_engine is not None:
+    install_sql_hooks(read_engine)
+app.middleware("http")(sql_instrumentation)
+
+# Successful writes pin the client to the primary for a short window
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    response = await call_next(request)
+    if (
+        read_engine is not None
+        and request.method not in ("GET", "HEAD", "OPTIONS")
+        and response.status_code < 400
+    ):
+        response.set_cookie(
+            READ_YOUR_WRITES_COOKIE, "1",
+            max_age=settings.read_your_writes_seconds,
+            httponly=True,
+            samesite="lax"
+        )
+    return response
+
+
+# Outermost: latency, status and size for every request (/metrics)
+app.add_middleware(MetricsMiddleware)
+
 
-# Create all tables on startup
+# Bring the schema up to date on startup (see migrations/versions); one process at a time
 @app.on_event("startup")
 async def create_tables():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    async with maintenance_lock():
+        await upgrade_database()
+
+        async with AsyncSessionLocal() as session:
+            await ensure_rollups(session)
+            await ensure_skills(session)
+            await ensure_closure(session)
+
+
+# Background job workers live for the lifetime of the process
+@app.on_event("startup")
+async def start_job_runner():
+    job_runner.start()
+    # Take over from processes that stopped without shutting down; the runner repeats the
+    # job recovery every heartbeat for as long as it runs
+    async with AsyncSessionLocal() as session:
+        await recover_jobs(session, job_runner)
+        await sweep_import_spool(session)
+
+
+@app.on_event("shutdown")
+async def stop_job_runner():
+    await job_runner.stop()
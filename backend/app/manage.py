@@ -0,0 +1,71 @@
+import argparse
+import asyncio
+
+from app.database import AsyncSessionLocal, engine
+from app.migrations import maintenance_lock, upgrade_database
+
+# Import all models for SQLAlchemy
+import app.models  # noqa: F401
+from app.services.rollup_service import rebuild_rollups
+from app.services.skill_service import backfill_skills
+from app.services.closure_service import rebuild_closure
+
+
+# ---------------------------
+# Commands
+# ---------------------------
+async def migrate_command():
+    await upgrade_database()
+    print("Database schema is up to date.")
+
+
+async def rebuild_rollups_command():
+    await upgrade_database()
+
+    async with AsyncSessionLocal() as session:
+        await rebuild_rollups(session)
+    print("Analytics rollups rebuilt.")
+
+
+async def backfill_skills_command():
+    await upgrade_database()
+
+    async with AsyncSessionLocal() as session:
+        await backfill_skills(session)
+    print("employee_skills rebuilt from tech_stack.")
+
+
+async def rebuild_closure_command():
+    await upgrade_database()
+
+    async with AsyncSessionLocal() as session:
+        await rebuild_closure(session)
+    print("employee_closure rebuilt from manager_id.")
+
+
+COMMANDS = {
+    "migrate": migrate_command,
+    "rebuild-rollups": rebuild_rollups_command,
+    "backfill-skills": backfill_skills_command,
+    "rebuild-closure": rebuild_closure_command,
+}
+
+
+# Usage (from backend/): python -m app.manage <command>
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.manage", description="FastHR maintenance commands")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+
+    async def run():
+        try:
+            async with maintenance_lock():
+                await COMMANDS[args.command]()
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
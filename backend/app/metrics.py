@@ -0,0 +1,223 @@
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from app.cache import response_cache
+from app.config import settings
+from app.database import engine, read_engine, pool_metrics, InstrumentedAsyncPool
+from app.instrumentation import SQL_STATS_SCOPE_KEY
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+POOL_WAIT_BUCKETS = (0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+# Requests that matched no route share one label, so bad URLs cannot blow up cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{n}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for n, v in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+# ---------------------------
+# Metric Types (Prometheus text format 0.0.4)
+# ---------------------------
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name, self.help, self.label_names = name, help_text, tuple(labels)
+        self.values: Dict[Tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1.0):
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self.values.items():
+            yield f"{self.name}{_labels(self.label_names, labels)} {value}"
+
+
+class CollectedCounter(Counter):
+    # Monotonic total counted elsewhere (pool, cache) and copied in by a collector at scrape time
+    def set(self, *labels, value: float):
+        self.values[labels] = value
+
+
+class Gauge(CollectedCounter):
+    kind = "gauge"
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name, self.help, self.label_names = name, help_text, tuple(labels)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self.values: Dict[Tuple, list] = {}
+
+    def observe(self, value: float, *labels):
+        series = self.values.get(labels)
+        if series is None:
+            series = self.values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def samples(self) -> Iterable[str]:
+        names = self.label_names + ("le",)
+        for labels, (counts, total) in self.values.items():
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                yield f"{self.name}_bucket{_labels(names, labels + (le,))} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.label_names, labels)} {total}"
+            yield f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}"
+
+
+# ---------------------------
+# Registry
+# ---------------------------
+class Registry:
+    def __init__(self):
+        self.metrics: List = []
+        self.collectors: List[Callable[[], None]] = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        # Collectors refresh point-in-time values (pool, cache) at scrape time
+        for collect in self.collectors:
+            collect()
+
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+REQUESTS = registry.register(Counter(
+    "fasthr_http_requests_total", "HTTP requests by route and status", ("method", "route", "status")
+))
+LATENCY = registry.register(Histogram(
+    "fasthr_http_request_duration_seconds", "Time to response start by route", ("method", "route")
+))
+IN_FLIGHT = registry.register(Gauge(
+    "fasthr_http_requests_in_flight", "Requests currently being handled"
+))
+RESPONSE_SIZE = registry.register(Histogram(
+    "fasthr_http_response_size_bytes", "Response body size by route", ("method", "route"), SIZE_BUCKETS
+))
+STATEMENTS = registry.register(Histogram(
+    "fasthr_db_statements_per_request", "SQL statements per request by route", ("method", "route"), STATEMENT_BUCKETS
+))
+POOL_WAIT = registry.register(Histogram(
+    "fasthr_db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection", ("engine",), POOL_WAIT_BUCKETS
+))
+POOL_CONNECTIONS = registry.register(Gauge(
+    "fasthr_db_pool_connections", "Pooled connections by state", ("engine", "state")
+))
+POOL_TIMEOUTS = registry.register(CollectedCounter(
+    "fasthr_db_pool_checkout_timeouts_total", "Checkouts that timed out waiting for a connection", ("engine",)
+))
+CACHE_REQUESTS = registry.register(CollectedCounter(
+    "fasthr_response_cache_requests_total", "Response cache lookups by result", ("result",)
+))
+CACHE_HIT_RATIO = registry.register(Gauge(
+    "fasthr_response_cache_hit_ratio", "Response cache hits / lookups since start"
+))
+CACHE_ENTRIES = registry.register(Gauge(
+    "fasthr_response_cache_entries", "Entries currently in the response cache"
+))
+
+IN_FLIGHT.set(value=0)
+
+
+def _engines():
+    yield "primary", engine
+    if read_engine is not None:
+        yield "replica", read_engine
+
+
+def _collect_pools():
+    for name, target in _engines():
+        pool = pool_metrics(target)
+        if "checked_out" not in pool:
+            continue
+        POOL_CONNECTIONS.set(name, "checked_out", value=pool["checked_out"])
+        POOL_CONNECTIONS.set(name, "checked_in", value=pool["checked_in"])
+        POOL_CONNECTIONS.set(name, "overflow", value=max(pool["overflow"], 0))
+        POOL_TIMEOUTS.set(name, value=pool.get("timeouts", 0))
+
+
+def _collect_cache():
+    hits, misses = response_cache.hits, response_cache.misses
+    CACHE_REQUESTS.set("hit", value=hits)
+    CACHE_REQUESTS.set("miss", value=misses)
+    CACHE_HIT_RATIO.set(value=hits / (hits + misses) if hits + misses else 0.0)
+    CACHE_ENTRIES.set(value=len(response_cache._entries))
+
+
+registry.collectors += [_collect_pools, _collect_cache]
+
+# Pool wait histogram is fed by InstrumentedAsyncPool on every checkout
+for _name, _target in _engines():
+    if isinstance(_target.pool, InstrumentedAsyncPool):
+        _target.pool.wait_observer = lambda waited, name=_name: POOL_WAIT.observe(waited, name)
+
+
+# ---------------------------
+# ASGI Middleware (no per-request allocations beyond the send wrapper)
+# ---------------------------
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.metrics_enabled:
+            return await self.app(scope, receive, send)
+
+        started = time.perf_counter()
+        state = {"status": 500, "size": 0, "latency": None}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                state["latency"] = time.perf_counter() - started
+            elif message["type"] == "http.response.body":
+                state["size"] += len(message.get("body", b""))
+            await send(message)
+
+        IN_FLIGHT.inc(amount=1)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            IN_FLIGHT.inc(amount=-1)
+            route = scope.get("route")
+            route = getattr(route, "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+            latency = state["latency"] if state["latency"] is not None else time.perf_counter() - started
+
+            REQUESTS.inc(method, route, str(state["status"]))
+            LATENCY.observe(latency, method, route)
+            RESPONSE_SIZE.observe(state["size"], method, route)
+
+            # Left on the scope by app.instrumentation.sql_instrumentation
+            sql_stats = scope.get(SQL_STATS_SCOPE_KEY)
+            if sql_stats is not None:
+                STATEMENTS.observe(sql_stats.statements, method, route)
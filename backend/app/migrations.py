@@ -0,0 +1,58 @@
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+
+from app.database import engine
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+# pg_advisory_lock key shared by every process that migrates or rebuilds derived tables
+MAINTENANCE_LOCK_KEY = 7_251_390_114
+MAINTENANCE_LOCK_POLL_SECONDS = 0.5
+
+
+def alembic_config(connection=None) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "migrations"))
+    # Leave the application's logging setup alone
+    config.attributes["configure_logger"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+# ---------------------------
+# Upgrade to Latest Revision
+# ---------------------------
+async def upgrade_database(revision: str = "head"):
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: command.upgrade(alembic_config(sync_conn), revision)
+        )
+
+
+# ---------------------------
+# One Migration / Rebuild at a Time (Postgres)
+# ---------------------------
+@asynccontextmanager
+async def maintenance_lock():
+    # Replicas starting together would otherwise each run the migrations and the
+    # empty-table backfills at once. Polling pg_try_advisory_lock keeps the wait clear
+    # of statement_timeout; the lock is released with this connection at the latest.
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        key = {"key": MAINTENANCE_LOCK_KEY}
+        while not (await conn.execute(text("SELECT pg_try_advisory_lock(:key)"), key)).scalar():
+            await asyncio.sleep(MAINTENANCE_LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            await conn.execute(text("SELECT pg_advisory_unlock(:key)"), key)
@@ -1,5 +1,9 @@
 from .employee import Employee
 from .role import Role
 from .department import Department
+from .analytics_rollup import AnalyticsRollup
+from .employee_skill import EmployeeSkill
+from .employee_closure import EmployeeClosure
+from .job import Job
 
-__all__ = ["Employee", "Role", "Department"]
+__all__ = ["Employee", "Role", "Department", "AnalyticsRollup", "EmployeeSkill", "EmployeeClosure", "Job"]
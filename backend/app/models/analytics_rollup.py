@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Index, Integer, String, UniqueConstraint
+from app.database import Base
+
+
+class AnalyticsRollup(Base):
+    __tablename__ = "analytics_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Grouping the counter belongs to, e.g. "department" or "joining_year"
+    dimension = Column(String(32), nullable=False)
+
+    # Group key inside the dimension (department id, role id, year, manager id); 0 = unassigned
+    bucket = Column(Integer, nullable=False)
+
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("dimension", "bucket", name="uq_analytics_rollups_dimension_bucket"),
+        # Largest counters first (manager span listings)
+        Index("ix_analytics_rollups_dimension_count", "dimension", "count", "bucket"),
+    )
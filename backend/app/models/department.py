@@ -14,5 +14,6 @@ class Department(Base):
     employees = relationship(
         "Employee",
         back_populates="department",
-        lazy="selectin"
+        lazy="raise",
+        passive_deletes=True
     )
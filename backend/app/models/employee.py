@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index, DDL, event
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -9,40 +9,63 @@ class Employee(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
 
-    # Tech & work info
+    # Tech & work info (tech_stack is also split into employee_skills)
     tech_stack = Column(String, nullable=True)
-    year_of_joining = Column(Integer, nullable=True)
+    year_of_joining = Column(Integer, nullable=True, index=True)
     experience = Column(Integer, nullable=True)
-    resignation_date = Column(Date, nullable=True)
+    resignation_date = Column(Date, nullable=True, index=True)
+
+    # Relationships never load implicitly (lazy="raise"); services opt in
+    # with selectinload()/joinedload() so list queries stay a single SELECT
 
     # ---------------------------
     # Department Relationship
     # ---------------------------
-    department_id = Column(Integer, ForeignKey("departments.id", ondelete="SET NULL"))
-    department = relationship("Department", back_populates="employees", lazy="selectin")
+    department_id = Column(Integer, ForeignKey("departments.id", ondelete="SET NULL"), index=True)
+    department = relationship("Department", back_populates="employees", lazy="raise")
 
     # ---------------------------
     # Role Relationship
     # ---------------------------
-    role_id = Column(Integer, ForeignKey("roles.id", ondelete="SET NULL"))
-    role_details = relationship("Role", back_populates="employees", lazy="selectin")
+    role_id = Column(Integer, ForeignKey("roles.id", ondelete="SET NULL"), index=True)
+    role_details = relationship("Role", back_populates="employees", lazy="raise")
 
     # ---------------------------
     # Manager / Hierarchy Setup
     # ---------------------------
-    manager_id = Column(Integer, ForeignKey("employees.id", ondelete="SET NULL"))
+    manager_id = Column(Integer, ForeignKey("employees.id", ondelete="SET NULL"), index=True)
 
     # Manager of this employee
     manager = relationship(
         "Employee",
         remote_side=[id],
         back_populates="subordinates",
-        lazy="selectin"
+        lazy="raise"
     )
 
     # Subordinates
     subordinates = relationship(
         "Employee",
         back_populates="manager",
-        lazy="selectin"
+        lazy="raise",
+        passive_deletes=True
     )
+
+    # ---------------------------
+    # Extra Indexes (keep in sync with migrations/versions)
+    # ---------------------------
+    __table_args__ = (
+        # Name search (pg_trgm GIN)
+        Index(
+            "ix_employees_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}
+        ),
+    )
+
+
+# Trigram operator classes need the extension before the indexes are created
+event.listen(
+    Employee.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, ForeignKey, Index
+from app.database import Base
+
+
+class EmployeeClosure(Base):
+    __tablename__ = "employee_closure"
+
+    # One row per (manager above, employee below) pair, including (x, x) at depth 0
+    ancestor_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True)
+    depth = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        # Descendants of X, nearest levels first
+        Index("ix_employee_closure_ancestor_depth", "ancestor_id", "depth", "descendant_id"),
+        # Chain of command above X
+        Index("ix_employee_closure_descendant_depth", "descendant_id", "depth"),
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from app.database import Base
+
+
+class EmployeeSkill(Base):
+    __tablename__ = "employee_skills"
+
+    # One row per (employee, skill); skills are stored lowercased
+    employee_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String(100), primary_key=True)
+
+    # Inverted index: skill -> employees (pattern ops so prefix LIKE can use it too)
+    __table_args__ = (
+        Index(
+            "ix_employee_skills_skill_employee", "skill", "employee_id",
+            postgresql_ops={"skill": "text_pattern_ops"}
+        ),
+    )
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
+from app.database import Base
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    # uuid4 hex: ids are handed to clients, so they should not be guessable
+    id = Column(String(32), primary_key=True)
+    kind = Column(String(64), nullable=False)
+
+    # queued -> running -> succeeded | failed
+    status = Column(String(16), nullable=False)
+    params = Column(JSON, nullable=True)
+
+    # Units are up to the job kind (rows, levels, steps); total is NULL when unknown
+    progress_done = Column(Integer, nullable=False, default=0)
+    progress_total = Column(Integer, nullable=True)
+    message = Column(String(255), nullable=True)
+
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Runner (one per process) holding the job in its queue or running it, and when it last
+    # said so; a stale heartbeat means that process is gone
+    worker_id = Column(String(64), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Unfinished jobs, oldest first (shutdown cleanup, listings)
+        Index("ix_jobs_status_created_at", "status", "created_at"),
+    )
@@ -15,5 +15,6 @@ class Role(Base):
     employees = relationship(
         "Employee",
         back_populates="role_details",
-        lazy="selectin"
+        lazy="raise",
+        passive_deletes=True
     )
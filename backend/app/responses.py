@@ -0,0 +1,31 @@
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic_core import to_json
+
+from app.cache import type_adapter
+
+
+# ---------------------------
+# Fast JSON Responses
+# ---------------------------
+def json_response(data: Any, status_code: int = 200, headers: Optional[dict] = None) -> Response:
+    # For plain dicts/lists built from column rows: serialized in one pass by pydantic-core,
+    # skipping response_model validation and jsonable_encoder. Keep response_model on the
+    # route for the OpenAPI schema; FastAPI returns a Response instance as-is.
+    return Response(
+        content=to_json(data),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers
+    )
+
+
+def model_response(data: Any, response_model, status_code: int = 200) -> Response:
+    # For response models only known at request time (e.g. sparse fieldsets)
+    adapter = type_adapter(response_model)
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(data)),
+        status_code=status_code,
+        media_type="application/json"
+    )
@@ -1,9 +1,24 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-
-from app.database import get_db
-from app.models.employee import Employee
+from typing import List, Optional
+
+from app.database import get_read_db
+from app.cache import cached_json, EMPLOYEES
+from app.schemas.employee import SkillSearchPage
+from app.services.analytics_service import (
+    get_headcount_summary,
+    get_experience_histogram,
+    get_resignation_trend,
+    list_manager_spans,
+    manager_level
+)
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.services.skill_service import (
+    normalize_skill_query,
+    search_employees_by_skills,
+    get_skill_headcounts,
+    list_top_skills
+)
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -12,111 +27,97 @@ router = APIRouter(prefix="/analytics", tags=["analytics"])
 # 1. Attrition Stats
 # ---------------------------
 @router.get("/attrition")
-async def attrition_stats(db: AsyncSession = Depends(get_db)):
-
-    total = await db.execute(select(func.count()).select_from(Employee))
-    total = total.scalar()
-
-    resigned = await db.execute(
-        select(func.count()).select_from(Employee).where(Employee.resignation_date.isnot(None))
-    )
-    resigned = resigned.scalar()
-
-    active = total - resigned
-
-    percent = (resigned / total * 100) if total > 0 else 0
+async def attrition_stats(request: Request, db: AsyncSession = Depends(get_read_db)):
+    async def build():
+        summary = await get_headcount_summary(db)
+        return {
+            "total_employees": summary["total_employees"],
+            "active_employees": summary["active_employees"],
+            "resigned_employees": summary["resigned_employees"],
+            "attrition_percentage": summary["attrition_percentage"]
+        }
 
-    return {
-        "total_employees": total,
-        "active_employees": active,
-        "resigned_employees": resigned,
-        "attrition_percentage": round(percent, 2)
-    }
+    return await cached_json(request, [EMPLOYEES], build)
 
 
 # ---------------------------
 # 2. Year-wise Resignation Trend
 # ---------------------------
 @router.get("/resignation-trend")
-async def resignation_trend(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(func.extract('year', Employee.resignation_date).label("year"),
-               func.count().label("count"))
-        .where(Employee.resignation_date.isnot(None))
-        .group_by("year")
-        .order_by("year")
-    )
+async def resignation_trend(request: Request, db: AsyncSession = Depends(get_read_db)):
+    async def build():
+        rows = await get_resignation_trend(db)
+        return [{"year": year, "count": count} for year, count in rows]
 
-    return [{"year": int(row.year), "count": row.count} for row in result]
+    return await cached_json(request, [EMPLOYEES], build)
 
 
 # ---------------------------
 # 3. Search Employees by Skill
 # ---------------------------
-@router.get("/search/skills")
-async def search_employees(skill: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Employee).where(Employee.tech_stack.ilike(f"%{skill}%"))
-    )
-    return result.scalars().all()
+@router.get("/search/skills", response_model=SkillSearchPage)
+async def search_employees(
+    skill: List[str] = Query(..., description="Skills to match; repeat the param or comma-separate"),
+    mode: str = Query("any", pattern="^(any|all)$", description="any = OR, all = AND"),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
+):
+    skills = normalize_skill_query(skill)
+    items, next_cursor = await search_employees_by_skills(db, skills, mode == "all", cursor, limit)
+    skill_counts = await get_skill_headcounts(db, skills)
+    return {"items": items, "next_cursor": next_cursor, "skill_counts": skill_counts}
+
+
+# ---------------------------
+# 3b. Skill Headcounts (typeahead)
+# ---------------------------
+@router.get("/skills")
+async def top_skills(
+    prefix: Optional[str] = Query(None, description="Only skills starting with this text"),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
+):
+    rows = await list_top_skills(db, prefix, limit)
+    return [{"skill": skill, "count": count} for skill, count in rows]
 
 
 # ---------------------------
 # 4. Experience Distribution Buckets
 # ---------------------------
 @router.get("/experience-buckets")
-async def experience_buckets(db: AsyncSession = Depends(get_db)):
-    buckets = {
-        "0-2 years": 0,
-        "3-5 years": 0,
-        "6-10 years": 0,
-        "10+ years": 0
-    }
-
-    result = await db.execute(select(Employee.experience))
-    all_exp = result.scalars().all()
-
-    for exp in all_exp:
-        if exp is None:
-            continue
-        if exp <= 2:
-            buckets["0-2 years"] += 1
-        elif exp <= 5:
-            buckets["3-5 years"] += 1
-        elif exp <= 10:
-            buckets["6-10 years"] += 1
-        else:
-            buckets["10+ years"] += 1
-
-    return buckets
+async def experience_buckets(request: Request, db: AsyncSession = Depends(get_read_db)):
+    async def build():
+        histogram = await get_experience_histogram(db)
+        return {f"{label} years": count for label, count in histogram.items()}
+
+    return await cached_json(request, [EMPLOYEES], build)
 
 
 # ---------------------------
 # 5. Manager → Team Strength Level
 # ---------------------------
 @router.get("/manager-level")
-async def manager_levels(db: AsyncSession = Depends(get_db)):
-
-    result = await db.execute(
-        select(Employee.id, Employee.name, func.count(Employee.id))
-        .join(Employee, Employee.manager_id == Employee.id, isouter=True)
-        .group_by(Employee.id)
-    )
-
-    levels = []
-    for manager_id, name, count in result:
-        if count <= 3:
-            level = "L1 Manager"
-        elif count <= 8:
-            level = "L2 Manager"
-        else:
-            level = "L3 Manager"
-
-        levels.append({
-            "manager_id": manager_id,
-            "name": name,
-            "team_size": count,
-            "manager_level": level
-        })
-
-    return levels
+async def manager_levels(
+    request: Request,
+    sort: str = Query("total", pattern="^(direct|total)$", description="direct | total reports"),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
+):
+    # Managers only, largest teams first; level is based on direct reports
+    async def build():
+        rows, next_cursor = await list_manager_spans(db, sort, cursor, limit)
+        items = [
+            {
+                "manager_id": row.id,
+                "name": row.name,
+                "team_size": row.direct_reports,
+                "total_team_size": row.total_reports,
+                "manager_level": manager_level(row.direct_reports)
+            }
+            for row in rows
+        ]
+        return {"items": items, "next_cursor": next_cursor}
+
+    return await cached_json(request, [EMPLOYEES], build)
@@ -1,11 +1,25 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+import asyncio
+import json
 
-from app.database import get_db
-from app.models.employee import Employee
-from app.models.department import Department
-from app.models.role import Role
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.config import settings
+from app.database import get_read_db
+from app.cache import cached_json, EMPLOYEES, DEPARTMENTS, ROLES
+from app.services.analytics_service import get_experience_histogram
+from app.services.dashboard_service import (
+    dashboard_counts,
+    dashboard_departments,
+    dashboard_roles,
+    dashboard_joining_years,
+    dashboard_manager_teams,
+    dashboard_feed
+)
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -14,95 +28,86 @@ router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 # 1️⃣ TOTAL COUNTS
 # ---------------------------------------------
 @router.get("/counts")
-async def get_employee_counts(db: AsyncSession = Depends(get_db)):
-    total = await db.execute(select(func.count(Employee.id)))
-    total_active = await db.execute(select(func.count()).where(Employee.resignation_date.is_(None)))
-    total_resigned = await db.execute(select(func.count()).where(Employee.resignation_date.is_not(None)))
-    total_managers = await db.execute(select(func.count()).where(Employee.id.in_(select(Employee.manager_id).where(Employee.manager_id.is_not(None)))))
-
-    return {
-        "total_employees": total.scalar(),
-        "active_employees": total_active.scalar(),
-        "resigned_employees": total_resigned.scalar(),
-        "total_managers": total_managers.scalar()
-    }
+async def get_employee_counts(request: Request, db: AsyncSession = Depends(get_read_db)):
+    return await cached_json(request, [EMPLOYEES], lambda: dashboard_counts(db))
 
 
 # ---------------------------------------------
 # 2️⃣ EMPLOYEES PER DEPARTMENT
 # ---------------------------------------------
 @router.get("/employees-per-department")
-async def employees_per_department(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Department.name, func.count(Employee.id))
-        .join(Employee, Department.id == Employee.department_id, isouter=True)
-        .group_by(Department.id)
-    )
-    rows = result.all()
-    return [{"department": r[0], "count": r[1]} for r in rows]
+async def employees_per_department(request: Request, db: AsyncSession = Depends(get_read_db)):
+    return await cached_json(request, [EMPLOYEES, DEPARTMENTS], lambda: dashboard_departments(db))
 
 
 # ---------------------------------------------
 # 3️⃣ EMPLOYEES PER ROLE
 # ---------------------------------------------
 @router.get("/employees-per-role")
-async def employees_per_role(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Role.title, func.count(Employee.id))
-        .join(Employee, Role.id == Employee.role_id, isouter=True)
-        .group_by(Role.id)
-    )
-    rows = result.all()
-    return [{"role": r[0], "count": r[1]} for r in rows]
+async def employees_per_role(request: Request, db: AsyncSession = Depends(get_read_db)):
+    return await cached_json(request, [EMPLOYEES, ROLES], lambda: dashboard_roles(db))
 
 
 # ---------------------------------------------
 # 4️⃣ EXPERIENCE DISTRIBUTION
 # ---------------------------------------------
 @router.get("/experience-distribution")
-async def experience_distribution(db: AsyncSession = Depends(get_db)):
-    buckets = {
-        "0-2": (0, 2),
-        "2-5": (2, 5),
-        "5-10": (5, 10),
-        "10+": (10, 50),
-    }
-    output = {}
-
-    for label, (start, end) in buckets.items():
-        result = await db.execute(
-            select(func.count())
-            .where(Employee.experience >= start)
-            .where(Employee.experience < end)
-        )
-        output[label] = result.scalar()
-
-    return output
+async def experience_distribution(request: Request, db: AsyncSession = Depends(get_read_db)):
+    return await cached_json(request, [EMPLOYEES], lambda: get_experience_histogram(db))
 
 
 # ---------------------------------------------
 # 5️⃣ YEAR OF JOINING CHART DATA
 # ---------------------------------------------
 @router.get("/joining-year")
-async def joining_year_graph(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Employee.year_of_joining, func.count())
-        .group_by(Employee.year_of_joining)
-        .order_by(Employee.year_of_joining)
-    )
-    rows = result.all()
-    return [{"year": r[0], "count": r[1]} for r in rows]
+async def joining_year_graph(request: Request, db: AsyncSession = Depends(get_read_db)):
+    return await cached_json(request, [EMPLOYEES], lambda: dashboard_joining_years(db))
 
 
 # ---------------------------------------------
 # 6️⃣ MANAGER → TEAM COUNT
 # ---------------------------------------------
 @router.get("/manager-team-count")
-async def manager_team_count(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Employee.name, func.count())
-        .join(Employee, Employee.manager_id == Employee.id, isouter=True)
-        .group_by(Employee.id)
+async def manager_team_count(
+    request: Request,
+    sort: str = Query("direct", pattern="^(direct|total)$", description="direct | total reports"),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
+):
+    return await cached_json(request, [EMPLOYEES], lambda: dashboard_manager_teams(db, sort, cursor, limit))
+
+
+# ---------------------------------------------
+# 7️⃣ LIVE FEED (Server-Sent Events)
+# ---------------------------------------------
+def _sse(event: dict) -> str:
+    data = json.dumps(jsonable_encoder(event), separators=(",", ":"))
+    return f"id: {event['version']}\nevent: {event['event']}\ndata: {data}\n\n"
+
+
+async def _dashboard_events():
+    # Subscribed inside the generator, so the finally below always unsubscribes
+    queue = await dashboard_feed.subscribe()
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), settings.dashboard_stream_keepalive_seconds)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield _sse(event)
+    finally:
+        dashboard_feed.unsubscribe(queue)
+
+
+@router.get("/stream")
+async def dashboard_stream():
+    # First event: "snapshot" with all six sections above (manager teams: first page).
+    # Then "delta" events carrying only the sections that changed after a write.
+    # Every viewer shares one computation; viewers add no queries of their own.
+    return StreamingResponse(
+        _dashboard_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
-    rows = result.all()
-    return [{"manager": r[0], "team_count": r[1]} for r in rows]
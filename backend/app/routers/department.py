@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.cache import cached_json, DEPARTMENTS
+from app.responses import json_response, model_response
+from app.services.employee_service import EMPLOYEE_FIELDS
+from app.services.hierarchy_service import parse_fields
 from app.schemas.department import DepartmentCreate, DepartmentResponse, DepartmentUpdate
-from app.schemas.employee import EmployeeResponse
+from app.schemas.employee import EmployeeResponse, employee_projection
 from app.services.department_service import (
     create_department,
     list_departments,
@@ -29,15 +33,15 @@ async def create_department_endpoint(payload: DepartmentCreate, db: AsyncSession
 # List All Departments
 # ======================================
 @router.get("/", response_model=List[DepartmentResponse])
-async def get_departments(db: AsyncSession = Depends(get_db)):
-    return await list_departments(db)
+async def get_departments(request: Request, db: AsyncSession = Depends(get_read_db)):
+    return await cached_json(request, [DEPARTMENTS], lambda: list_departments(db), List[DepartmentResponse])
 
 
 # ======================================
 # Get Department by ID
 # ======================================
 @router.get("/{dept_id}", response_model=DepartmentResponse)
-async def get_department_endpoint(dept_id: int, db: AsyncSession = Depends(get_db)):
+async def get_department_endpoint(dept_id: int, db: AsyncSession = Depends(get_read_db)):
     dept = await get_department(db, dept_id)
     if not dept:
         raise HTTPException(404, "Department not found")
@@ -71,5 +75,15 @@ async def delete_department_endpoint(dept_id: int, db: AsyncSession = Depends(ge
 # Employees Under a Department
 # ======================================
 @router.get("/{dept_id}/employees", response_model=List[EmployeeResponse])
-async def get_department_employees_endpoint(dept_id: int, db: AsyncSession = Depends(get_db)):
-    return await get_department_employees(db, dept_id)
+async def get_department_employees_endpoint(
+    dept_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated employee fields, e.g. id,name,manager_id"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    selected = tuple(parse_fields(fields, EMPLOYEE_FIELDS))
+    employees = await get_department_employees(db, dept_id, selected)
+    if employees is None:
+        raise HTTPException(404, "Department not found")
+    if fields:
+        return model_response(employees, List[employee_projection(selected)])
+    return json_response(employees)
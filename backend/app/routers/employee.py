@@ -1,17 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+import os
 
-from app.database import get_db
-from app.schemas.employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from app.database import get_db, get_read_db, read_session, recently_wrote
+from app.schemas.employee import (
+    EmployeeCreate,
+    EmployeeUpdate,
+    EmployeeResponse,
+    EmployeePage,
+    TeamSize,
+    employee_projection,
+    employee_projection_page,
+    BulkImportResult,
+    EmployeeBulkUpdate,
+    EmployeeBulkDelete,
+    BulkWriteResult
+)
+from app.schemas.job import JobResponse
 from app.services.employee_service import (
     create_employee,
     get_employee,
+    get_employee_fields,
     list_employees,
     update_employee,
     delete_employee,
-    list_subordinates
+    list_subordinates,
+    bulk_update_employees,
+    bulk_delete_employees,
+    EMPLOYEE_FIELDS
 )
+from app.services.hierarchy_service import get_employee_hierarchy, parse_fields
+from app.services.closure_service import list_descendants, list_ancestors, get_team_size
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.services.search_service import search_employees_by_name
+from app.services.import_service import import_employees, split_lines, CSV, NDJSON
+from app.services.job_service import IMPORT_JOB, spool_upload
+from app.jobs import create_job
+from app.services.export_service import stream_employees
+from app.responses import json_response, model_response
 
 router = APIRouter(prefix="/employees", tags=["employees"])
 
@@ -24,19 +53,108 @@ async def create_employee_endpoint(payload: EmployeeCreate, db: AsyncSession = D
     return await create_employee(db, payload)
 
 
+# ============================================
+# Bulk Import (streamed NDJSON or CSV)
+# ============================================
+@router.post("/bulk", response_model=BulkImportResult)
+async def bulk_import_employees(request: Request, db: AsyncSession = Depends(get_db)):
+    # Content-Type: text/csv for CSV (header row required), anything else is NDJSON
+    content_type = request.headers.get("content-type", "")
+    fmt = CSV if content_type.startswith("text/csv") else NDJSON
+    return await import_employees(db, split_lines(request.stream()), fmt)
+
+
+@router.post("/bulk/jobs", response_model=JobResponse, status_code=202)
+async def bulk_import_employees_job(request: Request, db: AsyncSession = Depends(get_db)):
+    # Same body as POST /employees/bulk; spooled to disk and imported by a background job
+    content_type = request.headers.get("content-type", "")
+    fmt = CSV if content_type.startswith("text/csv") else NDJSON
+
+    path = await spool_upload(request.stream(), fmt)
+    try:
+        return await create_job(db, IMPORT_JOB, {"path": path, "format": fmt}, internal=True)
+    except Exception:
+        # create_job already discards the upload once the job row exists
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+
+# ============================================
+# Bulk Update / Bulk Delete (one statement each)
+# ============================================
+@router.patch("/bulk", response_model=BulkWriteResult)
+async def bulk_update_employees_endpoint(payload: EmployeeBulkUpdate, db: AsyncSession = Depends(get_db)):
+    changes = payload.changes.model_dump(exclude_none=True)
+    if not changes:
+        raise HTTPException(400, "No changes provided")
+
+    filters = payload.filter.model_dump(exclude_none=True) if payload.filter else None
+    ids = await bulk_update_employees(db, changes, payload.ids, filters)
+    return {"affected": len(ids), "ids": ids}
+
+
+@router.delete("/bulk", response_model=BulkWriteResult)
+async def bulk_delete_employees_endpoint(payload: EmployeeBulkDelete, db: AsyncSession = Depends(get_db)):
+    filters = payload.filter.model_dump(exclude_none=True) if payload.filter else None
+    ids = await bulk_delete_employees(db, payload.ids, filters)
+    return {"affected": len(ids), "ids": ids}
+
+
 # ============================================
 # Get All Employees
 # ============================================
-@router.get("/", response_model=List[EmployeeResponse])
-async def get_all_employees(db: AsyncSession = Depends(get_db)):
-    return await list_employees(db)
+@router.get("/", response_model=EmployeePage)
+async def get_all_employees(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated employee fields, e.g. id,name,manager_id"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    if fields:
+        # Sparse fieldset: only the requested columns are selected and returned
+        selected = tuple(parse_fields(fields, EMPLOYEE_FIELDS))
+        items, next_cursor = await list_employees(db, cursor=cursor, limit=limit, fields=selected)
+        return model_response({"items": items, "next_cursor": next_cursor}, employee_projection_page(selected))
+
+    # Column rows serialized straight to JSON (no ORM objects, no response_model pass)
+    items, next_cursor = await list_employees(db, cursor=cursor, limit=limit, fields=EMPLOYEE_FIELDS)
+    return json_response({"items": items, "next_cursor": next_cursor})
+
+
+# ============================================
+# Export All Employees (streamed CSV / NDJSON)
+# ============================================
+@router.get("/export")
+async def export_employees(
+    request: Request,
+    format: str = Query(NDJSON, pattern="^(csv|ndjson)$", description="csv | ndjson")
+):
+    media_type = "text/csv" if format == CSV else "application/x-ndjson"
+    prefer_primary = recently_wrote(request)
+    return StreamingResponse(
+        stream_employees(lambda: read_session(prefer_primary), format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="employees.{format}"'}
+    )
 
 
 # ============================================
 # Get Employee by ID
 # ============================================
 @router.get("/{employee_id}", response_model=EmployeeResponse)
-async def get_employee_endpoint(employee_id: int, db: AsyncSession = Depends(get_db)):
+async def get_employee_endpoint(
+    employee_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated employee fields, e.g. id,name,manager_id"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    if fields:
+        selected = tuple(parse_fields(fields, EMPLOYEE_FIELDS))
+        row = await get_employee_fields(db, employee_id, selected)
+        if not row:
+            raise HTTPException(404, "Employee not found")
+        return model_response(row, employee_projection(selected))
+
     emp = await get_employee(db, employee_id)
     if not emp:
         raise HTTPException(404, "Employee not found")
@@ -63,10 +181,8 @@ async def update_employee_endpoint(
 # ============================================
 @router.delete("/{employee_id}")
 async def delete_employee_endpoint(employee_id: int, db: AsyncSession = Depends(get_db)):
-    emp = await get_employee(db, employee_id)
-    if not emp:
+    if not await delete_employee(db, employee_id):
         raise HTTPException(404, "Employee not found")
-    await delete_employee(db, employee_id)
     return {"message": "Employee deleted successfully"}
 
 
@@ -74,7 +190,7 @@ async def delete_employee_endpoint(employee_id: int, db: AsyncSession = Depends(
 # Get Subordinates (Direct Reports)
 # ============================================
 @router.get("/{employee_id}/subordinates", response_model=List[EmployeeResponse])
-async def get_subordinates_endpoint(employee_id: int, db: AsyncSession = Depends(get_db)):
+async def get_subordinates_endpoint(employee_id: int, db: AsyncSession = Depends(get_read_db)):
     emp = await get_employee(db, employee_id)
     if not emp:
         raise HTTPException(404, "Employee not found")
@@ -84,88 +200,136 @@ async def get_subordinates_endpoint(employee_id: int, db: AsyncSession = Depends
 # ============================================
 # Get Employees by Department
 # ============================================
-@router.get("/department/{dept_id}", response_model=List[EmployeeResponse])
-async def get_employees_by_department(dept_id: int, db: AsyncSession = Depends(get_db)):
-    employees = await list_employees(db)
-    return [e for e in employees if e.department_id == dept_id]
+@router.get("/department/{dept_id}", response_model=EmployeePage)
+async def get_employees_by_department(
+    dept_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
+):
+    items, next_cursor = await list_employees(
+        db, cursor=cursor, limit=limit, fields=EMPLOYEE_FIELDS, department_id=dept_id
+    )
+    return json_response({"items": items, "next_cursor": next_cursor})
 
 
 # ============================================
 # Get Employees by Role
 # ============================================
-@router.get("/role/{role_id}", response_model=List[EmployeeResponse])
-async def get_employees_by_role(role_id: int, db: AsyncSession = Depends(get_db)):
-    employees = await list_employees(db)
-    return [e for e in employees if e.role_id == role_id]
+@router.get("/role/{role_id}", response_model=EmployeePage)
+async def get_employees_by_role(
+    role_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
+):
+    items, next_cursor = await list_employees(
+        db, cursor=cursor, limit=limit, fields=EMPLOYEE_FIELDS, role_id=role_id
+    )
+    return json_response({"items": items, "next_cursor": next_cursor})
 
 
 # ============================================
 # Get Full Hierarchy Tree of an Employee
 # ============================================
 @router.get("/{employee_id}/hierarchy")
-async def get_hierarchy(employee_id: int, db: AsyncSession = Depends(get_db)):
-    emp = await get_employee(db, employee_id)
-    if not emp:
+async def get_hierarchy(
+    employee_id: int,
+    max_depth: Optional[int] = Query(None, ge=0, description="Levels below the employee to include"),
+    fields: Optional[str] = Query(None, description="Comma-separated employee fields per node"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    tree = await get_employee_hierarchy(db, employee_id, max_depth, parse_fields(fields))
+    if not tree:
+        raise HTTPException(404, "Employee not found")
+    return tree
+
+
+# ============================================
+# All Reports Under an Employee (closure table)
+# ============================================
+@router.get("/{employee_id}/descendants", response_model=EmployeePage)
+async def get_descendants_endpoint(
+    employee_id: int,
+    max_depth: Optional[int] = Query(None, ge=1, description="Levels below the employee to include"),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
+):
+    # Nearest levels first
+    items, next_cursor = await list_descendants(db, employee_id, max_depth, cursor, limit)
+    if not items and cursor is None and not await get_employee(db, employee_id):
         raise HTTPException(404, "Employee not found")
+    return {"items": items, "next_cursor": next_cursor}
 
-    async def build_tree(emp_id):
-        emp = await get_employee(db, emp_id)
-        subs = await list_subordinates(db, emp_id)
-        return {
-            "id": emp.id,
-            "name": emp.name,
-            "role_id": emp.role_id,
-            "department_id": emp.department_id,
-            "subordinates": [await build_tree(s.id) for s in subs]
-        }
 
-    return await build_tree(employee_id)
+# ============================================
+# Chain of Command Above an Employee
+# ============================================
+@router.get("/{employee_id}/ancestors", response_model=List[EmployeeResponse])
+async def get_ancestors_endpoint(employee_id: int, db: AsyncSession = Depends(get_read_db)):
+    # Direct manager first, top of the org last
+    ancestors = await list_ancestors(db, employee_id)
+    if not ancestors and not await get_employee(db, employee_id):
+        raise HTTPException(404, "Employee not found")
+    return ancestors
+
+
+# ============================================
+# Team Size (direct + indirect reports)
+# ============================================
+@router.get("/{employee_id}/team-size", response_model=TeamSize)
+async def get_team_size_endpoint(employee_id: int, db: AsyncSession = Depends(get_read_db)):
+    team = await get_team_size(db, employee_id)
+    if not team:
+        raise HTTPException(404, "Employee not found")
+    return team
 
 
 # ============================================
 # Search Employees by Name
 # ============================================
-@router.get("/search/", response_model=List[EmployeeResponse])
+@router.get("/search/", response_model=EmployeePage)
 async def search_employees(
-    q: str = Query(..., description="Search employees by name"),
-    db: AsyncSession = Depends(get_db)
+    q: str = Query(..., min_length=1, description="Search employees by name"),
+    prefix: bool = Query(False, description="Typeahead: match names with a word starting with q"),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    employees = await list_employees(db)
-    return [e for e in employees if q.lower() in e.name.lower()]
+    # Best matches first
+    items, next_cursor = await search_employees_by_name(db, q, prefix, cursor, limit)
+    return {"items": items, "next_cursor": next_cursor}
 
 
 # ============================================
 # Filter Employees (experience + joining year)
 # ============================================
-@router.get("/filter/", response_model=List[EmployeeResponse])
+@router.get("/filter/", response_model=EmployeePage)
 async def filter_employees(
     min_exp: int = 0,
     year: int = None,
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    employees = await list_employees(db)
-    result = employees
-
-    if min_exp:
-        result = [e for e in result if (e.experience or 0) >= min_exp]
-
-    if year:
-        result = [e for e in result if e.year_of_joining == year]
-
-    return result
+    items, next_cursor = await list_employees(
+        db, cursor=cursor, limit=limit, fields=EMPLOYEE_FIELDS, min_experience=min_exp, year_of_joining=year
+    )
+    return json_response({"items": items, "next_cursor": next_cursor})
 
 
 # ============================================
 # Sort Employees (name or experience)
 # ============================================
-@router.get("/sort/", response_model=List[EmployeeResponse])
+@router.get("/sort/", response_model=EmployeePage)
 async def sort_employees(
     by: str = Query("name", description="Sort by: name | experience"),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    employees = await list_employees(db)
-
-    if by == "experience":
-        return sorted(employees, key=lambda x: x.experience or 0, reverse=True)
-
-    return sorted(employees, key=lambda x: x.name.lower())
+    if by != "experience":
+        by = "name"
+    items, next_cursor = await list_employees(db, sort=by, cursor=cursor, limit=limit, fields=EMPLOYEE_FIELDS)
+    return json_response({"items": items, "next_cursor": next_cursor})
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.jobs import JOB_KINDS, create_job, get_job
+from app.schemas.job import JobCreate, JobResponse
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+# ---------------------------
+# Submit a Job (202 + job id; poll GET /jobs/{id})
+# ---------------------------
+@router.post("/", response_model=JobResponse, status_code=202)
+async def submit_job(payload: JobCreate, db: AsyncSession = Depends(get_db)):
+    return await create_job(db, payload.kind, payload.params)
+
+
+# ---------------------------
+# Job Kinds Accepted by POST /jobs
+# ---------------------------
+@router.get("/kinds")
+async def list_job_kinds():
+    return [
+        {"kind": name, "params": spec.params_model.model_json_schema()}
+        for name, spec in sorted(JOB_KINDS.items())
+        if spec.public
+    ]
+
+
+# ---------------------------
+# Job Status, Progress and Result
+# ---------------------------
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job_status(job_id: str, db: AsyncSession = Depends(get_db)):
+    # Always the primary: a replica may lag behind the runner's progress writes
+    return await get_job(db, job_id)
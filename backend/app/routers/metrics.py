@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Response
+
+from app.metrics import registry, CONTENT_TYPE
+
+router = APIRouter(tags=["system"])
+
+
+# ---------------------------
+# Prometheus Scrape Endpoint
+# ---------------------------
+@router.get("/metrics")
+async def get_metrics():
+    # Per process: with several workers or replicas, Prometheus scrapes each one
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.cache import cached_json, ROLES
+from app.responses import json_response, model_response
+from app.services.employee_service import EMPLOYEE_FIELDS
+from app.services.hierarchy_service import parse_fields
 from app.schemas.role import RoleCreate, RoleResponse, RoleUpdate
-from app.schemas.employee import EmployeeResponse
+from app.schemas.employee import EmployeeResponse, employee_projection
 from app.services.role_service import (
     create_role,
     list_roles,
@@ -29,15 +33,15 @@ async def create_role_endpoint(payload: RoleCreate, db: AsyncSession = Depends(g
 # List All Roles
 # ======================================
 @router.get("/", response_model=List[RoleResponse])
-async def get_roles(db: AsyncSession = Depends(get_db)):
-    return await list_roles(db)
+async def get_roles(request: Request, db: AsyncSession = Depends(get_read_db)):
+    return await cached_json(request, [ROLES], lambda: list_roles(db), List[RoleResponse])
 
 
 # ======================================
 # Get Single Role by ID
 # ======================================
 @router.get("/{role_id}", response_model=RoleResponse)
-async def get_role_endpoint(role_id: int, db: AsyncSession = Depends(get_db)):
+async def get_role_endpoint(role_id: int, db: AsyncSession = Depends(get_read_db)):
     role = await get_role(db, role_id)
     if not role:
         raise HTTPException(404, "Role not found")
@@ -71,5 +75,13 @@ async def delete_role_endpoint(role_id: int, db: AsyncSession = Depends(get_db))
 # Employees Assigned to a Role
 # ======================================
 @router.get("/{role_id}/employees", response_model=List[EmployeeResponse])
-async def get_role_employees_endpoint(role_id: int, db: AsyncSession = Depends(get_db)):
-    return await get_role_employees(db, role_id)
+async def get_role_employees_endpoint(
+    role_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated employee fields, e.g. id,name,manager_id"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    selected = tuple(parse_fields(fields, EMPLOYEE_FIELDS))
+    employees = await get_role_employees(db, role_id, selected)
+    if fields:
+        return model_response(employees, List[employee_projection(selected)])
+    return json_response(employees)
@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+
+from app.database import pool_metrics
+
+router = APIRouter(prefix="/system", tags=["system"])
+
+
+# ---------------------------
+# Connection Pool Metrics
+# ---------------------------
+@router.get("/pool")
+async def get_pool_metrics():
+    return pool_metrics()
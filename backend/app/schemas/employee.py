@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, create_model, model_validator
+from typing import Dict, List, Optional, Tuple
 from datetime import date
+from functools import lru_cache
 
 
 class EmployeeBase(BaseModel):
@@ -35,4 +36,97 @@ class EmployeeResponse(EmployeeBase):
 
     class Config:
         from_attributes = True
-    
\ No newline at end of file
+
+
+class EmployeePage(BaseModel):
+    items: List[EmployeeResponse]
+    next_cursor: Optional[str] = None
+
+
+class TeamSize(BaseModel):
+    employee_id: int
+    direct_reports: int
+    total_reports: int
+
+
+# Sparse fieldsets (?fields=id,name,manager_id): one model per distinct field list
+@lru_cache(maxsize=128)
+def employee_projection(fields: Tuple[str, ...]) -> type:
+    return create_model(
+        f"EmployeeProjection_{'_'.join(fields)}",
+        **{f: (EmployeeResponse.model_fields[f].annotation, ...) for f in fields}
+    )
+
+
+@lru_cache(maxsize=128)
+def employee_projection_page(fields: Tuple[str, ...]) -> type:
+    return create_model(
+        f"EmployeeProjectionPage_{'_'.join(fields)}",
+        items=(List[employee_projection(fields)], ...),
+        next_cursor=(Optional[str], None)
+    )
+
+
+class SkillSearchPage(EmployeePage):
+    skill_counts: Dict[str, int]
+
+
+class EmployeeImportRow(EmployeeCreate):
+    # Optional keys so rows in the same upload can reference each other as managers
+    ref: Optional[str] = Field(None, example="E-1001")
+    manager_ref: Optional[str] = Field(None, example="E-1000")
+
+    @model_validator(mode="after")
+    def check_manager(self):
+        # The row would otherwise be linked into the closure table twice
+        if self.manager_id is not None and self.manager_ref is not None:
+            raise ValueError("Provide at most one of 'manager_id' or 'manager_ref'")
+        return self
+
+
+class ImportRowError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class BulkImportResult(BaseModel):
+    inserted: int
+    # Rejected rows only; each has an entry in errors
+    failed: int
+    errors: List[ImportRowError]
+    # Rows that were inserted with a caveat, e.g. an unresolved manager_ref
+    warnings: List[ImportRowError] = []
+
+
+class EmployeeFilter(BaseModel):
+    department_id: Optional[int] = None
+    role_id: Optional[int] = None
+    manager_id: Optional[int] = None
+    name: Optional[str] = None
+    min_experience: Optional[int] = None
+    year_of_joining: Optional[int] = None
+
+
+class EmployeeBulkSelector(BaseModel):
+    # Target either an explicit id list or every employee matching a filter
+    ids: Optional[List[int]] = Field(None, max_length=10000, example=[4, 8, 15])
+    filter: Optional[EmployeeFilter] = None
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of 'ids' or 'filter'")
+        return self
+
+
+class EmployeeBulkUpdate(EmployeeBulkSelector):
+    changes: EmployeeUpdate
+
+
+class EmployeeBulkDelete(EmployeeBulkSelector):
+    pass
+
+
+class BulkWriteResult(BaseModel):
+    affected: int
+    ids: List[int]
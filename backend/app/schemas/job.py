@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import Any, Optional
+from datetime import datetime
+
+
+class JobCreate(BaseModel):
+    kind: str = Field(..., example="org-tree")
+    params: Optional[dict] = Field(None, example={"max_depth": 3})
+
+
+class JobResponse(BaseModel):
+    id: str
+    kind: str
+    status: str
+    params: Optional[dict] = None
+    progress_done: int
+    progress_total: Optional[int] = None
+    message: Optional[str] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
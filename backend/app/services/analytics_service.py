@@ -0,0 +1,175 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, case, and_
+from sqlalchemy.orm import aliased
+from fastapi import HTTPException
+from typing import List, Optional, Sequence, Tuple
+
+from app.models.employee import Employee
+from app.models.department import Department
+from app.models.role import Role
+from app.models.analytics_rollup import AnalyticsRollup
+from app.services.pagination import DEFAULT_PAGE_SIZE, apply_keyset, split_page
+from app.services.rollup_service import (
+    DEPARTMENT,
+    ROLE,
+    JOINING_YEAR,
+    RESIGNATION_YEAR,
+    DIRECT_REPORTS,
+    TOTAL_REPORTS,
+    list_rollup
+)
+
+
+# Shared experience bucket definition: (label, min years, max years), bounds inclusive.
+# A max of None leaves the last bucket open-ended.
+EXPERIENCE_BUCKETS: Sequence[Tuple[str, int, Optional[int]]] = (
+    ("0-2", 0, 2),
+    ("3-5", 3, 5),
+    ("6-10", 6, 10),
+    ("10+", 11, None),
+)
+
+# Manager level by direct reports: (max direct reports, label); None is open-ended
+MANAGER_LEVELS: Sequence[Tuple[Optional[int], str]] = (
+    (3, "L1 Manager"),
+    (8, "L2 Manager"),
+    (None, "L3 Manager"),
+)
+
+MANAGER_SPAN_SORTS = ("direct", "total")
+
+
+# ---------------------------
+# Headcount Summary (single pass over employees)
+# ---------------------------
+async def get_headcount_summary(db: AsyncSession) -> dict:
+    reports = aliased(Employee)
+    managers = select(reports.manager_id).where(reports.manager_id.is_not(None))
+
+    result = await db.execute(
+        select(
+            func.count().label("total"),
+            func.count().filter(Employee.resignation_date.is_(None)).label("active"),
+            func.count().filter(Employee.resignation_date.is_not(None)).label("resigned"),
+            func.count().filter(Employee.id.in_(managers)).label("managers"),
+        ).select_from(Employee)
+    )
+    row = result.one()
+
+    percent = (row.resigned / row.total * 100) if row.total > 0 else 0
+
+    return {
+        "total_employees": row.total,
+        "active_employees": row.active,
+        "resigned_employees": row.resigned,
+        "total_managers": row.managers,
+        "attrition_percentage": round(percent, 2)
+    }
+
+
+# ---------------------------
+# Experience Histogram (single GROUP BY)
+# ---------------------------
+async def get_experience_histogram(
+    db: AsyncSession,
+    buckets: Sequence[Tuple[str, int, Optional[int]]] = EXPERIENCE_BUCKETS
+) -> dict:
+    whens = []
+    for label, low, high in buckets:
+        condition = Employee.experience >= low
+        if high is not None:
+            condition = and_(condition, Employee.experience <= high)
+        whens.append((condition, label))
+
+    bucket = case(*whens, else_=None).label("bucket")
+    result = await db.execute(
+        select(bucket, func.count())
+        .where(Employee.experience.is_not(None))
+        .group_by(bucket)
+    )
+    counts = {label: count for label, count in result.all() if label is not None}
+
+    # Keep the configured order and report empty buckets as 0
+    return {label: counts.get(label, 0) for label, _, _ in buckets}
+
+
+# ---------------------------
+# Rollup-backed Group Counts (O(#groups))
+# ---------------------------
+async def _headcounts_by(db: AsyncSession, model, label_column, dimension: str):
+    result = await db.execute(
+        select(label_column, func.coalesce(AnalyticsRollup.count, 0))
+        .join(
+            AnalyticsRollup,
+            and_(AnalyticsRollup.dimension == dimension, AnalyticsRollup.bucket == model.id),
+            isouter=True
+        )
+        .order_by(model.id)
+    )
+    return result.all()
+
+
+async def get_department_headcounts(db: AsyncSession):
+    return await _headcounts_by(db, Department, Department.name, DEPARTMENT)
+
+
+async def get_role_headcounts(db: AsyncSession):
+    return await _headcounts_by(db, Role, Role.title, ROLE)
+
+
+async def get_joining_year_counts(db: AsyncSession):
+    return await list_rollup(db, JOINING_YEAR)
+
+
+async def get_resignation_trend(db: AsyncSession):
+    return await list_rollup(db, RESIGNATION_YEAR)
+
+
+# ---------------------------
+# Manager Span (direct + transitive reports, largest first)
+# ---------------------------
+def manager_level(direct_reports: int, levels=MANAGER_LEVELS) -> str:
+    for limit, label in levels:
+        if limit is None or direct_reports <= limit:
+            return label
+    return levels[-1][1]
+
+
+async def list_manager_spans(
+    db: AsyncSession,
+    sort: str = "total",
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+) -> Tuple[List, Optional[str]]:
+    if sort not in MANAGER_SPAN_SORTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort key. Choose one of: {', '.join(MANAGER_SPAN_SORTS)}"
+        )
+
+    # Spans are rollup counters kept in step with employee_closure: a page walks
+    # ix_analytics_rollups_dimension_count instead of aggregating the whole org
+    direct = aliased(AnalyticsRollup)
+    total = aliased(AnalyticsRollup)
+    ranked, other = (direct, total) if sort == "direct" else (total, direct)
+
+    query = (
+        select(Employee.id, Employee.name, direct.count.label("direct_reports"), total.count.label("total_reports"))
+        .select_from(ranked)
+        .join(Employee, Employee.id == ranked.bucket)
+        .join(other, other.bucket == ranked.bucket)
+        .where(
+            direct.dimension == DIRECT_REPORTS,
+            total.dimension == TOTAL_REPORTS,
+            ranked.count > 0
+        )
+    )
+
+    result = await db.execute(
+        apply_keyset(query, [ranked.count, ranked.bucket], cursor, limit, descending=True)
+    )
+    return split_page(
+        result.all(),
+        limit,
+        lambda row: [row.direct_reports if sort == "direct" else row.total_reports, row.id]
+    )
@@ -0,0 +1,273 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete, exists, func, literal, text
+from sqlalchemy.orm import aliased
+from fastapi import HTTPException
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.models.employee import Employee
+from app.models.employee_closure import EmployeeClosure
+from app.services.hierarchy_service import MAX_HIERARCHY_DEPTH
+from app.services.pagination import DEFAULT_PAGE_SIZE, apply_keyset, split_page
+from app.services.rollup_service import (
+    DIRECT_REPORTS,
+    TOTAL_REPORTS,
+    apply_rollup_deltas,
+    rebuild_span_rollups
+)
+
+CLOSURE_COLUMNS = ["ancestor_id", "descendant_id", "depth"]
+
+# pg_advisory_xact_lock key for manager_id / closure changes
+HIERARCHY_LOCK_KEY = 7_251_390_115
+
+
+# ---------------------------
+# Serialize Hierarchy Changes (held until commit / rollback)
+# ---------------------------
+async def lock_hierarchy(db: AsyncSession):
+    # Two concurrent moves can each pass the cycle check against the other's
+    # pre-move closure and together form a cycle; creates and deletes under a
+    # moving subtree would likewise link against stale ancestors. Callers that
+    # also lock employee rows take this first, so the lock order is always the same.
+    # Re-entrant within a transaction. SQLite already runs one writer at a time.
+    if db.bind.dialect.name == "postgresql":
+        await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": HIERARCHY_LOCK_KEY})
+
+
+# ---------------------------
+# Self Rows for New Employees (caller commits)
+# ---------------------------
+async def add_closure_nodes(db: AsyncSession, employee_ids: List[int]):
+    if employee_ids:
+        await db.execute(
+            insert(EmployeeClosure),
+            [{"ancestor_id": emp_id, "descendant_id": emp_id, "depth": 0} for emp_id in employee_ids]
+        )
+
+
+# ---------------------------
+# Cycle Check Before a Manager Change
+# ---------------------------
+async def check_manager_change(db: AsyncSession, employee_ids: Iterable, manager_id: Optional[int]):
+    # The new manager may not sit in the subtree of anyone being moved (itself included)
+    await lock_hierarchy(db)
+    if manager_id is None:
+        return
+
+    result = await db.execute(
+        select(
+            exists().where(
+                EmployeeClosure.ancestor_id.in_(employee_ids),
+                EmployeeClosure.descendant_id == manager_id
+            )
+        )
+    )
+    if result.scalar():
+        raise HTTPException(status_code=400, detail="Manager change would create a reporting cycle")
+
+
+# ---------------------------
+# Manager Span Rollups for Closure Rows About to Change
+# ---------------------------
+async def _apply_span_changes(db: AsyncSession, pairs, sign: int):
+    # pairs selects ancestor_id and depth of the rows being inserted (+1) or deleted (-1);
+    # counted per manager, so the work grows with the change, not the org
+    pairs = pairs.subquery()
+    result = await db.execute(
+        select(
+            pairs.c.ancestor_id,
+            func.count().filter(pairs.c.depth == 1),
+            func.count()
+        )
+        .where(pairs.c.depth > 0)
+        .group_by(pairs.c.ancestor_id)
+    )
+
+    deltas = Counter()
+    for manager_id, direct, total in result:
+        deltas[(DIRECT_REPORTS, manager_id)] += sign * direct
+        deltas[(TOTAL_REPORTS, manager_id)] += sign * total
+    await apply_rollup_deltas(db, deltas)
+
+
+# ---------------------------
+# Cut Paths Through Employees (caller commits)
+# ---------------------------
+async def detach_subtrees(db: AsyncSession, employee_ids: Iterable, include_self: bool = False):
+    # Removes every (a, d) pair whose path runs through one of employee_ids from above.
+    # include_self=False keeps each subtree intact (a move); True also drops the nodes' own rows (a delete).
+    # employee_ids may be a list or a SELECT of employee ids.
+    up = aliased(EmployeeClosure)
+    down = aliased(EmployeeClosure)
+
+    through = (
+        select(literal(1))
+        .select_from(up)
+        .join(down, up.descendant_id == down.ancestor_id)
+        .where(
+            up.ancestor_id == EmployeeClosure.ancestor_id,
+            down.descendant_id == EmployeeClosure.descendant_id,
+            down.ancestor_id.in_(employee_ids)
+        )
+    )
+    if not include_self:
+        through = through.where(up.depth > 0)
+
+    await lock_hierarchy(db)
+    await _apply_span_changes(
+        db,
+        select(EmployeeClosure.ancestor_id, EmployeeClosure.depth).where(through.exists()),
+        -1
+    )
+    await db.execute(delete(EmployeeClosure).where(through.exists()))
+
+
+# ---------------------------
+# Link Subtrees Under Their Current Manager (caller commits)
+# ---------------------------
+async def attach_subtrees(db: AsyncSession, employee_ids: Iterable):
+    # Reads each employee's manager_id from the employees table. The subtrees must be
+    # disjoint and detached, and no employee in the batch may manage another one.
+    up = aliased(EmployeeClosure)
+    down = aliased(EmployeeClosure)
+
+    pairs = (
+        select(up.ancestor_id, down.descendant_id, (up.depth + down.depth + 1).label("depth"))
+        .select_from(Employee)
+        .join(up, up.descendant_id == Employee.manager_id)
+        .join(down, down.ancestor_id == Employee.id)
+        .where(Employee.id.in_(employee_ids))
+    )
+
+    await lock_hierarchy(db)
+    await _apply_span_changes(db, pairs, 1)
+    await db.execute(insert(EmployeeClosure).from_select(CLOSURE_COLUMNS, pairs))
+
+
+async def move_subtrees(db: AsyncSession, employee_ids: Iterable):
+    # Call after employees.manager_id has been updated
+    await detach_subtrees(db, employee_ids)
+    await attach_subtrees(db, employee_ids)
+
+
+# ---------------------------
+# Link Order for Batches of New Manager Links
+# ---------------------------
+def link_levels(links: Dict[int, int]) -> Tuple[List[List[int]], List[int]]:
+    # links maps employee_id -> manager_id for freshly inserted employees.
+    # Each level only has managers from earlier levels, so attach_subtrees works level by level.
+    # Employees that end up in a reporting cycle are returned separately.
+    children: Dict[int, List[int]] = {}
+    for emp_id, manager_id in links.items():
+        children.setdefault(manager_id, []).append(emp_id)
+
+    levels = []
+    level = [emp_id for emp_id, manager_id in links.items() if manager_id not in links]
+    while level:
+        levels.append(level)
+        level = [child for emp_id in level for child in children.get(emp_id, [])]
+
+    placed = {emp_id for level in levels for emp_id in level}
+    cyclic = [emp_id for emp_id in links if emp_id not in placed]
+    return levels, cyclic
+
+
+# ---------------------------
+# Full Rebuild (repair)
+# ---------------------------
+async def rebuild_closure(db: AsyncSession):
+    anchor = select(
+        Employee.id.label("ancestor_id"),
+        Employee.id.label("descendant_id"),
+        literal(0).label("depth")
+    )
+    paths = anchor.cte("paths", recursive=True)
+    paths = paths.union_all(
+        select(paths.c.ancestor_id, Employee.id, paths.c.depth + 1)
+        .join(paths, Employee.manager_id == paths.c.descendant_id)
+        .where(paths.c.depth < MAX_HIERARCHY_DEPTH)
+    )
+
+    await db.execute(delete(EmployeeClosure))
+    await db.execute(
+        insert(EmployeeClosure).from_select(
+            CLOSURE_COLUMNS,
+            # Manager cycles in old data yield a pair more than once; keep the shortest path
+            select(paths.c.ancestor_id, paths.c.descendant_id, func.min(paths.c.depth))
+            .group_by(paths.c.ancestor_id, paths.c.descendant_id)
+        )
+    )
+    await rebuild_span_rollups(db)
+    await db.commit()
+
+
+async def ensure_closure(db: AsyncSession):
+    # Build the table once for databases that predate employee_closure
+    has_closure = await db.execute(select(EmployeeClosure.ancestor_id).limit(1))
+    if has_closure.first() is not None:
+        return
+
+    has_employees = await db.execute(select(Employee.id).limit(1))
+    if has_employees.first() is not None:
+        await rebuild_closure(db)
+
+
+# ---------------------------
+# Descendants (all levels, keyset paginated)
+# ---------------------------
+async def list_descendants(
+    db: AsyncSession,
+    employee_id: int,
+    max_depth: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+) -> Tuple[List[Employee], Optional[str]]:
+    query = (
+        select(Employee, EmployeeClosure.depth)
+        .join(EmployeeClosure, EmployeeClosure.descendant_id == Employee.id)
+        .where(EmployeeClosure.ancestor_id == employee_id, EmployeeClosure.depth > 0)
+    )
+    if max_depth is not None:
+        query = query.where(EmployeeClosure.depth <= max_depth)
+
+    result = await db.execute(
+        apply_keyset(query, [EmployeeClosure.depth, Employee.id], cursor, limit)
+    )
+    rows, next_cursor = split_page(result.all(), limit, lambda row: [row.depth, row.Employee.id])
+    return [row.Employee for row in rows], next_cursor
+
+
+# ---------------------------
+# Ancestors (chain of command, nearest first)
+# ---------------------------
+async def list_ancestors(db: AsyncSession, employee_id: int) -> List[Employee]:
+    result = await db.execute(
+        select(Employee)
+        .join(EmployeeClosure, EmployeeClosure.ancestor_id == Employee.id)
+        .where(EmployeeClosure.descendant_id == employee_id, EmployeeClosure.depth > 0)
+        .order_by(EmployeeClosure.depth)
+    )
+    return result.scalars().all()
+
+
+# ---------------------------
+# Team Size (direct + indirect reports)
+# ---------------------------
+async def get_team_size(db: AsyncSession, employee_id: int) -> Optional[dict]:
+    depth = EmployeeClosure.depth
+    result = await db.execute(
+        select(
+            func.count().filter(depth == 0).label("found"),
+            func.count().filter(depth == 1).label("direct_reports"),
+            func.count().filter(depth > 0).label("total_reports"),
+        ).where(EmployeeClosure.ancestor_id == employee_id)
+    )
+    row = result.one()
+    if not row.found:
+        return None
+    return {
+        "employee_id": employee_id,
+        "direct_reports": row.direct_reports,
+        "total_reports": row.total_reports,
+    }
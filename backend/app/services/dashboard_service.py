@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import response_cache, EMPLOYEES, DEPARTMENTS, ROLES
+from app.config import settings
+from app.database import read_session
+from app.instrumentation import detached_task
+from app.services.analytics_service import (
+    get_headcount_summary,
+    get_experience_histogram,
+    get_department_headcounts,
+    get_role_headcounts,
+    get_joining_year_counts,
+    list_manager_spans
+)
+from app.services.pagination import DEFAULT_PAGE_SIZE
+
+logger = logging.getLogger("fasthr.dashboard")
+
+# Slow subscribers get a fresh snapshot instead of an ever-growing backlog of deltas
+SUBSCRIBER_QUEUE_SIZE = 16
+
+
+# ---------------------------
+# Dashboard Sections (shared by /dashboard/* and the live feed)
+# ---------------------------
+async def dashboard_counts(db: AsyncSession) -> dict:
+    summary = await get_headcount_summary(db)
+    return {
+        "total_employees": summary["total_employees"],
+        "active_employees": summary["active_employees"],
+        "resigned_employees": summary["resigned_employees"],
+        "total_managers": summary["total_managers"]
+    }
+
+
+async def dashboard_departments(db: AsyncSession) -> list:
+    rows = await get_department_headcounts(db)
+    return [{"department": r[0], "count": r[1]} for r in rows]
+
+
+async def dashboard_roles(db: AsyncSession) -> list:
+    rows = await get_role_headcounts(db)
+    return [{"role": r[0], "count": r[1]} for r in rows]
+
+
+async def dashboard_joining_years(db: AsyncSession) -> list:
+    rows = await get_joining_year_counts(db)
+    return [{"year": r[0], "count": r[1]} for r in rows]
+
+
+async def dashboard_manager_teams(
+    db: AsyncSession,
+    sort: str = "direct",
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+) -> dict:
+    rows, next_cursor = await list_manager_spans(db, sort, cursor, limit)
+    items = [
+        {
+            "manager_id": r.id,
+            "manager": r.name,
+            "team_count": r.direct_reports,
+            "total_team_count": r.total_reports
+        }
+        for r in rows
+    ]
+    return {"items": items, "next_cursor": next_cursor}
+
+
+class Section(NamedTuple):
+    name: str
+    # Cache tags whose invalidation makes this section stale
+    tags: Tuple[str, ...]
+    build: Callable[[AsyncSession], Awaitable[Any]]
+
+
+# Same names and payloads as the GET /dashboard/* endpoints (manager teams: first page)
+DASHBOARD_SECTIONS: Tuple[Section, ...] = (
+    Section("counts", (EMPLOYEES,), dashboard_counts),
+    Section("employees-per-department", (EMPLOYEES, DEPARTMENTS), dashboard_departments),
+    Section("employees-per-role", (EMPLOYEES, ROLES), dashboard_roles),
+    Section("experience-distribution", (EMPLOYEES,), get_experience_histogram),
+    Section("joining-year", (EMPLOYEES,), dashboard_joining_years),
+    Section("manager-team-count", (EMPLOYEES,), dashboard_manager_teams),
+)
+
+ALL_TAGS = frozenset(tag for section in DASHBOARD_SECTIONS for tag in section.tags)
+
+
+# ---------------------------
+# Live Feed (one computation shared by every subscriber)
+# ---------------------------
+class DashboardFeed:
+    def __init__(self):
+        self.version = 0
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self.subscribers: Set[asyncio.Queue] = set()
+        self._dirty: Set[str] = set()
+        self._refresh: Optional[asyncio.Task] = None
+        self._loading: Optional[asyncio.Task] = None
+
+    def event(self, kind: str, sections: Dict[str, Any]) -> dict:
+        return {"event": kind, "version": self.version, "sections": sections}
+
+    async def subscribe(self) -> asyncio.Queue:
+        # The snapshot is only kept current while the refresh loop runs. If the last
+        # subscriber leaves while we wait, it is cleared again: load until it sticks.
+        if self._refresh is None:
+            await self._load_snapshot()
+        while self.snapshot is None:
+            await self._load_snapshot()
+
+        # Queues hold events; the first one is always a full snapshot
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        queue.put_nowait(self.event("snapshot", self.snapshot))
+        self.subscribers.add(queue)
+        if self._refresh is None:
+            self._refresh = detached_task(self._refresh_loop())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+        if not self.subscribers and self._refresh is not None:
+            # Nobody is watching: stop refreshing and reload on the next subscribe
+            self._refresh.cancel()
+            self._refresh = None
+            self.snapshot = None
+            self._dirty.clear()
+
+    def notify(self, tags: Tuple[str, ...]):
+        # response_cache listener: runs on every write, so it only records what went stale.
+        # Writes during the first load count too: the snapshot may have been read before them.
+        if (self._loading is not None or self.subscribers) and ALL_TAGS.intersection(tags):
+            self._dirty.update(tags)
+
+    async def _load_snapshot(self):
+        # Concurrent first subscribers share one load, which outlives any of them leaving
+        if self._loading is None:
+            self._loading = detached_task(self._compute(DASHBOARD_SECTIONS))
+            self._loading.add_done_callback(self._loaded)
+        await asyncio.shield(self._loading)
+
+    def _loaded(self, task: asyncio.Task):
+        self._loading = None
+        if not task.cancelled() and task.exception() is None:
+            self.snapshot = task.result()
+            self.version += 1
+
+    async def _compute(self, sections) -> Dict[str, Any]:
+        # Primary: the change that triggered this may not have reached a replica yet
+        async with read_session(prefer_primary=True) as db:
+            return {section.name: await section.build(db) for section in sections}
+
+    async def _refresh_loop(self):
+        # Writes are coalesced over the debounce window; a periodic full refresh also
+        # picks up writes made by other processes
+        last_full = time.monotonic()
+        while True:
+            await asyncio.sleep(settings.dashboard_stream_debounce_seconds)
+            full = time.monotonic() - last_full >= settings.dashboard_stream_refresh_seconds
+            if not (self._dirty or full):
+                continue
+
+            dirty, self._dirty = self._dirty, set()
+            stale = [s for s in DASHBOARD_SECTIONS if full or dirty.intersection(s.tags)]
+            try:
+                fresh = await self._compute(stale)
+            except Exception:
+                logger.exception("dashboard feed refresh failed")
+                self._dirty |= dirty
+                continue
+            if full:
+                last_full = time.monotonic()
+            self._publish(fresh)
+
+    def _publish(self, fresh: Dict[str, Any]):
+        if self.snapshot is None:
+            return
+        changed = {name: value for name, value in fresh.items() if self.snapshot.get(name) != value}
+        if not changed:
+            return
+
+        self.snapshot = {**self.snapshot, **changed}
+        self.version += 1
+        delta = self.event("delta", changed)
+        for queue in self.subscribers:
+            try:
+                queue.put_nowait(delta)
+            except asyncio.QueueFull:
+                # Behind by more than the queue holds: replace the backlog with a snapshot
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self.event("snapshot", self.snapshot))
+
+
+dashboard_feed = DashboardFeed()
+response_cache.listeners.append(dashboard_feed.notify)
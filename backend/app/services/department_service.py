@@ -4,7 +4,12 @@ from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 
 from app.models.department import Department
+from app.models.employee import Employee
+from app.services.employee_service import EMPLOYEE_FIELDS, employee_columns
 from app.schemas.department import DepartmentCreate, DepartmentUpdate
+from app.services.rollup_service import DEPARTMENT, release_rollup_bucket
+from app.loaders import loaders_for
+from app.cache import response_cache, DEPARTMENTS, EMPLOYEES
 
 
 # ---------------------------------------------
@@ -17,6 +22,7 @@ async def create_department(db: AsyncSession, payload: DepartmentCreate):
     try:
         await db.commit()
         await db.refresh(dept)
+        response_cache.invalidate(DEPARTMENTS)
         return dept
 
     except IntegrityError:
@@ -39,8 +45,7 @@ async def list_departments(db: AsyncSession):
 # GET DEPARTMENT
 # ---------------------------------------------
 async def get_department(db: AsyncSession, dept_id: int):
-    result = await db.execute(select(Department).where(Department.id == dept_id))
-    return result.scalars().first()
+    return await loaders_for(db).departments.load(dept_id)
 
 
 # ---------------------------------------------
@@ -57,6 +62,7 @@ async def update_department(db: AsyncSession, dept_id: int, payload: DepartmentU
     try:
         await db.commit()
         await db.refresh(dept)
+        response_cache.invalidate(DEPARTMENTS)
         return dept
 
     except IntegrityError:
@@ -76,15 +82,24 @@ async def delete_department(db: AsyncSession, dept_id: int):
         return None
 
     await db.delete(dept)
+    await release_rollup_bucket(db, DEPARTMENT, dept_id)
     await db.commit()
+    response_cache.invalidate(DEPARTMENTS, EMPLOYEES)
     return True
 
 
 # ---------------------------------------------
 # EMPLOYEES UNDER A DEPARTMENT
 # ---------------------------------------------
-async def get_department_employees(db: AsyncSession, dept_id: int):
+async def get_department_employees(db: AsyncSession, dept_id: int, fields=EMPLOYEE_FIELDS):
     dept = await get_department(db, dept_id)
     if not dept:
         return None
-    return dept.employees
+
+    # Plain dicts of the requested columns only
+    result = await db.execute(
+        select(*employee_columns(fields))
+        .where(Employee.department_id == dept_id)
+        .order_by(Employee.id)
+    )
+    return [dict(zip(fields, row)) for row in result]
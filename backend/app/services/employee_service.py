@@ -1,18 +1,56 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
-from typing import List, Optional
+from sqlalchemy import select, update, delete, func, and_, String
+from collections import Counter
+from fastapi import HTTPException
+from typing import List, Optional, Sequence, Tuple
 
 from app.models.employee import Employee
-from app.schemas.employee import EmployeeCreate, EmployeeUpdate
+from app.schemas.employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse
+from app.services.pagination import DEFAULT_PAGE_SIZE, apply_keyset, split_page
+from app.services.rollup_service import ROLLUP_COLUMNS, rollup_deltas, apply_rollup_deltas
+from app.services.skill_service import sync_employee_skills, replace_skills
+from app.services.closure_service import (
+    add_closure_nodes,
+    attach_subtrees,
+    check_manager_change,
+    detach_subtrees,
+    lock_hierarchy,
+    move_subtrees
+)
+from app.loaders import loaders_for
+from app.cache import response_cache, EMPLOYEES
+
+
+# Sort key expression and direction for each supported ?by= value
+EMPLOYEE_SORTS = {
+    "id": (None, False),
+    "name": (func.lower(Employee.name, type_=String), False),
+    "experience": (func.coalesce(Employee.experience, 0), True),
+}
+
+# Columns behind EmployeeResponse, for row queries that skip ORM hydration
+EMPLOYEE_FIELDS = tuple(EmployeeResponse.model_fields)
+
+
+def employee_columns(fields=EMPLOYEE_FIELDS) -> list:
+    return [getattr(Employee, f) for f in fields]
 
 
 # ---------------------------
 # Create Employee
 # ---------------------------
 async def create_employee(db: AsyncSession, payload: EmployeeCreate) -> Employee:
-    emp = Employee(**payload.model_dump())
+    values = payload.model_dump()
+    emp = Employee(**values)
     db.add(emp)
+    await db.flush()
+    await sync_employee_skills(db, emp.id, emp.tech_stack)
+    await add_closure_nodes(db, [emp.id])
+    if emp.manager_id is not None:
+        await attach_subtrees(db, [emp.id])
+    await apply_rollup_deltas(db, rollup_deltas(new=values))
     await db.commit()
+    response_cache.invalidate(EMPLOYEES)
     await db.refresh(emp)
     return emp
 
@@ -21,37 +59,163 @@ async def create_employee(db: AsyncSession, payload: EmployeeCreate) -> Employee
 # Get Employee by ID
 # ---------------------------
 async def get_employee(db: AsyncSession, employee_id: int) -> Optional[Employee]:
-    result = await db.execute(select(Employee).where(Employee.id == employee_id))
-    return result.scalars().first()
+    # Batched with other lookups in the same tick and memoized for the request
+    return await loaders_for(db).employees.load(employee_id)
+
+
+async def get_employee_fields(db: AsyncSession, employee_id: int, fields: Sequence[str]) -> Optional[dict]:
+    result = await db.execute(select(*employee_columns(fields)).where(Employee.id == employee_id))
+    row = result.first()
+    return dict(zip(fields, row)) if row else None
 
 
 # ---------------------------
-# List Employees
+# Current Rollup Columns of an Employee
 # ---------------------------
-async def list_employees(db: AsyncSession, skip: int = 0, limit: int = 100):
-    result = await db.execute(select(Employee).offset(skip).limit(limit))
-    return result.scalars().all()
+async def _get_rollup_state(db: AsyncSession, employee_id: int) -> Optional[dict]:
+    # Locked so the rollup deltas are computed from the state the UPDATE replaces
+    result = await db.execute(
+        select(*[getattr(Employee, c) for c in ROLLUP_COLUMNS])
+        .where(Employee.id == employee_id)
+        .with_for_update()
+    )
+    row = result.first()
+    return dict(row._mapping) if row else None
+
+
+# ---------------------------
+# Employee Query Builder (filters pushed into SQL)
+# ---------------------------
+def employee_filter_conditions(
+    department_id: Optional[int] = None,
+    role_id: Optional[int] = None,
+    manager_id: Optional[int] = None,
+    name: Optional[str] = None,
+    min_experience: Optional[int] = None,
+    year_of_joining: Optional[int] = None
+) -> list:
+    conditions = []
+
+    if department_id is not None:
+        conditions.append(Employee.department_id == department_id)
+    if role_id is not None:
+        conditions.append(Employee.role_id == role_id)
+    if manager_id is not None:
+        conditions.append(Employee.manager_id == manager_id)
+    if name:
+        conditions.append(Employee.name.icontains(name, autoescape=True))
+    if min_experience:
+        conditions.append(func.coalesce(Employee.experience, 0) >= min_experience)
+    if year_of_joining:
+        conditions.append(Employee.year_of_joining == year_of_joining)
+
+    return conditions
+
+
+def build_employee_query(**filters):
+    return select(Employee).where(*employee_filter_conditions(**filters))
+
+
+# ---------------------------
+# List Employees (keyset paginated)
+# ---------------------------
+async def list_employees(
+    db: AsyncSession,
+    sort: str = "id",
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    fields: Optional[Sequence[str]] = None,
+    **filters
+) -> Tuple[list, Optional[str]]:
+    # fields=None returns Employee objects; a field list returns plain dicts of those columns
+    if sort not in EMPLOYEE_SORTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort key. Choose one of: {', '.join(EMPLOYEE_SORTS)}"
+        )
+
+    sort_key, descending = EMPLOYEE_SORTS[sort]
+    if fields is None:
+        query = build_employee_query(**filters)
+        row_id = lambda row: row.Employee.id
+    else:
+        query = select(*employee_columns(fields)).where(*employee_filter_conditions(**filters))
+        row_id = lambda row: row.id
+
+    if sort_key is None:
+        keys = [Employee.id]
+    else:
+        keys = [sort_key, Employee.id]
+        query = query.add_columns(sort_key.label("sort_key"))
+
+    result = await db.execute(apply_keyset(query, keys, cursor, limit, descending))
+    rows, next_cursor = split_page(
+        result.all(),
+        limit,
+        lambda row: [row_id(row)] if sort_key is None else [row.sort_key, row_id(row)]
+    )
+
+    if fields is None:
+        return [row.Employee for row in rows], next_cursor
+    return [dict(zip(fields, row)) for row in rows], next_cursor
 
 
 # ---------------------------
 # Update Employee
 # ---------------------------
 async def update_employee(db: AsyncSession, employee_id: int, payload: EmployeeUpdate):
-    await db.execute(
+    if payload.manager_id is not None:
+        await lock_hierarchy(db)
+    old = await _get_rollup_state(db, employee_id)
+    if old is None:
+        return None
+
+    changes = payload.model_dump(exclude_none=True)
+    if not changes:
+        return await get_employee(db, employee_id)
+
+    if "manager_id" in changes:
+        await check_manager_change(db, [employee_id], changes["manager_id"])
+
+    result = await db.execute(
         update(Employee)
         .where(Employee.id == employee_id)
-        .values(**payload.model_dump(exclude_none=True))
+        .values(**changes)
+        .returning(Employee)
     )
+    emp = result.scalars().one_or_none()
+    if emp is None:
+        # Deleted after the state was read (no row lock on SQLite): the router returns 404
+        await db.rollback()
+        return None
+    if "tech_stack" in changes:
+        await sync_employee_skills(db, employee_id, changes["tech_stack"])
+    if "manager_id" in changes:
+        await move_subtrees(db, [employee_id])
+    await apply_rollup_deltas(db, rollup_deltas(old, {**old, **changes}))
     await db.commit()
-    return await get_employee(db, employee_id)
+    response_cache.invalidate(EMPLOYEES)
+    return emp
 
 
 # ---------------------------
 # Delete Employee
 # ---------------------------
 async def delete_employee(db: AsyncSession, employee_id: int) -> bool:
-    await db.execute(delete(Employee).where(Employee.id == employee_id))
+    # Reports of the deleted employee become roots (manager_id SET NULL)
+    await detach_subtrees(db, [employee_id], include_self=True)
+    result = await db.execute(
+        delete(Employee)
+        .where(Employee.id == employee_id)
+        .returning(*[getattr(Employee, c) for c in ROLLUP_COLUMNS])
+    )
+    row = result.first()
+    if row is None:
+        return False
+
+    await apply_rollup_deltas(db, rollup_deltas(old=dict(row._mapping)))
     await db.commit()
+    response_cache.invalidate(EMPLOYEES)
     return True
 
 
@@ -61,3 +225,108 @@ async def delete_employee(db: AsyncSession, employee_id: int) -> bool:
 async def list_subordinates(db: AsyncSession, manager_id: int):
     result = await db.execute(select(Employee).where(Employee.manager_id == manager_id))
     return result.scalars().all()
+
+
+# ---------------------------
+# Bulk Target (id list or filter predicate)
+# ---------------------------
+def _bulk_condition(ids: Optional[List[int]], filters: Optional[dict]):
+    if ids is not None:
+        return Employee.id.in_(ids)
+
+    conditions = employee_filter_conditions(**(filters or {}))
+    if not conditions:
+        raise HTTPException(status_code=400, detail="Bulk filter must set at least one condition")
+    return and_(*conditions)
+
+
+async def _lock_bulk_targets(db: AsyncSession, ids: Optional[List[int]], filters: Optional[dict]) -> List[dict]:
+    # The filter is evaluated once: later statements work on exactly these locked ids,
+    # so a row that starts or stops matching meanwhile can't slip in or out halfway
+    result = await db.execute(
+        select(Employee.id, *[getattr(Employee, c) for c in ROLLUP_COLUMNS])
+        .where(_bulk_condition(ids, filters))
+        .order_by(Employee.id)
+        .with_for_update()
+    )
+    return [dict(row._mapping) for row in result]
+
+
+# ---------------------------
+# Bulk Update (single UPDATE ... RETURNING)
+# ---------------------------
+async def bulk_update_employees(
+    db: AsyncSession,
+    changes: dict,
+    ids: Optional[List[int]] = None,
+    filters: Optional[dict] = None
+) -> List[int]:
+    if "manager_id" in changes:
+        await lock_hierarchy(db)
+    old_states = await _lock_bulk_targets(db, ids, filters)
+    if not old_states:
+        await db.rollback()
+        return []
+    target_ids = [old["id"] for old in old_states]
+
+    if "manager_id" in changes:
+        await check_manager_change(db, target_ids, changes["manager_id"])
+
+    result = await db.execute(
+        update(Employee)
+        .where(Employee.id.in_(target_ids))
+        .values(**changes)
+        .returning(Employee.id)
+        .execution_options(synchronize_session=False)
+    )
+    affected = list(result.scalars().all())
+
+    if "tech_stack" in changes and affected:
+        await replace_skills(db, affected, changes["tech_stack"])
+    if "manager_id" in changes and affected:
+        await move_subtrees(db, affected)
+
+    deltas = Counter()
+    for old in old_states:
+        deltas.update(rollup_deltas(old, {**old, **changes}))
+    await apply_rollup_deltas(db, deltas)
+
+    await db.commit()
+    if affected:
+        response_cache.invalidate(EMPLOYEES)
+    return affected
+
+
+# ---------------------------
+# Bulk Delete (single DELETE ... RETURNING)
+# ---------------------------
+async def bulk_delete_employees(
+    db: AsyncSession,
+    ids: Optional[List[int]] = None,
+    filters: Optional[dict] = None
+) -> List[int]:
+    await lock_hierarchy(db)
+    targets = await _lock_bulk_targets(db, ids, filters)
+    if not targets:
+        await db.rollback()
+        return []
+    target_ids = [target["id"] for target in targets]
+
+    await detach_subtrees(db, target_ids, include_self=True)
+    result = await db.execute(
+        delete(Employee)
+        .where(Employee.id.in_(target_ids))
+        .returning(Employee.id, *[getattr(Employee, c) for c in ROLLUP_COLUMNS])
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+
+    deltas = Counter()
+    for row in rows:
+        deltas.update(rollup_deltas(old=dict(row._mapping)))
+    await apply_rollup_deltas(db, deltas)
+
+    await db.commit()
+    if rows:
+        response_cache.invalidate(EMPLOYEES)
+    return [row.id for row in rows]
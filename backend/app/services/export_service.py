@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import AsyncIterator
+
+from sqlalchemy import select
+
+from app.models.employee import Employee
+from app.schemas.employee import EmployeeResponse
+
+EXPORT_BATCH_SIZE = 1000
+
+NDJSON = "ndjson"
+CSV = "csv"
+
+# Same fields as EmployeeResponse, id first
+EXPORT_FIELDS = ["id"] + [f for f in EmployeeResponse.model_fields if f != "id"]
+
+
+def _json_default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _encode_csv(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        ["" if v is None else v.isoformat() if isinstance(v, date) else v for v in row]
+        for row in rows
+    )
+    return buffer.getvalue().encode()
+
+
+def _encode_ndjson(rows) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, row)), default=_json_default) + "\n"
+        for row in rows
+    ).encode()
+
+
+# ---------------------------
+# Stream All Employees (server-side cursor)
+# ---------------------------
+async def stream_employees(session_factory, fmt: str = NDJSON) -> AsyncIterator[bytes]:
+    # Opens its own session: the response body is produced after the endpoint returns
+    encode = _encode_csv if fmt == CSV else _encode_ndjson
+
+    if fmt == CSV:
+        yield _encode_csv([EXPORT_FIELDS])
+
+    async with session_factory() as db:
+        result = await db.stream(
+            select(*[getattr(Employee, f) for f in EXPORT_FIELDS])
+            .order_by(Employee.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        # Only one batch of rows is held in memory at a time
+        async for partition in result.partitions():
+            yield encode(partition)
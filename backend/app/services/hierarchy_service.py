@@ -0,0 +1,128 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, literal, literal_column, cast, String
+from fastapi import HTTPException
+from typing import Optional, List
+
+from app.models.employee import Employee
+from app.schemas.employee import EmployeeResponse
+
+
+DEFAULT_HIERARCHY_FIELDS = ("id", "name", "role_id", "department_id")
+
+# Upper bound on the recursive walk; cycles are cut separately via the visited path
+MAX_HIERARCHY_DEPTH = 100
+
+
+# ---------------------------
+# Parse ?fields= into Columns
+# ---------------------------
+def parse_fields(fields: Optional[str], default=DEFAULT_HIERARCHY_FIELDS) -> List[str]:
+    if not fields:
+        return list(default)
+
+    requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in EmployeeResponse.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown employee fields: {', '.join(unknown)}"
+        )
+
+    # id is always returned so clients can address nodes
+    if "id" not in requested:
+        requested.insert(0, "id")
+    return requested
+
+
+# ---------------------------
+# Fetch Subtree (single recursive CTE)
+# ---------------------------
+async def fetch_subtree_rows(
+    db: AsyncSession,
+    root_id: Optional[int] = None,
+    max_depth: Optional[int] = None,
+    fields: Optional[List[str]] = None
+):
+    fields = fields or list(DEFAULT_HIERARCHY_FIELDS)
+    depth_limit = MAX_HIERARCHY_DEPTH if max_depth is None else min(max_depth, MAX_HIERARCHY_DEPTH)
+
+    # Visited ids as ",1,5,9,": a manager cycle in existing data stops at the first repeat
+    separator = literal_column("','")
+    node_key = separator + cast(Employee.id, String) + separator
+
+    # Anchor: a single employee, or every root (no manager) for the full tree
+    anchor = select(Employee.id, literal(0).label("depth"), node_key.label("path"))
+    if root_id is None:
+        anchor = anchor.where(Employee.manager_id.is_(None))
+    else:
+        anchor = anchor.where(Employee.id == root_id)
+
+    tree = anchor.cte("org_tree", recursive=True)
+    tree = tree.union_all(
+        select(
+            Employee.id,
+            (tree.c.depth + 1).label("depth"),
+            (tree.c.path + cast(Employee.id, String) + separator).label("path")
+        )
+        .join(tree, Employee.manager_id == tree.c.id)
+        .where(tree.c.depth < depth_limit, tree.c.path.not_like("%" + node_key + "%"))
+    )
+
+    columns = [getattr(Employee, f) for f in fields if f not in ("id", "manager_id")]
+    result = await db.execute(
+        select(Employee.id, Employee.manager_id, tree.c.depth, *columns)
+        .join(tree, Employee.id == tree.c.id)
+        .order_by(tree.c.depth, Employee.id)
+    )
+    return result.all()
+
+
+# ---------------------------
+# Assemble Nested Tree (O(n))
+# ---------------------------
+def assemble_tree(rows, fields: List[str]) -> List[dict]:
+    nodes = {}
+    roots = []
+
+    # Rows arrive ordered by depth, so a parent is always seen before its children
+    for row in rows:
+        mapping = row._mapping
+        node = {f: mapping[f] for f in fields}
+        node["subordinates"] = []
+        nodes[row.id] = node
+
+        parent = nodes.get(row.manager_id) if row.depth > 0 else None
+        if parent is None:
+            roots.append(node)
+        else:
+            parent["subordinates"].append(node)
+
+    return roots
+
+
+# ---------------------------
+# Hierarchy Under One Employee
+# ---------------------------
+async def get_employee_hierarchy(
+    db: AsyncSession,
+    employee_id: int,
+    max_depth: Optional[int] = None,
+    fields: Optional[List[str]] = None
+) -> Optional[dict]:
+    fields = fields or list(DEFAULT_HIERARCHY_FIELDS)
+    rows = await fetch_subtree_rows(db, employee_id, max_depth, fields)
+    roots = assemble_tree(rows, fields)
+    return roots[0] if roots else None
+
+
+# ---------------------------
+# Full Org Tree (all roots)
+# ---------------------------
+async def get_org_tree(
+    db: AsyncSession,
+    max_depth: Optional[int] = None,
+    fields: Optional[List[str]] = None
+) -> List[dict]:
+    fields = fields or list(DEFAULT_HIERARCHY_FIELDS)
+    rows = await fetch_subtree_rows(db, None, max_depth, fields)
+    return assemble_tree(rows, fields)
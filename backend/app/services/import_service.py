@@ -0,0 +1,286 @@
+import csv
+import json
+from collections import Counter
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError, DBAPIError
+from pydantic import ValidationError
+
+from app.cache import response_cache, EMPLOYEES
+from app.config import settings
+from app.loaders import loaders_for
+from app.models.employee import Employee
+from app.models.employee_skill import EmployeeSkill
+from app.schemas.employee import EmployeeImportRow
+from app.services.rollup_service import rollup_deltas, apply_rollup_deltas
+from app.services.skill_service import parse_skills
+from app.services.closure_service import add_closure_nodes, attach_subtrees, link_levels
+
+IMPORT_CHUNK_SIZE = 1000
+
+NDJSON = "ndjson"
+CSV = "csv"
+
+
+# ---------------------------
+# Line Splitting (request body or spooled file)
+# ---------------------------
+def _line_too_long():
+    return HTTPException(413, f"Import lines are limited to {settings.import_max_line_bytes} bytes")
+
+
+async def split_lines(chunks: AsyncIterator[bytes]):
+    # Only one partial line is held at a time, and never more than the line limit
+    limit = settings.import_max_line_bytes
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if len(line) > limit:
+                raise _line_too_long()
+            yield line.decode("utf-8-sig").rstrip("\r")
+        if len(buffer) > limit:
+            raise _line_too_long()
+    if buffer:
+        yield buffer.decode("utf-8-sig").rstrip("\r")
+
+
+# ---------------------------
+# Record Parsing
+# ---------------------------
+async def _ndjson_records(lines: AsyncIterator[str]):
+    row = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield row, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield row, None, "Each line must be a JSON object"
+            continue
+        yield row, record, None
+
+
+async def _csv_records(lines: AsyncIterator[str]):
+    header = None
+    pending = ""
+    row = 0
+    async for line in lines:
+        # A quoted field may span lines; wait until the quotes balance
+        pending = f"{pending}\n{line}" if pending else line
+        if pending.count('"') % 2:
+            if len(pending) > settings.import_max_line_bytes:
+                raise _line_too_long()
+            continue
+        record, pending = pending, ""
+
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [h.strip() for h in values]
+            continue
+
+        row += 1
+        if len(values) != len(header):
+            yield row, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        # Empty CSV cells mean "not set"
+        yield row, {k: (v if v != "" else None) for k, v in zip(header, values)}, None
+
+
+def _validation_messages(exc: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}"
+        for err in exc.errors(include_url=False)
+    ]
+
+
+# ---------------------------
+# Referenced Rows (one batched lookup per model and chunk)
+# ---------------------------
+REFERENCES = (
+    ("department_id", "departments", "department"),
+    ("role_id", "roles", "role"),
+    ("manager_id", "employees", "employee"),
+)
+
+
+async def _check_references(db: AsyncSession, chunk: List[Tuple[int, EmployeeImportRow]], errors: list):
+    # Rows naming a missing department, role or manager are rejected up front; otherwise
+    # one of them fails the chunk insert and every row falls back to its own savepoint
+    loaders = loaders_for(db)
+    missing = {}
+    for column, loader, _ in REFERENCES:
+        ids = list({getattr(row, column) for _, row in chunk} - {None})
+        found = await getattr(loaders, loader).load_many(ids)
+        missing[column] = {key for key, row in zip(ids, found) if row is None}
+
+    valid = []
+    for row_no, row in chunk:
+        problems = [
+            f"{column}: unknown {label} {getattr(row, column)}"
+            for column, _, label in REFERENCES
+            if getattr(row, column) in missing[column]
+        ]
+        if problems:
+            errors.append({"row": row_no, "errors": problems})
+        else:
+            valid.append((row_no, row))
+    return valid
+
+
+# ---------------------------
+# Chunk Insert
+# ---------------------------
+async def _insert_chunk(db: AsyncSession, chunk: List[Tuple[int, EmployeeImportRow]], errors: list):
+    chunk = await _check_references(db, chunk, errors)
+    if not chunk:
+        return []
+
+    values = [row.model_dump(exclude={"ref", "manager_ref"}) for _, row in chunk]
+
+    try:
+        result = await db.execute(
+            insert(Employee).returning(Employee.id, sort_by_parameter_order=True),
+            values
+        )
+        inserted = list(zip(chunk, values, result.scalars().all()))
+    except (IntegrityError, DBAPIError):
+        # Isolate the offending rows instead of failing the whole chunk
+        await db.rollback()
+        inserted = []
+        for (row_no, row), row_values in zip(chunk, values):
+            try:
+                async with db.begin_nested():
+                    result = await db.execute(insert(Employee).values(**row_values).returning(Employee.id))
+                inserted.append(((row_no, row), row_values, result.scalar_one()))
+            except (IntegrityError, DBAPIError) as exc:
+                errors.append({"row": row_no, "errors": [str(exc.orig).strip().splitlines()[0]]})
+
+    skills = [
+        {"employee_id": emp_id, "skill": skill}
+        for _, row_values, emp_id in inserted
+        for skill in parse_skills(row_values["tech_stack"])
+    ]
+    if skills:
+        await db.execute(insert(EmployeeSkill), skills)
+
+    await add_closure_nodes(db, [emp_id for _, _, emp_id in inserted])
+    managed = [emp_id for _, row_values, emp_id in inserted if row_values["manager_id"] is not None]
+    if managed:
+        # New rows are leaves, so one statement links them all
+        await attach_subtrees(db, managed)
+
+    deltas = Counter()
+    for _, row_values, _ in inserted:
+        deltas.update(rollup_deltas(new=row_values))
+    await apply_rollup_deltas(db, deltas)
+
+    await db.commit()
+    return [(row_no, row, emp_id) for (row_no, row), _, emp_id in inserted]
+
+
+# ---------------------------
+# Resolve manager_ref Links
+# ---------------------------
+async def _resolve_manager_refs(db: AsyncSession, pending: list, refs: Dict[str, int], warnings: list):
+    # The rows are already inserted, so problems here are warnings, not failures
+    links = {}
+    rows = {}
+    for row_no, emp_id, manager_ref in pending:
+        manager_id = refs.get(manager_ref)
+        if manager_id is None:
+            warnings.append({"row": row_no, "errors": [f"manager_ref: unknown ref '{manager_ref}', inserted without a manager"]})
+        else:
+            links[emp_id] = manager_id
+            rows[emp_id] = row_no
+
+    # Managers are linked before their reports so each closure insert sees a complete chain
+    levels, cyclic = link_levels(links)
+    for emp_id in cyclic:
+        warnings.append({"row": rows[emp_id], "errors": ["manager_ref: reporting cycle, inserted without a manager"]})
+
+    for level in levels:
+        for start in range(0, len(level), IMPORT_CHUNK_SIZE):
+            batch = level[start:start + IMPORT_CHUNK_SIZE]
+            # ORM bulk UPDATE by primary key (executemany)
+            await db.execute(update(Employee), [{"id": emp_id, "manager_id": links[emp_id]} for emp_id in batch])
+            await attach_subtrees(db, batch)
+            await db.commit()
+            response_cache.invalidate(EMPLOYEES)
+
+
+# ---------------------------
+# Bulk Import (NDJSON / CSV)
+# ---------------------------
+async def import_employees(
+    db: AsyncSession,
+    lines: AsyncIterator[str],
+    fmt: str = NDJSON,
+    on_progress: Optional[Callable[[int, int], Awaitable]] = None
+) -> dict:
+    # on_progress(inserted, failed) is awaited after every committed chunk
+    records = _csv_records(lines) if fmt == CSV else _ndjson_records(lines)
+
+    errors = []
+    warnings = []
+    refs: Dict[str, int] = {}
+    pending_refs = []
+    inserted = 0
+    chunk = []
+
+    async def flush():
+        nonlocal inserted, chunk
+        if not chunk:
+            return
+        rows = await _insert_chunk(db, chunk, errors)
+        for row_no, row, emp_id in rows:
+            inserted += 1
+            if row.ref:
+                refs[row.ref] = emp_id
+            if row.manager_ref:
+                pending_refs.append((row_no, emp_id, row.manager_ref))
+        chunk = []
+        # Committed rows are visible to readers now, not only once the stream ends
+        if rows:
+            response_cache.invalidate(EMPLOYEES)
+        if on_progress is not None:
+            await on_progress(inserted, len(errors))
+
+    seen_refs = set()
+    async for row_no, record, parse_error in records:
+        if parse_error:
+            errors.append({"row": row_no, "errors": [parse_error]})
+            continue
+
+        try:
+            row = EmployeeImportRow.model_validate(record)
+        except ValidationError as exc:
+            errors.append({"row": row_no, "errors": _validation_messages(exc)})
+            continue
+
+        if row.ref is not None:
+            if row.ref in seen_refs:
+                errors.append({"row": row_no, "errors": [f"ref: duplicate ref '{row.ref}'"]})
+                continue
+            seen_refs.add(row.ref)
+
+        chunk.append((row_no, row))
+        if len(chunk) >= IMPORT_CHUNK_SIZE:
+            await flush()
+
+    await flush()
+    await _resolve_manager_refs(db, pending_refs, refs, warnings)
+
+    errors.sort(key=lambda e: e["row"])
+    warnings.sort(key=lambda e: e["row"])
+    return {"inserted": inserted, "failed": len(errors), "errors": errors, "warnings": warnings}
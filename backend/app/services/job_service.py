@@ -0,0 +1,176 @@
+import glob
+import os
+import tempfile
+import time
+from typing import AsyncIterator, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import response_cache, EMPLOYEES
+from app.config import settings
+from app.jobs import JobContext, job_kind, unfinished_job_params
+from app.migrations import maintenance_lock
+from app.services.analytics_service import (
+    get_headcount_summary,
+    get_experience_histogram,
+    get_department_headcounts,
+    get_role_headcounts,
+    get_joining_year_counts,
+    get_resignation_trend
+)
+from app.services.closure_service import rebuild_closure
+from app.services.hierarchy_service import get_org_tree, parse_fields
+from app.services.import_service import import_employees, split_lines, CSV, NDJSON
+from app.services.rollup_service import rebuild_rollups
+from app.services.skill_service import backfill_skills
+
+# Job kinds are registered on import; app.main imports this module.
+
+IMPORT_JOB = "import-employees"
+# Uploads for import jobs are spooled to the temp dir under this prefix
+IMPORT_SPOOL_PREFIX = "fasthr-import-"
+# Spool file I/O runs in the threadpool, in blocks of this size
+SPOOL_BLOCK_BYTES = 1_048_576
+
+
+# ---------------------------
+# Org Tree (GET /structure/tree as a job)
+# ---------------------------
+class OrgTreeParams(BaseModel):
+    max_depth: Optional[int] = Field(None, ge=0)
+    fields: Optional[str] = None
+
+
+@job_kind("org-tree", OrgTreeParams, read_only=True)
+async def org_tree_job(db: AsyncSession, params: OrgTreeParams, job: JobContext):
+    return await get_org_tree(db, params.max_depth, parse_fields(params.fields))
+
+
+# ---------------------------
+# Analytics Snapshot (every aggregate in one job)
+# ---------------------------
+ANALYTICS_STEPS = (
+    ("headcount", get_headcount_summary),
+    ("experience_buckets", get_experience_histogram),
+    ("departments", get_department_headcounts),
+    ("roles", get_role_headcounts),
+    ("joining_years", get_joining_year_counts),
+    ("resignation_trend", get_resignation_trend),
+)
+
+
+@job_kind("analytics", read_only=True)
+async def analytics_job(db: AsyncSession, params: BaseModel, job: JobContext):
+    result = {}
+    for done, (name, compute) in enumerate(ANALYTICS_STEPS):
+        await job.progress(done, len(ANALYTICS_STEPS), name)
+        value = await compute(db)
+        # Row lists come back as (label, count) pairs
+        result[name] = value if isinstance(value, dict) else [list(row) for row in value]
+    return result
+
+
+# ---------------------------
+# Derived Table Rebuilds (as `python -m app.manage` runs them)
+# ---------------------------
+@job_kind("rebuild-rollups")
+async def rebuild_rollups_job(db: AsyncSession, params: BaseModel, job: JobContext):
+    async with maintenance_lock():
+        await rebuild_rollups(db)
+    return {"rebuilt": "analytics_rollups"}
+
+
+@job_kind("rebuild-closure")
+async def rebuild_closure_job(db: AsyncSession, params: BaseModel, job: JobContext):
+    async with maintenance_lock():
+        await rebuild_closure(db)
+    response_cache.invalidate(EMPLOYEES)
+    return {"rebuilt": "employee_closure"}
+
+
+@job_kind("backfill-skills")
+async def backfill_skills_job(db: AsyncSession, params: BaseModel, job: JobContext):
+    async with maintenance_lock():
+        await backfill_skills(db)
+    response_cache.invalidate(EMPLOYEES)
+    return {"rebuilt": "employee_skills"}
+
+
+# ---------------------------
+# Bulk Import from a Spooled Upload (POST /employees/bulk/jobs)
+# ---------------------------
+class ImportParams(BaseModel):
+    path: str
+    format: str = Field(NDJSON, pattern=f"^({NDJSON}|{CSV})$")
+
+
+async def spool_upload(chunks: AsyncIterator[bytes], fmt: str) -> str:
+    # Disk writes stay off the event loop; small request chunks are written in blocks
+    upload = await run_in_threadpool(
+        tempfile.NamedTemporaryFile, prefix=IMPORT_SPOOL_PREFIX, suffix=f".{fmt}", delete=False
+    )
+    try:
+        block = bytearray()
+        async for chunk in chunks:
+            block += chunk
+            if len(block) >= SPOOL_BLOCK_BYTES:
+                await run_in_threadpool(upload.write, bytes(block))
+                block.clear()
+        await run_in_threadpool(upload.write, bytes(block))
+        await run_in_threadpool(upload.close)
+    except BaseException:
+        # e.g. the client disconnected mid-upload
+        upload.close()
+        os.remove(upload.name)
+        raise
+    return upload.name
+
+
+async def _file_chunks(path: str):
+    f = await run_in_threadpool(open, path, "rb")
+    try:
+        while True:
+            block = await run_in_threadpool(f.read, SPOOL_BLOCK_BYTES)
+            if not block:
+                break
+            yield block
+    finally:
+        await run_in_threadpool(f.close)
+
+
+def _remove_upload(params: ImportParams):
+    try:
+        os.remove(params.path)
+    except FileNotFoundError:
+        pass
+
+
+# Internal: the path points at a server-side temp file, so clients cannot submit it directly
+@job_kind(IMPORT_JOB, ImportParams, public=False, discard=_remove_upload)
+async def import_employees_job(db: AsyncSession, params: ImportParams, job: JobContext):
+    async def on_progress(inserted: int, failed: int):
+        await job.progress(inserted + failed, message=f"{inserted} inserted, {failed} failed")
+
+    try:
+        return await import_employees(db, split_lines(_file_chunks(params.path)), params.format, on_progress)
+    finally:
+        await run_in_threadpool(_remove_upload, params)
+
+
+async def sweep_import_spool(db: AsyncSession) -> int:
+    # Startup: uploads left by a crash. Files still referenced by an unfinished job (possibly
+    # another process's) are kept, as are recent ones that may still be uploading.
+    referenced = {params.get("path") for params in await unfinished_job_params(db, IMPORT_JOB)}
+    cutoff = time.time() - settings.job_timeout_seconds
+
+    removed = 0
+    for path in glob.glob(os.path.join(tempfile.gettempdir(), f"{IMPORT_SPOOL_PREFIX}*")):
+        try:
+            if path not in referenced and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
@@ -0,0 +1,73 @@
+import base64
+import json
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+# ---------------------------
+# Opaque Cursor Encoding
+# ---------------------------
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(list(values), separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _cursor_value(value: Any, key) -> Any:
+    # A cursor value must match its key column's type, or the comparison fails in the database
+    try:
+        python_type = key.type.python_type
+    except (AttributeError, NotImplementedError):
+        python_type = None
+
+    if isinstance(value, bool) or value is None:
+        raise ValueError(value)
+    if python_type is int and isinstance(value, int):
+        return value
+    if python_type is float and isinstance(value, (int, float)):
+        return float(value)
+    if python_type is str and isinstance(value, str):
+        return value
+    if python_type is None and isinstance(value, (int, float, str)):
+        return value
+    raise ValueError(value)
+
+
+def decode_cursor(cursor: str, keys: Sequence) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError(values)
+        return [_cursor_value(value, key) for value, key in zip(values, keys)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+# ---------------------------
+# Keyset Pagination
+# ---------------------------
+def apply_keyset(query, keys: Sequence, cursor: Optional[str], limit: int, descending: bool = False):
+    # keys must end with a unique column so the ordering is total
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        if descending:
+            query = query.where(tuple_(*keys) < tuple_(*values))
+        else:
+            query = query.where(tuple_(*keys) > tuple_(*values))
+
+    order = [k.desc() for k in keys] if descending else list(keys)
+    # Fetch one extra row to know whether another page exists
+    return query.order_by(*order).limit(limit + 1)
+
+
+def split_page(rows: Sequence, limit: int, key_values):
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(key_values(rows[-1]))
@@ -4,7 +4,11 @@ from typing import List, Optional
 
 from app.models.role import Role
 from app.models.employee import Employee
+from app.services.employee_service import EMPLOYEE_FIELDS, employee_columns
 from app.schemas.role import RoleCreate, RoleUpdate
+from app.services.rollup_service import ROLE, release_rollup_bucket
+from app.loaders import loaders_for
+from app.cache import response_cache, ROLES, EMPLOYEES
 
 
 # ---------------------------
@@ -14,6 +18,7 @@ async def create_role(db: AsyncSession, payload: RoleCreate) -> Role:
     role = Role(**payload.model_dump())
     db.add(role)
     await db.commit()
+    response_cache.invalidate(ROLES)
     await db.refresh(role)
     return role
 
@@ -30,8 +35,7 @@ async def list_roles(db: AsyncSession) -> List[Role]:
 # Get Role
 # ---------------------------
 async def get_role(db: AsyncSession, role_id: int) -> Optional[Role]:
-    result = await db.execute(select(Role).where(Role.id == role_id))
-    return result.scalars().first()
+    return await loaders_for(db).roles.load(role_id)
 
 
 # ---------------------------
@@ -44,6 +48,7 @@ async def update_role(db: AsyncSession, role_id: int, payload: RoleUpdate):
         .values(**payload.model_dump(exclude_none=True))
     )
     await db.commit()
+    response_cache.invalidate(ROLES)
     return await get_role(db, role_id)
 
 
@@ -52,13 +57,20 @@ async def update_role(db: AsyncSession, role_id: int, payload: RoleUpdate):
 # ---------------------------
 async def delete_role(db: AsyncSession, role_id: int) -> bool:
     await db.execute(delete(Role).where(Role.id == role_id))
+    await release_rollup_bucket(db, ROLE, role_id)
     await db.commit()
+    response_cache.invalidate(ROLES, EMPLOYEES)
     return True
 
 
 # ---------------------------
 # Get Employees Under Role
 # ---------------------------
-async def get_role_employees(db: AsyncSession, role_id: int):
-    result = await db.execute(select(Employee).where(Employee.role_id == role_id))
-    return result.scalars().all()
+async def get_role_employees(db: AsyncSession, role_id: int, fields=EMPLOYEE_FIELDS):
+    # Plain dicts of the requested columns only
+    result = await db.execute(
+        select(*employee_columns(fields))
+        .where(Employee.role_id == role_id)
+        .order_by(Employee.id)
+    )
+    return [dict(zip(fields, row)) for row in result]
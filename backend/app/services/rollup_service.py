@@ -0,0 +1,189 @@
+from collections import Counter
+from datetime import date
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete, func, literal, Integer
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.analytics_rollup import AnalyticsRollup
+from app.models.employee import Employee
+from app.models.employee_closure import EmployeeClosure
+from app.cache import response_cache, EMPLOYEES
+
+
+# Rollup dimensions kept in analytics_rollups
+DEPARTMENT = "department"
+ROLE = "role"
+JOINING_YEAR = "joining_year"
+RESIGNATION_YEAR = "resignation_year"
+# Per-manager spans (bucket = manager id), kept in step with employee_closure by closure_service
+DIRECT_REPORTS = "direct_reports"
+TOTAL_REPORTS = "total_reports"
+SPAN_DIMENSIONS = (DIRECT_REPORTS, TOTAL_REPORTS)
+
+# Employee columns that feed the rollups
+ROLLUP_COLUMNS = ("department_id", "role_id", "year_of_joining", "resignation_date")
+
+# Stored bucket for "no department / role / year": NULLs would never conflict in the
+# unique constraint, so concurrent first writes could each insert a row. Ids and years are > 0.
+UNASSIGNED_BUCKET = 0
+
+
+def _stored_bucket(bucket: Optional[int]) -> int:
+    return UNASSIGNED_BUCKET if bucket is None else bucket
+
+
+# ---------------------------
+# Rollup Keys for One Employee
+# ---------------------------
+def employee_rollup_keys(values: dict):
+    keys = [
+        (DEPARTMENT, values.get("department_id")),
+        (ROLE, values.get("role_id")),
+        (JOINING_YEAR, values.get("year_of_joining")),
+    ]
+
+    resigned_on: Optional[date] = values.get("resignation_date")
+    if resigned_on is not None:
+        keys.append((RESIGNATION_YEAR, resigned_on.year))
+
+    return keys
+
+
+# ---------------------------
+# Deltas Between Two Employee States
+# ---------------------------
+def rollup_deltas(old: Optional[dict] = None, new: Optional[dict] = None) -> Counter:
+    # old=None for an insert, new=None for a delete
+    deltas = Counter()
+    if old is not None:
+        for key in employee_rollup_keys(old):
+            deltas[key] -= 1
+    if new is not None:
+        for key in employee_rollup_keys(new):
+            deltas[key] += 1
+    return deltas
+
+
+# ---------------------------
+# Apply Deltas (one upsert; caller commits)
+# ---------------------------
+def _dialect_insert(db: AsyncSession):
+    return postgresql.insert if db.bind.dialect.name == "postgresql" else sqlite.insert
+
+
+async def apply_rollup_deltas(db: AsyncSession, deltas: Counter):
+    # Sorted so concurrent writers lock counter rows in the same order
+    rows = sorted(
+        (dimension, _stored_bucket(bucket), delta)
+        for (dimension, bucket), delta in deltas.items()
+        if delta != 0
+    )
+    if not rows:
+        return
+
+    stmt = _dialect_insert(db)(AnalyticsRollup).values([
+        {"dimension": dimension, "bucket": bucket, "count": delta}
+        for dimension, bucket, delta in rows
+    ])
+    # ON CONFLICT makes the first write to a bucket safe against a concurrent one
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[AnalyticsRollup.dimension, AnalyticsRollup.bucket],
+            set_={"count": AnalyticsRollup.count + stmt.excluded.count}
+        )
+    )
+
+
+# ---------------------------
+# Move a Deleted Group's Counter to "Unassigned"
+# ---------------------------
+async def release_rollup_bucket(db: AsyncSession, dimension: str, bucket: int):
+    # Mirrors ON DELETE SET NULL when a department or role is removed
+    result = await db.execute(
+        delete(AnalyticsRollup)
+        .where(AnalyticsRollup.dimension == dimension, AnalyticsRollup.bucket == bucket)
+        .returning(AnalyticsRollup.count)
+    )
+    moved = result.scalar()
+    if moved:
+        await apply_rollup_deltas(db, Counter({(dimension, None): moved}))
+
+
+# ---------------------------
+# Read One Dimension
+# ---------------------------
+async def list_rollup(db: AsyncSession, dimension: str):
+    bucket = func.nullif(AnalyticsRollup.bucket, UNASSIGNED_BUCKET)
+    result = await db.execute(
+        select(bucket, AnalyticsRollup.count)
+        .where(AnalyticsRollup.dimension == dimension, AnalyticsRollup.count > 0)
+        .order_by(bucket.asc().nulls_last())
+    )
+    return result.all()
+
+
+# ---------------------------
+# Full Rebuild (repair)
+# ---------------------------
+def _rollup_source(dimension: str, key):
+    key = func.coalesce(key, UNASSIGNED_BUCKET)
+    return (
+        select(literal(dimension), key, func.count())
+        .select_from(Employee)
+        .group_by(key)
+    )
+
+
+async def rebuild_rollups(db: AsyncSession):
+    resignation_year = func.extract("year", Employee.resignation_date).cast(Integer)
+    sources = (
+        _rollup_source(DEPARTMENT, Employee.department_id),
+        _rollup_source(ROLE, Employee.role_id),
+        _rollup_source(JOINING_YEAR, Employee.year_of_joining),
+        _rollup_source(RESIGNATION_YEAR, resignation_year)
+        .where(Employee.resignation_date.is_not(None)),
+    )
+
+    await db.execute(delete(AnalyticsRollup))
+    for source in sources + _span_sources():
+        await db.execute(
+            insert(AnalyticsRollup).from_select(
+                ["dimension", "bucket", "count"], source
+            )
+        )
+    await db.commit()
+    response_cache.invalidate(EMPLOYEES)
+
+
+def _span_sources():
+    def spans(dimension: str, condition):
+        return (
+            select(literal(dimension), EmployeeClosure.ancestor_id, func.count())
+            .where(condition)
+            .group_by(EmployeeClosure.ancestor_id)
+        )
+
+    return (
+        spans(DIRECT_REPORTS, EmployeeClosure.depth == 1),
+        spans(TOTAL_REPORTS, EmployeeClosure.depth > 0),
+    )
+
+
+async def rebuild_span_rollups(db: AsyncSession):
+    # After employee_closure itself was rebuilt; caller commits
+    await db.execute(delete(AnalyticsRollup).where(AnalyticsRollup.dimension.in_(SPAN_DIMENSIONS)))
+    for source in _span_sources():
+        await db.execute(
+            insert(AnalyticsRollup).from_select(
+                ["dimension", "bucket", "count"], source
+            )
+        )
+
+
+async def ensure_rollups(db: AsyncSession):
+    # Seed the table once for databases that predate the rollups
+    result = await db.execute(select(AnalyticsRollup.id).limit(1))
+    if result.first() is None:
+        await rebuild_rollups(db)
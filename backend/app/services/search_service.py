@@ -0,0 +1,65 @@
+import re
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, case, or_, Float
+from typing import List, Optional, Tuple
+
+from app.models.employee import Employee
+from app.services.pagination import DEFAULT_PAGE_SIZE, apply_keyset, split_page
+
+
+# ---------------------------
+# Match + Rank Expressions
+# ---------------------------
+def _text_match(db: AsyncSession, column, q: str, prefix: bool):
+    if db.bind.dialect.name != "postgresql":
+        # Fallback for non-Postgres databases (tests, local copies): prefix hits first
+        if prefix:
+            match = or_(column.istartswith(q, autoescape=True), column.icontains(f" {q}", autoescape=True))
+        else:
+            match = column.icontains(q, autoescape=True)
+        rank = case((column.istartswith(q, autoescape=True), 1.0), else_=0.5)
+        return match, rank
+
+    if prefix:
+        # Typeahead: q must start a word; the trigram GIN index serves ~* too
+        match = column.regexp_match(r"\m" + re.escape(q), flags="i")
+    else:
+        # ILIKE '%q%' plus the similarity operator for near-miss spellings
+        match = or_(column.icontains(q, autoescape=True), column.op("%")(q))
+
+    rank = func.word_similarity(q, column, type_=Float)
+    return match, rank
+
+
+async def _ranked_search(
+    db: AsyncSession,
+    column,
+    q: str,
+    prefix: bool,
+    cursor: Optional[str],
+    limit: int
+) -> Tuple[List[Employee], Optional[str]]:
+    match, rank = _text_match(db, column, q, prefix)
+    rank = rank.label("rank")
+
+    query = select(Employee, rank).where(match)
+    result = await db.execute(
+        apply_keyset(query, [rank, Employee.id], cursor, limit, descending=True)
+    )
+    rows, next_cursor = split_page(result.all(), limit, lambda row: [row.rank, row.Employee.id])
+    return [row.Employee for row in rows], next_cursor
+
+
+# ---------------------------
+# Search Employees by Name
+# ---------------------------
+async def search_employees_by_name(
+    db: AsyncSession,
+    q: str,
+    prefix: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+):
+    return await _ranked_search(db, Employee.name, q, prefix, cursor, limit)
+
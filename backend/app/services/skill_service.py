@@ -0,0 +1,161 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete, func
+from fastapi import HTTPException
+from typing import Dict, List, Optional, Tuple
+
+from app.models.employee import Employee
+from app.models.employee_skill import EmployeeSkill
+from app.services.pagination import DEFAULT_PAGE_SIZE, apply_keyset, split_page
+
+SKILL_MAX_LENGTH = 100
+BACKFILL_BATCH_SIZE = 1000
+
+
+# ---------------------------
+# Split a tech_stack String
+# ---------------------------
+def parse_skills(tech_stack: Optional[str]) -> List[str]:
+    if not tech_stack:
+        return []
+
+    skills = []
+    for part in tech_stack.split(","):
+        skill = part.strip().lower()[:SKILL_MAX_LENGTH]
+        if skill and skill not in skills:
+            skills.append(skill)
+    return skills
+
+
+# ---------------------------
+# Keep employee_skills in Sync (caller commits)
+# ---------------------------
+async def sync_employee_skills(db: AsyncSession, employee_id: int, tech_stack: Optional[str]):
+    await db.execute(delete(EmployeeSkill).where(EmployeeSkill.employee_id == employee_id))
+
+    skills = parse_skills(tech_stack)
+    if skills:
+        await db.execute(
+            insert(EmployeeSkill),
+            [{"employee_id": employee_id, "skill": skill} for skill in skills]
+        )
+
+
+async def replace_skills(db: AsyncSession, employee_ids: List[int], tech_stack: Optional[str]):
+    # Same tech_stack applied to many employees (bulk update)
+    await db.execute(delete(EmployeeSkill).where(EmployeeSkill.employee_id.in_(employee_ids)))
+
+    skills = parse_skills(tech_stack)
+    if skills:
+        await db.execute(
+            insert(EmployeeSkill),
+            [{"employee_id": emp_id, "skill": skill} for emp_id in employee_ids for skill in skills]
+        )
+
+
+# ---------------------------
+# Backfill from Existing tech_stack Strings
+# ---------------------------
+async def backfill_skills(db: AsyncSession):
+    await db.execute(delete(EmployeeSkill))
+
+    last_id = 0
+    while True:
+        result = await db.execute(
+            select(Employee.id, Employee.tech_stack)
+            .where(Employee.id > last_id, Employee.tech_stack.is_not(None))
+            .order_by(Employee.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        )
+        batch = result.all()
+        if not batch:
+            break
+
+        rows = [
+            {"employee_id": emp_id, "skill": skill}
+            for emp_id, tech_stack in batch
+            for skill in parse_skills(tech_stack)
+        ]
+        if rows:
+            await db.execute(insert(EmployeeSkill), rows)
+        last_id = batch[-1].id
+
+    await db.commit()
+
+
+async def ensure_skills(db: AsyncSession):
+    # Split existing tech_stack strings once for databases that predate employee_skills
+    has_skills = await db.execute(select(EmployeeSkill.employee_id).limit(1))
+    if has_skills.first() is not None:
+        return
+
+    has_stacks = await db.execute(
+        select(Employee.id).where(Employee.tech_stack.is_not(None)).limit(1)
+    )
+    if has_stacks.first() is not None:
+        await backfill_skills(db)
+
+
+# ---------------------------
+# Parse ?skill= Values
+# ---------------------------
+def normalize_skill_query(skills: List[str]) -> List[str]:
+    # Accepts repeated ?skill= params as well as comma-separated values
+    normalized = []
+    for value in skills:
+        for skill in parse_skills(value):
+            if skill not in normalized:
+                normalized.append(skill)
+
+    if not normalized:
+        raise HTTPException(status_code=400, detail="At least one skill is required")
+    return normalized
+
+
+# ---------------------------
+# Employees Matching ANY / ALL Skills
+# ---------------------------
+async def search_employees_by_skills(
+    db: AsyncSession,
+    skills: List[str],
+    match_all: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+) -> Tuple[List[Employee], Optional[str]]:
+    matches = (
+        select(EmployeeSkill.employee_id)
+        .where(EmployeeSkill.skill.in_(skills))
+        .group_by(EmployeeSkill.employee_id)
+    )
+    if match_all:
+        matches = matches.having(func.count() == len(skills))
+
+    query = select(Employee).where(Employee.id.in_(matches))
+    result = await db.execute(apply_keyset(query, [Employee.id], cursor, limit))
+    rows, next_cursor = split_page(result.scalars().all(), limit, lambda emp: [emp.id])
+    return rows, next_cursor
+
+
+# ---------------------------
+# Per-skill Headcounts
+# ---------------------------
+async def get_skill_headcounts(db: AsyncSession, skills: List[str]) -> Dict[str, int]:
+    result = await db.execute(
+        select(EmployeeSkill.skill, func.count())
+        .where(EmployeeSkill.skill.in_(skills))
+        .group_by(EmployeeSkill.skill)
+    )
+    counts = dict(result.all())
+    return {skill: counts.get(skill, 0) for skill in skills}
+
+
+async def list_top_skills(db: AsyncSession, prefix: Optional[str] = None, limit: int = 20):
+    query = select(EmployeeSkill.skill, func.count().label("count"))
+    if prefix:
+        query = query.where(EmployeeSkill.skill.startswith(prefix.strip().lower(), autoescape=True))
+
+    result = await db.execute(
+        query.group_by(EmployeeSkill.skill)
+        .order_by(func.count().desc(), EmployeeSkill.skill)
+        .limit(limit)
+    )
+    return result.all()
@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import event
+
+from app.database import AsyncSessionLocal, engine
+from app.schemas.employee import EmployeeCreate
+from app.services.dashboard_service import DASHBOARD_SECTIONS, dashboard_feed
+from app.services.employee_service import create_employee
+
+# Usage (from backend/, against a migrated database; adds --writes employees):
+#   python -m benchmarks.bench_dashboard_stream --viewers 1,10,100 --writes 20
+# Counts the SQL statements the live feed runs for N viewers while writes happen, next to
+# what N viewers polling all six /dashboard/* endpoints once per write would cost.
+
+
+async def run_viewers(viewers: int, writes: int, statements: dict) -> dict:
+    queues = [await dashboard_feed.subscribe() for _ in range(viewers)]
+    for queue in queues:
+        queue.get_nowait()  # initial snapshot
+
+    statements["count"] = 0
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        for i in range(writes):
+            await create_employee(db, EmployeeCreate(name=f"Stream Bench {i}", experience=i % 12))
+            # Spread writes over a few debounce windows, as real traffic would be
+            await asyncio.sleep(0.02)
+    while any(queue.empty() for queue in queues):
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+
+    for queue in queues:
+        dashboard_feed.unsubscribe(queue)
+    return {"statements": statements["count"], "seconds": elapsed}
+
+
+async def run(viewer_counts, writes: int):
+    statements = {"count": 0}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(*_):
+        statements["count"] += 1
+
+    # The writes themselves, with nobody watching
+    baseline = (await run_viewers(0, writes, statements))["statements"]
+
+    print(f"{'viewers':>8} {'feed stmts':>11} {'polling stmts':>14} {'seconds':>8}")
+    for viewers in viewer_counts:
+        result = await run_viewers(viewers, writes, statements)
+        feed = result["statements"] - baseline
+        polling = viewers * writes * len(DASHBOARD_SECTIONS)
+        print(f"{viewers:8} {feed:11} {polling:14} {result['seconds']:8.2f}")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB load of the live dashboard feed by number of viewers")
+    parser.add_argument("--viewers", default="1,10,100", help="Comma-separated viewer counts")
+    parser.add_argument("--writes", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run([int(v) for v in args.viewers.split(",")], args.writes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.config import settings
+from app.metrics import MetricsMiddleware, registry
+
+# Usage (from backend/, no database needed):
+#   python -m benchmarks.bench_metrics --requests 50000
+# Measures what MetricsMiddleware adds to each request, and how long a scrape takes.
+
+BODY = b'{"ok":true}'
+
+
+class FakeRoute:
+    def __init__(self, path: str):
+        self.path = path
+
+
+async def endpoint(scope, receive, send):
+    # Stands in for the routed app: sets the matched route like Starlette does
+    scope["route"] = FakeRoute(scope["path"])
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": BODY})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+def _scope(i: int) -> dict:
+    # Spread over a realistic number of routes so label lookups are not all one series
+    return {"type": "http", "method": "GET", "path": f"/route/{i % 40}"}
+
+
+# ---------------------------
+# Timing Helpers
+# ---------------------------
+async def per_request_us(app, requests: int, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for i in range(requests):
+            await app(_scope(i), receive, send)
+        samples.append((time.perf_counter() - start) / requests * 1e6)
+    return statistics.median(samples)
+
+
+async def run(requests: int, rounds: int):
+    wrapped = MetricsMiddleware(endpoint)
+
+    bare = await per_request_us(endpoint, requests, rounds)
+    settings.metrics_enabled = False
+    disabled = await per_request_us(wrapped, requests, rounds)
+    settings.metrics_enabled = True
+    enabled = await per_request_us(wrapped, requests, rounds)
+
+    print(f"{'case':32} {'us/request':>12} {'overhead us':>12}")
+    for label, value in (("bare app", bare), ("middleware, disabled", disabled), ("middleware, enabled", enabled)):
+        print(f"{label:32} {value:12.2f} {value - bare:12.2f}")
+
+    start = time.perf_counter()
+    body = registry.render()
+    print(f"\n/metrics render: {(time.perf_counter() - start) * 1000:.2f} ms, {len(body)} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the per-request cost of the metrics middleware")
+    parser.add_argument("--requests", type=int, default=50000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
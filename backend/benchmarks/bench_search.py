@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal, engine
+from app.models.employee import Employee
+from app.services.search_service import search_employees_by_name
+from app.services.skill_service import search_employees_by_skills
+
+# Usage (from backend/, against a populated database):
+#   python -m benchmarks.bench_search --queries john,smi,python --repeat 20
+
+
+# ---------------------------
+# Previous Implementations
+# ---------------------------
+async def legacy_name_search(db, q: str):
+    # First 100 rows, substring-matched in Python
+    result = await db.execute(select(Employee).offset(0).limit(100))
+    return [e for e in result.scalars().all() if q.lower() in e.name.lower()]
+
+
+async def legacy_skill_search(db, skill: str):
+    result = await db.execute(select(Employee).where(Employee.tech_stack.ilike(f"%{skill}%")))
+    return result.scalars().all()
+
+
+# ---------------------------
+# Timing Helpers
+# ---------------------------
+async def timed(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            await fn(db)
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+async def run(queries, repeat: int):
+    cases = []
+    for q in queries:
+        cases += [
+            (f"name  legacy  {q!r}", lambda db, q=q: legacy_name_search(db, q)),
+            (f"name  trigram {q!r}", lambda db, q=q: search_employees_by_name(db, q)),
+            (f"name  prefix  {q!r}", lambda db, q=q: search_employees_by_name(db, q, prefix=True)),
+            (f"skill legacy  {q!r}", lambda db, q=q: legacy_skill_search(db, q)),
+            (f"skill index   {q!r}", lambda db, q=q: search_employees_by_skills(db, [q.lower()])),
+        ]
+
+    print(f"{'case':40} {'p50 ms':>10} {'max ms':>10}")
+    for label, fn in cases:
+        p50, worst = await timed(fn, repeat)
+        print(f"{label:40} {p50:10.2f} {worst:10.2f}")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare legacy and indexed employee search")
+    parser.add_argument("--queries", default="john,smi,python")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run([q for q in args.queries.split(",") if q], args.repeat))
+
+
+if __name__ == "__main__":
+    main()
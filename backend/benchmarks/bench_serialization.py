@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal, engine
+from app.models.employee import Employee
+from app.responses import json_response
+from app.schemas.employee import EmployeeResponse
+from app.services.employee_service import EMPLOYEE_FIELDS, employee_columns
+
+# Usage (from backend/, against a database with at least --rows employees):
+#   python -m benchmarks.bench_serialization --rows 10000 --repeat 10
+
+RESPONSE_ADAPTER = TypeAdapter(List[EmployeeResponse])
+
+
+# ---------------------------
+# Previous Path: ORM objects + response_model
+# ---------------------------
+def response_model_body(employees) -> bytes:
+    # What FastAPI does for response_model=List[EmployeeResponse]: validate with
+    # from_attributes, dump to JSON-able python, jsonable_encoder, then json.dumps
+    validated = RESPONSE_ADAPTER.validate_python(employees, from_attributes=True)
+    content = jsonable_encoder(RESPONSE_ADAPTER.dump_python(validated, mode="json"))
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+async def orm_path(db, rows: int) -> bytes:
+    result = await db.execute(select(Employee).order_by(Employee.id).limit(rows))
+    return response_model_body(result.scalars().all())
+
+
+# ---------------------------
+# Fast Path: column rows + json_response
+# ---------------------------
+async def row_path(db, rows: int) -> bytes:
+    result = await db.execute(select(*employee_columns()).order_by(Employee.id).limit(rows))
+    items = [dict(zip(EMPLOYEE_FIELDS, row)) for row in result]
+    return json_response(items).body
+
+
+# ---------------------------
+# Timing Helpers
+# ---------------------------
+async def timed(fn, rows: int, repeat: int):
+    samples = []
+    size = 0
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            size = len(await fn(db, rows))
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples), size
+
+
+async def run(rows: int, repeat: int):
+    print(f"{'case':32} {'p50 ms':>10} {'max ms':>10} {'bytes':>12}")
+    for label, fn in (("orm + response_model", orm_path), ("column rows + to_json", row_path)):
+        p50, worst, size = await timed(fn, rows, repeat)
+        print(f"{label:32} {p50:10.2f} {worst:10.2f} {size:12}")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare employee list serialization paths")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import json
+import sys
+
+# Usage (from backend/):
+#   python -m benchmarks.compare benchmarks/results/baseline.json new.json --threshold 15
+# Exits with status 1 when any route regressed, so it can gate CI.
+
+
+def _change(old: float, new: float) -> float:
+    return (new - old) / old * 100 if old else 0.0
+
+
+def compare(old: dict, new: dict, threshold: float, min_ms: float):
+    rows, regressions = [], []
+    for route in sorted(set(old["cases"]) | set(new["cases"])):
+        before, after = old["cases"].get(route), new["cases"].get(route)
+        if before is None or after is None:
+            rows.append((route, "added" if before is None else "removed"))
+            continue
+
+        p95_change = _change(before["p95_ms"], after["p95_ms"])
+        notes = []
+        # Small absolute differences are noise, whatever the percentage
+        if p95_change > threshold and after["p95_ms"] - before["p95_ms"] > min_ms:
+            notes.append("slower")
+        if after["statements"] > before["statements"]:
+            notes.append("more SQL")
+        if notes:
+            regressions.append(route)
+
+        rows.append((
+            route,
+            f"{before['p50_ms']:9.2f} {after['p50_ms']:9.2f} {_change(before['p50_ms'], after['p50_ms']):+7.1f}% "
+            f"{before['p95_ms']:9.2f} {after['p95_ms']:9.2f} {p95_change:+7.1f}% "
+            f"{before['statements']:5}>{after['statements']:<5} "
+            f"{_change(before['peak_kib'], after['peak_kib']):+7.1f}% {' '.join(notes)}"
+        ))
+    return rows, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two benchmarks.runner result files")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed p95 slowdown in percent")
+    parser.add_argument("--min-ms", type=float, default=1.0, help="Ignore p95 slowdowns smaller than this")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        old = json.load(f)
+    with open(args.candidate) as f:
+        new = json.load(f)
+
+    print(f"baseline  {old['meta'].get('git_commit')}  {old['meta'].get('created_at')}")
+    print(f"candidate {new['meta'].get('git_commit')}  {new['meta'].get('created_at')}")
+    print(
+        f"{'route':52} {'p50 old':>9} {'p50 new':>9} {'change':>8} {'p95 old':>9} {'p95 new':>9} {'change':>8} "
+        f"{'stmts':>11} {'memory':>8}"
+    )
+    rows, regressions = compare(old, new, args.threshold, args.min_ms)
+    for route, line in rows:
+        print(f"{route:52} {line}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): " + ", ".join(regressions))
+        sys.exit(1)
+    print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
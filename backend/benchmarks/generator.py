@@ -0,0 +1,159 @@
+import random
+from datetime import date
+from typing import List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.role import Role
+from app.services.closure_service import rebuild_closure
+from app.services.rollup_service import rebuild_rollups
+from app.services.skill_service import backfill_skills
+
+INSERT_CHUNK_SIZE = 1000
+
+DEFAULT_SKILLS = (
+    "python", "fastapi", "sql", "postgresql", "javascript", "typescript", "react", "docker",
+    "kubernetes", "aws", "go", "java", "spring", "terraform", "redis", "kafka", "graphql",
+    "rust", "c++", "figma", "excel", "tableau", "salesforce", "jira", "scrum",
+)
+
+FIRST_NAMES = (
+    "Aarav", "Priya", "John", "Maria", "Wei", "Fatima", "Liam", "Olga", "Kenji", "Amara",
+    "Noah", "Sofia", "Arjun", "Chen", "Elena", "Omar", "Grace", "Mateo", "Yuki", "Zara",
+)
+LAST_NAMES = (
+    "Sharma", "Smith", "Garcia", "Wang", "Khan", "Murphy", "Ivanova", "Tanaka", "Okafor",
+    "Johnson", "Rossi", "Patel", "Li", "Novak", "Haddad", "Brown", "Silva", "Sato", "Adeyemi",
+)
+
+
+# ---------------------------
+# Synthetic Org Parameters
+# ---------------------------
+class OrgSpec(BaseModel):
+    employees: int = Field(2000, ge=1)
+    departments: int = Field(12, ge=1)
+    roles: int = Field(20, ge=1)
+
+    # Manager tree: each manager has up to fan_out reports, at most max_depth levels below a root
+    fan_out: int = Field(6, ge=1)
+    max_depth: int = Field(6, ge=0)
+
+    # Skills per employee are drawn with Zipf-like weights: a few skills are very common
+    skills: Sequence[str] = DEFAULT_SKILLS
+    min_skills: int = Field(1, ge=0)
+    max_skills: int = Field(5, ge=0)
+    skill_skew: float = Field(1.1, ge=0)
+
+    resignation_rate: float = Field(0.12, ge=0, le=1)
+    first_joining_year: int = 2005
+    last_joining_year: int = 2025
+    seed: int = 7
+
+
+def _root_count(spec: OrgSpec) -> int:
+    # Fewest roots whose full trees of max_depth levels hold every employee
+    per_tree = sum(spec.fan_out ** d for d in range(spec.max_depth + 1))
+    return max(1, -(-spec.employees // per_tree))
+
+
+# ---------------------------
+# Generate Rows (breadth-first: managers before their reports)
+# ---------------------------
+def generate_employees(spec: OrgSpec) -> List[dict]:
+    rng = random.Random(spec.seed)
+    weights = [1 / (rank ** spec.skill_skew) for rank in range(1, len(spec.skills) + 1)]
+    roots = _root_count(spec)
+
+    rows = []
+    for i in range(spec.employees):
+        joined = rng.randint(spec.first_joining_year, spec.last_joining_year)
+        picked = rng.choices(spec.skills, weights, k=rng.randint(spec.min_skills, spec.max_skills))
+
+        resigned: Optional[date] = None
+        if rng.random() < spec.resignation_rate:
+            year = rng.randint(joined, spec.last_joining_year)
+            resigned = date(year, rng.randint(1, 12), rng.randint(1, 28))
+
+        rows.append({
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i + 1}",
+            "tech_stack": ", ".join(dict.fromkeys(picked)) or None,
+            "year_of_joining": joined,
+            "experience": spec.last_joining_year - joined + rng.randint(0, 8),
+            "resignation_date": resigned,
+            "department_index": rng.randrange(spec.departments),
+            "role_index": rng.randrange(spec.roles),
+            # Index of the manager row; a complete fan_out-ary tree laid out breadth-first
+            "manager_index": None if i < roots else (i - roots) // spec.fan_out,
+        })
+    return rows
+
+
+# ---------------------------
+# Load into the Database
+# ---------------------------
+async def _insert_returning_ids(db: AsyncSession, model, rows: List[dict]) -> List[int]:
+    ids = []
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        result = await db.execute(
+            insert(model).returning(model.id, sort_by_parameter_order=True),
+            rows[start:start + INSERT_CHUNK_SIZE]
+        )
+        ids += result.scalars().all()
+    return ids
+
+
+async def load_org(db: AsyncSession, spec: OrgSpec) -> dict:
+    department_ids = await _insert_returning_ids(db, Department, [
+        {"name": f"Department {i + 1}", "description": f"Synthetic department {i + 1}"}
+        for i in range(spec.departments)
+    ])
+    role_ids = await _insert_returning_ids(db, Role, [
+        {"title": f"Role {i + 1}", "level": i % 8 + 1, "description": None}
+        for i in range(spec.roles)
+    ])
+
+    rows = generate_employees(spec)
+    levels: List[List[dict]] = []
+    depth = []
+    for row in rows:
+        # Breadth-first order: each level is a contiguous run of rows
+        depth.append(0 if row["manager_index"] is None else depth[row["manager_index"]] + 1)
+        if depth[-1] == len(levels):
+            levels.append([])
+        levels[depth[-1]].append(row)
+
+    employee_ids = []
+    for level in levels:
+        # Inserted level by level, so every manager already has an id
+        level_rows = [
+            {
+                "name": row["name"],
+                "tech_stack": row["tech_stack"],
+                "year_of_joining": row["year_of_joining"],
+                "experience": row["experience"],
+                "resignation_date": row["resignation_date"],
+                "department_id": department_ids[row["department_index"]],
+                "role_id": role_ids[row["role_index"]],
+                "manager_id": None if row["manager_index"] is None else employee_ids[row["manager_index"]],
+            }
+            for row in level
+        ]
+        employee_ids += await _insert_returning_ids(db, Employee, level_rows)
+    await db.commit()
+
+    # Derived tables, as `python -m app.manage` would rebuild them
+    await rebuild_rollups(db)
+    await backfill_skills(db)
+    await rebuild_closure(db)
+
+    return {
+        "department_ids": department_ids,
+        "role_ids": role_ids,
+        "employee_ids": employee_ids,
+        "manager_ids": sorted({employee_ids[r["manager_index"]] for r in rows if r["manager_index"] is not None}),
+    }
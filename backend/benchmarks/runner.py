@@ -0,0 +1,465 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from itertools import count
+from typing import Awaitable, Callable, Dict, List, NamedTuple
+
+# Usage (from backend/):
+#   python -m benchmarks.runner --employees 5000 --repeat 30 --output benchmarks/results/baseline.json
+#   python -m benchmarks.runner --database-url postgresql+asyncpg://.../fasthr_bench --output new.json
+#   python -m benchmarks.compare baseline.json new.json
+#
+# Without --database-url a throwaway SQLite file is used. The app reads FASTHR_DATABASE_URL
+# when it is imported, so app modules are imported inside run() after the URL is set.
+
+BENCHMARKED_PREFIXES = ("/employees", "/departments", "/roles", "/dashboard", "/analytics", "/structure")
+# Endless responses cannot be timed per request; see benchmarks/bench_dashboard_stream.py
+UNBENCHMARKED_ROUTES = ("GET /dashboard/stream",)
+
+
+class Case(NamedTuple):
+    route: str
+    call: Callable[..., Awaitable]
+
+
+CASES: List[Case] = []
+
+
+def case(route: str):
+    def register(fn):
+        CASES.append(Case(route, fn))
+        return fn
+    return register
+
+
+# ---------------------------
+# Cases (one request each; route = "METHOD /path" as registered in FastAPI)
+# ---------------------------
+# ctx holds ids of the generated org plus stacks that pair creates with later updates/deletes.
+# Every case runs the same number of times, so each delete has a matching create.
+
+@case("POST /employees/")
+async def _(client, ctx):
+    response = await client.post("/employees/", json={
+        "name": f"Bench Hire {next(ctx['seq'])}",
+        "tech_stack": "python, sql",
+        "year_of_joining": 2024,
+        "experience": 2,
+        "department_id": ctx["department_ids"][0],
+        "role_id": ctx["role_ids"][0],
+        "manager_id": ctx["manager_ids"][0],
+    })
+    ctx["created"].append(response.json()["id"])
+    return response
+
+
+@case("PUT /employees/{employee_id}")
+async def _(client, ctx):
+    return await client.put(f"/employees/{ctx['created'][-1]}", json={"experience": 3, "tech_stack": "python, go"})
+
+
+@case("DELETE /employees/{employee_id}")
+async def _(client, ctx):
+    return await client.delete(f"/employees/{ctx['created'].pop()}")
+
+
+@case("POST /employees/bulk")
+async def _(client, ctx):
+    batch = next(ctx["seq"])
+    lines = [
+        json.dumps({"name": f"Bulk {batch}-{i}", "tech_stack": "excel", "ref": f"b{batch}-{i}",
+                    "manager_ref": f"b{batch}-0" if i else None})
+        for i in range(50)
+    ]
+    response = await client.post("/employees/bulk", content="\n".join(lines))
+    ctx["imports"].append(f"Bulk {batch}-")
+    return response
+
+
+@case("POST /employees/bulk/jobs")
+async def _(client, ctx):
+    # Measures submission (spool + job row); rows without a name are rejected, so the
+    # background import leaves the org unchanged for the cases after it
+    lines = [json.dumps({"tech_stack": "excel"}) for _ in range(50)]
+    return await client.post("/employees/bulk/jobs", content="\n".join(lines))
+
+
+@case("PATCH /employees/bulk")
+async def _(client, ctx):
+    return await client.patch("/employees/bulk", json={
+        "filter": {"name": ctx["imports"][-1]},
+        "changes": {"department_id": ctx["department_ids"][1 % len(ctx["department_ids"])]},
+    })
+
+
+@case("DELETE /employees/bulk")
+async def _(client, ctx):
+    return await client.request("DELETE", "/employees/bulk", json={"filter": {"name": ctx["imports"].pop()}})
+
+
+@case("GET /employees/")
+async def _(client, ctx):
+    return await client.get("/employees/", params={"limit": 500})
+
+
+@case("GET /employees/export")
+async def _(client, ctx):
+    return await client.get("/employees/export", params={"format": "ndjson"})
+
+
+@case("GET /employees/{employee_id}")
+async def _(client, ctx):
+    return await client.get(f"/employees/{ctx['employee_ids'][len(ctx['employee_ids']) // 2]}")
+
+
+@case("GET /employees/{employee_id}/subordinates")
+async def _(client, ctx):
+    return await client.get(f"/employees/{ctx['manager_ids'][0]}/subordinates")
+
+
+@case("GET /employees/department/{dept_id}")
+async def _(client, ctx):
+    return await client.get(f"/employees/department/{ctx['department_ids'][0]}", params={"limit": 500})
+
+
+@case("GET /employees/role/{role_id}")
+async def _(client, ctx):
+    return await client.get(f"/employees/role/{ctx['role_ids'][0]}", params={"limit": 500})
+
+
+@case("GET /employees/{employee_id}/hierarchy")
+async def _(client, ctx):
+    return await client.get(f"/employees/{ctx['manager_ids'][0]}/hierarchy")
+
+
+@case("GET /employees/{employee_id}/descendants")
+async def _(client, ctx):
+    return await client.get(f"/employees/{ctx['manager_ids'][0]}/descendants", params={"limit": 500})
+
+
+@case("GET /employees/{employee_id}/ancestors")
+async def _(client, ctx):
+    return await client.get(f"/employees/{ctx['employee_ids'][-1]}/ancestors")
+
+
+@case("GET /employees/{employee_id}/team-size")
+async def _(client, ctx):
+    return await client.get(f"/employees/{ctx['manager_ids'][0]}/team-size")
+
+
+@case("GET /employees/search/")
+async def _(client, ctx):
+    return await client.get("/employees/search/", params={"q": "sharma", "limit": 100})
+
+
+@case("GET /employees/filter/")
+async def _(client, ctx):
+    return await client.get("/employees/filter/", params={"min_exp": 5, "year": 2015, "limit": 500})
+
+
+@case("GET /employees/sort/")
+async def _(client, ctx):
+    return await client.get("/employees/sort/", params={"by": "experience", "limit": 500})
+
+
+@case("POST /departments/")
+async def _(client, ctx):
+    response = await client.post("/departments/", json={"name": f"Bench Department {next(ctx['seq'])}"})
+    ctx["departments"].append(response.json()["id"])
+    return response
+
+
+@case("GET /departments/")
+async def _(client, ctx):
+    return await client.get("/departments/")
+
+
+@case("GET /departments/{dept_id}")
+async def _(client, ctx):
+    return await client.get(f"/departments/{ctx['department_ids'][0]}")
+
+
+@case("PUT /departments/{dept_id}")
+async def _(client, ctx):
+    return await client.put(f"/departments/{ctx['departments'][-1]}", json={"description": "updated"})
+
+
+@case("DELETE /departments/{dept_id}")
+async def _(client, ctx):
+    return await client.delete(f"/departments/{ctx['departments'].pop()}")
+
+
+@case("GET /departments/{dept_id}/employees")
+async def _(client, ctx):
+    return await client.get(f"/departments/{ctx['department_ids'][0]}/employees")
+
+
+@case("POST /roles/")
+async def _(client, ctx):
+    response = await client.post("/roles/", json={"title": f"Bench Role {next(ctx['seq'])}", "level": 2})
+    ctx["roles"].append(response.json()["id"])
+    return response
+
+
+@case("GET /roles/")
+async def _(client, ctx):
+    return await client.get("/roles/")
+
+
+@case("GET /roles/{role_id}")
+async def _(client, ctx):
+    return await client.get(f"/roles/{ctx['role_ids'][0]}")
+
+
+@case("PUT /roles/{role_id}")
+async def _(client, ctx):
+    return await client.put(f"/roles/{ctx['roles'][-1]}", json={"description": "updated"})
+
+
+@case("DELETE /roles/{role_id}")
+async def _(client, ctx):
+    return await client.delete(f"/roles/{ctx['roles'].pop()}")
+
+
+@case("GET /roles/{role_id}/employees")
+async def _(client, ctx):
+    return await client.get(f"/roles/{ctx['role_ids'][0]}/employees")
+
+
+@case("GET /structure/tree")
+async def _(client, ctx):
+    return await client.get("/structure/tree")
+
+
+for _route in (
+    "/dashboard/counts",
+    "/dashboard/employees-per-department",
+    "/dashboard/employees-per-role",
+    "/dashboard/experience-distribution",
+    "/dashboard/joining-year",
+    "/dashboard/manager-team-count",
+    "/analytics/attrition",
+    "/analytics/resignation-trend",
+    "/analytics/experience-buckets",
+    "/analytics/manager-level",
+):
+    case(f"GET {_route}")(lambda client, ctx, path=_route: client.get(path))
+
+
+@case("GET /analytics/search/skills")
+async def _(client, ctx):
+    return await client.get("/analytics/search/skills", params={"skill": "python,sql", "mode": "all", "limit": 500})
+
+
+@case("GET /analytics/skills")
+async def _(client, ctx):
+    return await client.get("/analytics/skills", params={"prefix": "p"})
+
+
+# ---------------------------
+# Measurement
+# ---------------------------
+def percentile(samples: List[float], pct: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+async def measure(client, ctx, bench_case: Case, repeat: int, statements: dict, cold_cache: bool) -> dict:
+    from app.cache import response_cache
+
+    async def call():
+        if cold_cache:
+            response_cache.clear()
+        before = statements["count"]
+        start = time.perf_counter()
+        response = await bench_case.call(client, ctx)
+        elapsed = (time.perf_counter() - start) * 1000
+        if response.status_code >= 400:
+            raise RuntimeError(f"{bench_case.route} -> {response.status_code}: {response.text[:200]}")
+        return elapsed, statements["count"] - before, response
+
+    await call()  # warm-up: imports, prepared statements, pydantic schemas
+
+    samples, counts = [], []
+    for _ in range(repeat):
+        elapsed, executed, response = await call()
+        samples.append(elapsed)
+        counts.append(executed)
+
+    # Separate pass for memory: tracemalloc slows the code it traces
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    await call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "statements": max(counts),
+        "peak_kib": round(peak / 1024, 1),
+        "bytes": len(response.content),
+        "status": response.status_code,
+    }
+
+
+def uncovered_routes(app) -> List[str]:
+    covered = {c.route for c in CASES} | set(UNBENCHMARKED_ROUTES)
+    missing = []
+    for route in app.routes:
+        if not route.path.startswith(BENCHMARKED_PREFIXES):
+            continue
+        for method in sorted(getattr(route, "methods", ()) - {"HEAD"}):
+            if f"{method} {route.path}" not in covered:
+                missing.append(f"{method} {route.path}")
+    return missing
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ---------------------------
+# Run
+# ---------------------------
+async def existing_org(db) -> dict:
+    from sqlalchemy import select
+    from app.models.department import Department
+    from app.models.employee import Employee
+    from app.models.role import Role
+
+    async def ids(query):
+        return list((await db.execute(query)).scalars().all())
+
+    return {
+        "department_ids": await ids(select(Department.id).order_by(Department.id)),
+        "role_ids": await ids(select(Role.id).order_by(Role.id)),
+        "employee_ids": await ids(select(Employee.id).order_by(Employee.id)),
+        "manager_ids": await ids(
+            select(Employee.manager_id).where(Employee.manager_id.is_not(None))
+            .group_by(Employee.manager_id).order_by(Employee.manager_id)
+        ),
+    }
+
+
+async def run(args) -> dict:
+    import httpx
+    from sqlalchemy import event, select
+
+    from app.database import AsyncSessionLocal, engine
+    from app.main import app
+    from app.migrations import upgrade_database
+    from app.models.employee import Employee
+    from benchmarks.generator import OrgSpec, load_org
+
+    spec = OrgSpec(
+        employees=args.employees,
+        departments=args.departments,
+        roles=args.roles,
+        fan_out=args.fan_out,
+        max_depth=args.max_depth,
+        resignation_rate=args.resignation_rate,
+        seed=args.seed,
+    )
+
+    statements = {"count": 0}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(*_):
+        statements["count"] += 1
+
+    try:
+        await upgrade_database()
+        async with AsyncSessionLocal() as db:
+            has_data = (await db.execute(select(Employee.id).limit(1))).first() is not None
+            if has_data and not args.reuse:
+                raise SystemExit("Database already has employees; pass --reuse to benchmark them as-is")
+            if has_data:
+                org = await existing_org(db)
+            else:
+                print(f"Generating {spec.employees} employees ...")
+                org = await load_org(db, spec)
+
+        missing = uncovered_routes(app)
+        if missing:
+            print("Routes without a benchmark case: " + ", ".join(missing))
+
+        selected = [c for c in CASES if not args.only or any(part in c.route for part in args.only)]
+        ctx = {**org, "seq": count(1), "created": [], "imports": [], "departments": [], "roles": []}
+        results: Dict[str, dict] = {}
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            print(f"{'route':52} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'stmts':>6} {'peak KiB':>10}")
+            for bench_case in selected:
+                result = await measure(client, ctx, bench_case, args.repeat, statements, not args.warm_cache)
+                results[bench_case.route] = result
+                print(
+                    f"{bench_case.route:52} {result['p50_ms']:9.2f} {result['p95_ms']:9.2f} "
+                    f"{result['p99_ms']:9.2f} {result['statements']:6} {result['peak_kib']:10.1f}"
+                )
+    finally:
+        await engine.dispose()
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "database": engine.dialect.name,
+            "repeat": args.repeat,
+            "cold_cache": not args.warm_cache,
+            "spec": spec.model_dump(mode="json") if not args.reuse else None,
+        },
+        "cases": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every FastHR endpoint against a synthetic org")
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    parser.add_argument("--reuse", action="store_true", help="Benchmark the data already in the database")
+    parser.add_argument("--employees", type=int, default=2000)
+    parser.add_argument("--departments", type=int, default=12)
+    parser.add_argument("--roles", type=int, default=20)
+    parser.add_argument("--fan-out", type=int, default=6)
+    parser.add_argument("--max-depth", type=int, default=6)
+    parser.add_argument("--resignation-rate", type=float, default=0.12)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warm-cache", action="store_true", help="Keep the response cache between calls")
+    parser.add_argument("--only", nargs="*", help="Run cases whose route contains any of these strings")
+    parser.add_argument("--output", help="Write results as JSON (a baseline for benchmarks.compare)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["FASTHR_DATABASE_URL"] = args.database_url or f"sqlite+aiosqlite:///{tmp}/fasthr-bench.db"
+        # Benchmarks always hit one database
+        os.environ.pop("FASTHR_READ_DATABASE_URL", None)
+        results = asyncio.run(run(args))
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
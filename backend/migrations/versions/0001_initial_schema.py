@@ -0,0 +1,118 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+Tables as they existed when the app created its schema with create_all.
+Databases created that way already have some or all of these objects, so
+every step is skipped when the object is present.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+
+    if bind.dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    if "departments" not in existing:
+        op.create_table(
+            "departments",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(100), nullable=False, unique=True),
+            sa.Column("description", sa.String(), nullable=True),
+        )
+        op.create_index("ix_departments_id", "departments", ["id"])
+
+    if "roles" not in existing:
+        op.create_table(
+            "roles",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String(100), nullable=False, unique=True),
+            sa.Column("level", sa.Integer(), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+        )
+        op.create_index("ix_roles_id", "roles", ["id"])
+
+    if "employees" not in existing:
+        op.create_table(
+            "employees",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("tech_stack", sa.String(), nullable=True),
+            sa.Column("year_of_joining", sa.Integer(), nullable=True),
+            sa.Column("experience", sa.Integer(), nullable=True),
+            sa.Column("resignation_date", sa.Date(), nullable=True),
+            sa.Column("department_id", sa.Integer(), sa.ForeignKey("departments.id", ondelete="SET NULL")),
+            sa.Column("role_id", sa.Integer(), sa.ForeignKey("roles.id", ondelete="SET NULL")),
+            sa.Column("manager_id", sa.Integer(), sa.ForeignKey("employees.id", ondelete="SET NULL")),
+        )
+        op.create_index("ix_employees_id", "employees", ["id"])
+
+    op.create_index(
+        "ix_employees_name_trgm", "employees", ["name"],
+        postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        if_not_exists=True
+    )
+
+    if "analytics_rollups" not in existing:
+        op.create_table(
+            "analytics_rollups",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("dimension", sa.String(32), nullable=False),
+            sa.Column("bucket", sa.Integer(), nullable=False),
+            sa.Column("count", sa.Integer(), nullable=False),
+            sa.UniqueConstraint("dimension", "bucket", name="uq_analytics_rollups_dimension_bucket"),
+        )
+        op.create_index("ix_analytics_rollups_id", "analytics_rollups", ["id"])
+    else:
+        _merge_unassigned_buckets(bind)
+
+    if "employee_skills" not in existing:
+        op.create_table(
+            "employee_skills",
+            sa.Column(
+                "employee_id", sa.Integer(),
+                sa.ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True
+            ),
+            sa.Column("skill", sa.String(100), primary_key=True),
+        )
+        op.create_index(
+            "ix_employee_skills_skill_employee", "employee_skills", ["skill", "employee_id"],
+            postgresql_ops={"skill": "text_pattern_ops"}
+        )
+
+
+def _merge_unassigned_buckets(bind):
+    # create_all made bucket nullable, with NULL for "no department / role / year".
+    # Those counters move to bucket 0 so the unique constraint covers them (upserts).
+    columns = {c["name"]: c for c in sa.inspect(bind).get_columns("analytics_rollups")}
+    if not columns["bucket"]["nullable"]:
+        return
+
+    op.execute(
+        "INSERT INTO analytics_rollups (dimension, bucket, count) "
+        "SELECT dimension, 0, SUM(count) FROM analytics_rollups "
+        "WHERE bucket IS NULL GROUP BY dimension"
+    )
+    op.execute("DELETE FROM analytics_rollups WHERE bucket IS NULL")
+    with op.batch_alter_table("analytics_rollups") as batch:
+        batch.alter_column("bucket", existing_type=sa.Integer(), nullable=False)
+
+
+def downgrade():
+    op.drop_table("employee_skills")
+    op.drop_table("analytics_rollups")
+    op.drop_table("employees")
+    op.drop_table("roles")
+    op.drop_table("departments")
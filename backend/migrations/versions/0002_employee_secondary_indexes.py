@@ -0,0 +1,28 @@
+"""employee secondary indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+Indexes for the hierarchy walks (manager_id), department/role listings and
+dashboard groupings.
+"""
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXED_COLUMNS = ("manager_id", "department_id", "role_id", "resignation_date", "year_of_joining")
+
+
+def upgrade():
+    for column in INDEXED_COLUMNS:
+        op.create_index(f"ix_employees_{column}", "employees", [column], if_not_exists=True)
+
+
+def downgrade():
+    for column in reversed(INDEXED_COLUMNS):
+        op.drop_index(f"ix_employees_{column}", table_name="employees")
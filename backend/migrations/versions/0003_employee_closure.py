@@ -0,0 +1,45 @@
+"""employee closure table
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+Precomputed (ancestor, descendant, depth) pairs of the manager hierarchy.
+The app fills it on startup (ensure_closure) or via
+`python -m app.manage rebuild-closure`.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "employee_closure",
+        sa.Column(
+            "ancestor_id", sa.Integer(),
+            sa.ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column(
+            "descendant_id", sa.Integer(),
+            sa.ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("depth", sa.Integer(), nullable=False),
+    )
+    op.create_index(
+        "ix_employee_closure_ancestor_depth", "employee_closure",
+        ["ancestor_id", "depth", "descendant_id"]
+    )
+    op.create_index(
+        "ix_employee_closure_descendant_depth", "employee_closure",
+        ["descendant_id", "depth"]
+    )
+
+
+def downgrade():
+    op.drop_table("employee_closure")
@@ -0,0 +1,38 @@
+"""manager span rollups
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+
+Direct and total report counts per manager become analytics_rollups counters
+(dimensions direct_reports / total_reports, bucket = manager id), maintained
+with employee_closure. The index serves the span listings largest-first.
+Counters are seeded from employee_closure; if that is still empty, its startup
+rebuild (ensure_closure) fills them.
+"""
+from alembic import op
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+SPAN_DEPTHS = {"direct_reports": "depth = 1", "total_reports": "depth > 0"}
+
+
+def upgrade():
+    op.create_index(
+        "ix_analytics_rollups_dimension_count", "analytics_rollups", ["dimension", "count", "bucket"]
+    )
+    for dimension, condition in SPAN_DEPTHS.items():
+        op.execute(
+            "INSERT INTO analytics_rollups (dimension, bucket, count) "
+            f"SELECT '{dimension}', ancestor_id, COUNT(*) FROM employee_closure "
+            f"WHERE {condition} GROUP BY ancestor_id"
+        )
+
+
+def downgrade():
+    op.execute("DELETE FROM analytics_rollups WHERE dimension IN ('direct_reports', 'total_reports')")
+    op.drop_index("ix_analytics_rollups_dimension_count", table_name="analytics_rollups")
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+# Settings are read when app modules are imported, so point the app at a throwaway
+# database first. FASTHR_TEST_DATABASE_URL runs the suite (including the tests marked
+# postgres) against a real server; its tables are emptied between tests.
+_tmpdir = tempfile.mkdtemp(prefix="fasthr-tests-")
+os.environ["FASTHR_DATABASE_URL"] = os.environ.get(
+    "FASTHR_TEST_DATABASE_URL", f"sqlite+aiosqlite:///{_tmpdir}/test.db"
+)
+os.environ.pop("FASTHR_READ_DATABASE_URL", None)
+os.environ["FASTHR_SQL_INSTRUMENTATION"] = "false"
+
+import httpx  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+
+from app.cache import response_cache  # noqa: E402
+from app.database import AsyncSessionLocal, Base, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.migrations import upgrade_database  # noqa: E402
+
+# Usage (from backend/):
+#   python -m pytest -q
+#   FASTHR_TEST_DATABASE_URL=postgresql+asyncpg://.../fasthr_test python -m pytest -q
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "postgres: needs FASTHR_TEST_DATABASE_URL pointing at Postgres")
+
+
+def pytest_collection_modifyitems(config, items):
+    if engine.dialect.name == "postgresql":
+        return
+    skip = pytest.mark.skip(reason="needs Postgres (set FASTHR_TEST_DATABASE_URL)")
+    for item in items:
+        if "postgres" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema():
+    async def migrate():
+        await upgrade_database()
+        await engine.dispose()
+
+    asyncio.run(migrate())
+
+
+async def _empty_tables():
+    async with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            names = ", ".join(t.name for t in Base.metadata.sorted_tables)
+            await conn.execute(text(f"TRUNCATE {names} RESTART IDENTITY CASCADE"))
+        else:
+            for table in reversed(Base.metadata.sorted_tables):
+                await conn.execute(table.delete())
+
+
+@pytest.fixture(autouse=True)
+async def clean_database(anyio_backend):
+    yield
+    await _empty_tables()
+    response_cache.clear()
+    # Pooled connections belong to this test's event loop
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+async def db():
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def statements():
+    # SQL sent to the database while the test runs; clear() between requests
+    log = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        log.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield log
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
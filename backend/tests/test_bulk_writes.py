@@ -0,0 +1,43 @@
+import pytest
+
+from app.services.rollup_service import DEPARTMENT, list_rollup, rebuild_rollups
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def departments(client):
+    a = (await client.post("/departments/", json={"name": "A"})).json()["id"]
+    b = (await client.post("/departments/", json={"name": "B"})).json()["id"]
+    for i in range(4):
+        await client.post("/employees/", json={"name": f"E{i}", "department_id": a, "experience": i})
+    return a, b
+
+
+async def test_bulk_update_by_filter_keeps_rollups_exact(client, db, departments):
+    a, b = departments
+    response = await client.request("PATCH", "/employees/bulk", json={
+        "filter": {"department_id": a, "min_experience": 2},
+        "changes": {"department_id": b},
+    })
+    assert response.json()["affected"] == 2
+
+    incremental = [tuple(r) for r in await list_rollup(db, DEPARTMENT)]
+    assert incremental == [(a, 2), (b, 2)]
+    await rebuild_rollups(db)
+    assert [tuple(r) for r in await list_rollup(db, DEPARTMENT)] == incremental
+
+
+async def test_bulk_delete_by_filter(client, db, departments):
+    a, _ = departments
+    response = await client.request("DELETE", "/employees/bulk", json={"filter": {"department_id": a}})
+    assert response.json()["affected"] == 4
+    assert await list_rollup(db, DEPARTMENT) == []
+
+    response = await client.request("DELETE", "/employees/bulk", json={"filter": {"department_id": a}})
+    assert response.json() == {"affected": 0, "ids": []}
+
+
+async def test_update_missing_employee_is_404(client):
+    response = await client.put("/employees/999", json={"name": "Nobody"})
+    assert response.status_code == 404
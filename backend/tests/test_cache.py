@@ -0,0 +1,45 @@
+import pytest
+from starlette.requests import Request
+
+from app.cache import ResponseCache, cached_json, response_cache, EMPLOYEES, ROLES
+
+
+def test_set_skips_entries_invalidated_during_compute():
+    cache = ResponseCache()
+    generation = cache.generation([EMPLOYEES, ROLES])
+    # A write lands while the response is being built
+    cache.invalidate(EMPLOYEES)
+
+    entry = cache.set("key", b"[]", [EMPLOYEES, ROLES], generation)
+    assert entry.body == b"[]"
+    assert cache.get("key") is None
+
+
+def test_set_keeps_entries_when_other_tags_change():
+    cache = ResponseCache()
+    generation = cache.generation([ROLES])
+    cache.invalidate(EMPLOYEES)
+
+    cache.set("key", b"[]", [ROLES], generation)
+    assert cache.get("key") is not None
+
+
+async def _cached_get(replica: bool):
+    scope = {"type": "http", "method": "GET", "path": "/dashboard/counts", "query_string": b"", "headers": []}
+    request = Request(scope)
+    request.state.replica_read = replica
+    return await cached_json(request, [EMPLOYEES], lambda: _compute())
+
+
+async def _compute():
+    return {"total_employees": 1}
+
+
+@pytest.mark.anyio
+async def test_replica_reads_are_served_but_not_cached():
+    response = await _cached_get(replica=True)
+    assert response.body == b'{"total_employees":1}'
+    assert response_cache.get(("/dashboard/counts", ())) is None
+
+    await _cached_get(replica=False)
+    assert response_cache.get(("/dashboard/counts", ())) is not None
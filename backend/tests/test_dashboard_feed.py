@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from app.cache import EMPLOYEES
+from app.services.dashboard_service import DASHBOARD_SECTIONS, DashboardFeed
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def feed(monkeypatch):
+    feed = DashboardFeed()
+    feed.release = asyncio.Event()
+    feed.loads = 0
+
+    async def compute(sections):
+        # First load waits until the test releases it
+        feed.loads += 1
+        if feed.loads == 1:
+            await feed.release.wait()
+        return {section.name: feed.loads for section in sections}
+
+    monkeypatch.setattr(feed, "_compute", compute)
+    yield feed
+    for queue in list(feed.subscribers):
+        feed.unsubscribe(queue)
+
+
+async def test_writes_during_first_load_are_marked_dirty(feed):
+    subscribing = asyncio.ensure_future(feed.subscribe())
+    await asyncio.sleep(0)
+    assert feed._loading is not None
+
+    feed.notify((EMPLOYEES,))
+    feed.release.set()
+    await subscribing
+    assert EMPLOYEES in feed._dirty
+
+
+async def test_snapshot_cleared_during_load_is_reloaded(feed):
+    async def hit_and_run():
+        feed.unsubscribe(await feed.subscribe())
+
+    first = asyncio.ensure_future(hit_and_run())
+    second = asyncio.ensure_future(feed.subscribe())
+    await asyncio.sleep(0)
+    feed.release.set()
+
+    await first
+    queue = await second
+    event = queue.get_nowait()
+    assert event["event"] == "snapshot"
+    assert event["sections"] == {section.name: 2 for section in DASHBOARD_SECTIONS}
@@ -0,0 +1,35 @@
+import pytest
+from sqlalchemy import select
+
+from app.models.employee import Employee
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def org(client):
+    department = (await client.post("/departments/", json={"name": "Engineering"})).json()["id"]
+    role = (await client.post("/roles/", json={"title": "Engineer", "level": 2})).json()["id"]
+    manager = (await client.post("/employees/", json={"name": "Manager"})).json()["id"]
+    report = (await client.post("/employees/", json={
+        "name": "Report", "department_id": department, "role_id": role, "manager_id": manager
+    })).json()["id"]
+    return {"department": department, "role": role, "manager": manager, "report": report}
+
+
+async def _report_column(db, org, column):
+    return (await db.execute(select(getattr(Employee, column)).where(Employee.id == org["report"]))).scalar_one()
+
+
+# Relationships never cascade in Python (passive_deletes), so these rely on ON DELETE SET NULL
+@pytest.mark.parametrize("path, key, column", [
+    ("/employees/{manager}", "manager", "manager_id"),
+    ("/departments/{department}", "department", "department_id"),
+    ("/roles/{role}", "role", "role_id"),
+])
+async def test_delete_clears_references(client, db, org, path, key, column):
+    assert await _report_column(db, org, column) == org[key]
+
+    response = await client.delete(path.format(**org))
+    assert response.status_code == 200, response.text
+    assert await _report_column(db, org, column) is None
@@ -0,0 +1,98 @@
+import asyncio
+import json
+import os
+import tracemalloc
+
+import pytest
+from sqlalchemy import insert, literal, select
+
+from app.main import app
+from app.models.employee import Employee
+
+pytestmark = pytest.mark.anyio
+
+# FASTHR_TEST_EXPORT_ROWS=1000000 for the full-size run; the default keeps the suite quick
+EXPORT_ROWS = int(os.environ.get("FASTHR_TEST_EXPORT_ROWS", "50000"))
+
+# Python heap allowed while streaming, whatever the row count: a few yield_per batches
+PEAK_MEMORY_LIMIT = 4 * 1024 * 1024
+
+
+async def seed_employees(db, rows: int):
+    # One INSERT ... SELECT over a recursive counter instead of `rows` round trips
+    seq = select(literal(1).label("n")).cte("seq", recursive=True)
+    seq = seq.union_all(select(seq.c.n + 1).where(seq.c.n < rows))
+    await db.execute(
+        insert(Employee).from_select(
+            ["name", "tech_stack", "experience", "year_of_joining"],
+            select(
+                literal("Employee ") + seq.c.n.cast(Employee.name.type),
+                literal("python, sql, docker, kubernetes"),
+                seq.c.n % 30,
+                2000 + seq.c.n % 25,
+            )
+        )
+    )
+    await db.commit()
+
+
+async def stream_export(path: str):
+    # httpx's ASGITransport buffers the whole body, so drive the app directly and
+    # drop each chunk as it arrives
+    received = {"status": None, "bytes": 0, "lines": 0, "last": b""}
+    requested = False
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # StreamingResponse listens for a disconnect while it sends
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            received["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            received["bytes"] += len(body)
+            received["lines"] += body.count(b"\n")
+            if body:
+                received["last"] = body
+            if not message.get("more_body", False):
+                finished.set()
+
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": query.encode(), "headers": [(b"host", b"test")],
+        "client": ("test", 1), "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+    return received
+
+
+@pytest.mark.parametrize("fmt, header_lines", [("ndjson", 0), ("csv", 1)])
+async def test_export_memory_is_bounded(db, fmt, header_lines):
+    await seed_employees(db, EXPORT_ROWS)
+    # First request pays for imports, compiled statements and connection setup
+    await stream_export(f"/employees/export?format={fmt}")
+
+    tracemalloc.start()
+    try:
+        received = await stream_export(f"/employees/export?format={fmt}")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert received["status"] == 200
+    assert received["lines"] == EXPORT_ROWS + header_lines
+    # Peak stays at a few batches while the body grows with the row count
+    assert peak < PEAK_MEMORY_LIMIT, f"peak {peak} bytes for a {received['bytes']} byte export"
+    assert peak < received["bytes"] / 2, f"peak {peak} bytes for a {received['bytes']} byte export"
+    if fmt == "ndjson":
+        last = json.loads(received["last"].splitlines()[-1])
+        assert last["name"] == f"Employee {EXPORT_ROWS}"
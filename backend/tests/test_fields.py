@@ -0,0 +1,61 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def org(client):
+    department = (await client.post("/departments/", json={"name": "Engineering"})).json()["id"]
+    role = (await client.post("/roles/", json={"title": "Engineer", "level": 2})).json()["id"]
+    manager = (await client.post("/employees/", json={"name": "Manager"})).json()["id"]
+    report = (await client.post("/employees/", json={
+        "name": "Report", "experience": 3, "department_id": department, "role_id": role, "manager_id": manager
+    })).json()["id"]
+    return {"department": department, "role": role, "manager": manager, "report": report}
+
+
+async def test_list_returns_only_requested_fields(client, org):
+    page = (await client.get("/employees/", params={"fields": "name,manager_id"})).json()
+    assert page["items"] == [
+        {"id": org["manager"], "name": "Manager", "manager_id": None},
+        {"id": org["report"], "name": "Report", "manager_id": org["manager"]},
+    ]
+    assert page["next_cursor"] is None
+
+
+async def test_projection_keeps_paging(client, org):
+    page = (await client.get("/employees/", params={"fields": "id", "limit": 1})).json()
+    assert page["items"] == [{"id": org["manager"]}]
+
+    page = (await client.get("/employees/", params={"fields": "id", "cursor": page["next_cursor"]})).json()
+    assert page["items"] == [{"id": org["report"]}]
+
+
+@pytest.mark.parametrize("path", [
+    "/employees/{report}",
+    "/departments/{department}/employees",
+    "/roles/{role}/employees",
+])
+async def test_endpoint_projection(client, org, path):
+    response = await client.get(path.format(**org), params={"fields": "experience, name"})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    expected = {"id": org["report"], "experience": 3, "name": "Report"}
+    assert body == (expected if isinstance(body, dict) else [expected])
+
+
+@pytest.mark.parametrize("path", [
+    "/employees/",
+    "/employees/{report}",
+    "/departments/{department}/employees",
+    "/roles/{role}/employees",
+])
+async def test_unknown_field_is_rejected(client, org, path):
+    response = await client.get(path.format(**org), params={"fields": "name,salary"})
+    assert response.status_code == 400
+    assert "salary" in response.json()["detail"]
+
+
+async def test_projection_of_missing_employee_is_404(client, org):
+    response = await client.get("/employees/999999", params={"fields": "name"})
+    assert response.status_code == 404
@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy import update
+
+from app.models.employee import Employee
+
+pytestmark = pytest.mark.anyio
+
+
+def _ids(node):
+    yield node["id"]
+    for child in node["subordinates"]:
+        yield from _ids(child)
+
+
+async def test_manager_cycle_ends_and_returns_each_node_once(client, db):
+    a = (await client.post("/employees/", json={"name": "A"})).json()["id"]
+    b = (await client.post("/employees/", json={"name": "B", "manager_id": a})).json()["id"]
+    c = (await client.post("/employees/", json={"name": "C", "manager_id": b})).json()["id"]
+
+    # The API refuses cycles, so write one the way legacy data could contain it
+    await db.execute(update(Employee).where(Employee.id == a).values(manager_id=c))
+    await db.commit()
+
+    for root in (a, b, c):
+        response = await client.get(f"/employees/{root}/hierarchy")
+        assert response.status_code == 200, response.text
+        ids = list(_ids(response.json()))
+        assert ids[0] == root
+        assert sorted(ids) == sorted([a, b, c])
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.database import AsyncSessionLocal
+from app.schemas.employee import EmployeeUpdate
+from app.services.employee_service import update_employee
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_move_under_own_report_is_rejected(client):
+    lead = (await client.post("/employees/", json={"name": "Lead"})).json()
+    report = (await client.post("/employees/", json={"name": "Report", "manager_id": lead["id"]})).json()
+
+    response = await client.put(f"/employees/{lead['id']}", json={"manager_id": report["id"]})
+    assert response.status_code == 400
+
+
+@pytest.mark.postgres
+async def test_concurrent_moves_cannot_form_a_cycle(client):
+    a = (await client.post("/employees/", json={"name": "A"})).json()["id"]
+    b = (await client.post("/employees/", json={"name": "B"})).json()["id"]
+
+    async def move(employee_id, manager_id):
+        async with AsyncSessionLocal() as db:
+            return await update_employee(db, employee_id, EmployeeUpdate(manager_id=manager_id))
+
+    # Each move alone is valid; together they would make A and B manage each other
+    results = await asyncio.gather(move(a, b), move(b, a), return_exceptions=True)
+
+    rejected = [r for r in results if isinstance(r, HTTPException)]
+    assert len(rejected) == 1 and rejected[0].status_code == 400, results
+    managers = [(await client.get(f"/employees/{e}")).json()["manager_id"] for e in (a, b)]
+    assert sorted(managers, key=lambda m: m is None) in ([b, None], [a, None])
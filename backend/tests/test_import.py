@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+def ndjson(*rows):
+    return "\n".join(json.dumps(r) for r in rows)
+
+
+async def test_import_reports_rejections_and_warnings_separately(client):
+    manager = (await client.post("/employees/", json={"name": "Manager"})).json()
+    body = ndjson(
+        {"name": "Lead", "ref": "lead"},
+        {"name": "Report", "manager_ref": "lead"},
+        {"name": "Orphan", "manager_ref": "missing"},
+        {"name": "Both", "manager_id": manager["id"], "manager_ref": "lead"},
+    )
+    result = (await client.post("/employees/bulk", content=body)).json()
+
+    assert result["inserted"] == 3
+    assert result["failed"] == 1
+    assert [e["row"] for e in result["errors"]] == [4]
+    assert [w["row"] for w in result["warnings"]] == [3]
+
+    employees = (await client.get("/employees/", params={"limit": 100})).json()["items"]
+    by_name = {e["name"]: e for e in employees}
+    assert by_name["Report"]["manager_id"] == by_name["Lead"]["id"]
+    assert by_name["Orphan"]["manager_id"] is None
+
+
+async def test_import_invalidates_cached_reads(client):
+    assert (await client.get("/dashboard/counts")).json()["total_employees"] == 0
+    await client.post("/employees/bulk", content=ndjson({"name": "A"}, {"name": "B"}))
+    assert (await client.get("/dashboard/counts")).json()["total_employees"] == 2
+
+
+@pytest.fixture
+def short_lines(monkeypatch):
+    from app.config import settings
+    monkeypatch.setattr(settings, "import_max_line_bytes", 64)
+
+
+async def test_line_without_newline_is_rejected(client, short_lines):
+    async def body():
+        # Streamed in small chunks, none of which ends the line
+        for _ in range(10):
+            yield b'{"name": "' + b"x" * 16
+
+    response = await client.post("/employees/bulk", content=body())
+    assert response.status_code == 413
+
+
+async def test_unbalanced_csv_quote_is_rejected(client, short_lines):
+    body = "name,tech_stack\n" + "\n".join(['A,"python'] + ["sql"] * 20)
+    response = await client.post("/employees/bulk", content=body, headers={"content-type": "text/csv"})
+    assert response.status_code == 413
+
+
+async def test_lines_up_to_the_limit_are_accepted(client, short_lines):
+    body = ndjson({"name": "A" * 40}, {"name": "B"})
+    result = (await client.post("/employees/bulk", content=body)).json()
+    assert result["inserted"] == 2
+
+
+async def test_unknown_references_fail_only_their_rows(client, statements):
+    department = (await client.post("/departments/", json={"name": "Engineering"})).json()["id"]
+    manager = (await client.post("/employees/", json={"name": "Manager"})).json()["id"]
+    rows = [{"name": f"E{i}", "department_id": department, "manager_id": manager} for i in range(50)]
+    rows[10]["department_id"] = 999
+    rows[20]["manager_id"] = 998
+    rows[30]["role_id"] = 997
+
+    statements.clear()
+    result = (await client.post("/employees/bulk", content=ndjson(*rows))).json()
+
+    assert result["inserted"] == 47
+    assert result["errors"] == [
+        {"row": 11, "errors": ["department_id: unknown department 999"]},
+        {"row": 21, "errors": ["manager_id: unknown employee 998"]},
+        {"row": 31, "errors": ["role_id: unknown role 997"]},
+    ]
+    # One batched lookup per referenced table, and no per-row savepoint fallback
+    for table in ("departments", "roles"):
+        assert sum(f"FROM {table}" in s for s in statements) == 1, statements
+    assert not any("SAVEPOINT" in s for s in statements), statements
@@ -0,0 +1,152 @@
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select, update
+
+import app.jobs as jobs
+from app.config import settings
+from app.jobs import FAILED, QUEUED, RUNNING, JobRunner, create_job, recover_jobs
+from app.models.job import Job
+from app.services.job_service import IMPORT_JOB, IMPORT_SPOOL_PREFIX
+
+pytestmark = pytest.mark.anyio
+
+
+def spooled_upload() -> str:
+    with tempfile.NamedTemporaryFile(prefix=IMPORT_SPOOL_PREFIX, suffix=".ndjson", delete=False) as f:
+        f.write(b'{"name": "Spooled"}\n')
+    return f.name
+
+
+async def status(db, job_id: str) -> str:
+    return (await db.execute(select(Job.status).where(Job.id == job_id))).scalar_one()
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    # No workers: submitted jobs stay queued
+    runner = JobRunner(workers=0, queue_size=1)
+    monkeypatch.setattr(jobs, "job_runner", runner)
+    return runner
+
+
+def job_row(job_id, status, heartbeat, worker_id="gone-1", **values):
+    return Job(id=job_id, kind=IMPORT_JOB, status=status, params=values.pop("params", {"path": "unused"}),
+               progress_done=0, created_at=heartbeat, heartbeat_at=heartbeat, worker_id=worker_id, **values)
+
+
+async def test_recover_takes_over_jobs_with_stale_heartbeats(db):
+    now = datetime.now(timezone.utc)
+    stale = now - timedelta(seconds=settings.job_stale_seconds + 1)
+    path = spooled_upload()
+    db.add_all([
+        job_row("stale-running", RUNNING, stale, params={"path": path}, started_at=stale),
+        job_row("stale-queued", QUEUED, stale),
+        job_row("fresh-running", RUNNING, now, worker_id="alive-1", started_at=now),
+        job_row("fresh-queued", QUEUED, now, worker_id="alive-1"),
+    ])
+    await db.commit()
+
+    runner = JobRunner(workers=0, queue_size=10)
+    runner.start()
+    assert await recover_jobs(db, runner) == (1, 1)
+
+    rows = {row.id: row for row in (await db.execute(select(Job.id, Job.status, Job.worker_id))).all()}
+    assert rows["stale-running"].status == FAILED
+    assert not os.path.exists(path)
+    # Back on a live queue, owned by the runner that claimed it
+    assert (rows["stale-queued"].status, rows["stale-queued"].worker_id) == (QUEUED, runner.worker_id)
+    assert runner.free_slots() == 9
+    assert rows["fresh-running"].status == RUNNING
+    assert rows["fresh-queued"].worker_id == "alive-1"
+
+    # Nothing left to take over
+    assert await recover_jobs(db, runner) == (0, 0)
+    await runner.stop()
+
+
+async def test_heartbeat_keeps_held_jobs_owned(db, runner):
+    runner.start()
+    job = await create_job(db, IMPORT_JOB, {"path": spooled_upload()}, internal=True)
+    stale = datetime.now(timezone.utc) - timedelta(seconds=settings.job_stale_seconds + 1)
+    await db.execute(update(Job).where(Job.id == job.id).values(heartbeat_at=stale))
+    await db.commit()
+
+    await runner.heartbeat()
+    other = JobRunner(workers=0, queue_size=10)
+    other.start()
+    assert await recover_jobs(db, other) == (0, 0)
+    await other.stop()
+    await runner.stop()
+
+
+async def test_claimed_job_does_not_run_on_its_old_runner(db, runner):
+    runner.start()
+    job = await create_job(db, IMPORT_JOB, {"path": spooled_upload()}, internal=True)
+    stale = datetime.now(timezone.utc) - timedelta(seconds=settings.job_stale_seconds + 1)
+    await db.execute(update(Job).where(Job.id == job.id).values(heartbeat_at=stale))
+    await db.commit()
+
+    # The old runner stalled past its heartbeats; a live one claimed the job meanwhile
+    other = JobRunner(workers=0, queue_size=10)
+    other.start()
+    assert await recover_jobs(db, other) == (0, 1)
+
+    _, kind, params = runner._queue.get_nowait()
+    await runner._run(job.id, kind, params)
+    assert await status(db, job.id) == QUEUED
+    # The upload stays for the runner that now owns the job
+    assert os.path.exists(params.path)
+    await other.stop()
+    await runner.stop()
+
+
+async def test_queue_full_after_capacity_check_fails_the_row(db, runner, monkeypatch):
+    runner.start()
+    first = await create_job(db, IMPORT_JOB, {"path": spooled_upload()}, internal=True)
+
+    # A concurrent submit took the last slot between check_capacity() and submit()
+    monkeypatch.setattr(runner, "check_capacity", lambda: None)
+    path = spooled_upload()
+    with pytest.raises(HTTPException) as exc:
+        await create_job(db, IMPORT_JOB, {"path": path}, internal=True)
+    assert exc.value.status_code == 503
+
+    statuses = dict((await db.execute(select(Job.id, Job.status))).all())
+    assert statuses.pop(first.id) == QUEUED
+    assert list(statuses.values()) == [FAILED]
+    assert not os.path.exists(path)
+    await runner.stop()
+
+
+async def test_stop_discards_queued_uploads(db, runner):
+    runner.start()
+    path = spooled_upload()
+    job = await create_job(db, IMPORT_JOB, {"path": path}, internal=True)
+
+    await runner.stop()
+    assert await status(db, job.id) == FAILED
+    assert not os.path.exists(path)
+
+
+async def test_spooled_import_round_trip(client, db, runner, monkeypatch):
+    import app.services.job_service as job_service
+    # Several spool blocks and several read blocks per upload
+    monkeypatch.setattr(job_service, "SPOOL_BLOCK_BYTES", 64)
+    body = "".join(f'{{"name": "Spooled {i}"}}\n' for i in range(20))
+
+    response = await client.post("/employees/bulk/jobs", content=body)
+    assert response.status_code == 202, response.text
+    job = await db.get(Job, response.json()["id"])
+    with open(job.params["path"]) as f:
+        assert f.read() == body
+
+    # Run what the worker would, without the worker
+    params = job_service.ImportParams.model_validate(job.params)
+    result = await job_service.import_employees_job(db, params, jobs.JobContext(job.id))
+    assert result["inserted"] == 20
+    assert not os.path.exists(params.path)
+    await runner.stop()
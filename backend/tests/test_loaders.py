@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from app.loaders import BatchLoader
+from app.models.employee import Employee
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_loads_in_one_tick_share_a_query(client, db, statements):
+    ids = [(await client.post("/employees/", json={"name": f"E{i}"})).json()["id"] for i in range(3)]
+    loader = BatchLoader(db, Employee)
+
+    statements.clear()
+    rows = await loader.load_many(ids + [999])
+    assert [r.name if r else None for r in rows] == ["E0", "E1", "E2", None]
+    assert len(statements) == 1
+
+
+async def test_cancelled_dispatch_cancels_waiting_loads(db):
+    loader = BatchLoader(db, Employee)
+    future = loader.load(1)
+
+    await asyncio.sleep(0)  # dispatch task created
+    assert len(loader._tasks) == 1
+    for task in loader._tasks:
+        task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await future
+
+    # Not memoized: the next load queries again
+    assert await loader.load(1) is None
+    await asyncio.sleep(0)  # done callbacks
+    assert not loader._tasks
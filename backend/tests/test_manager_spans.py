@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.employee_closure import EmployeeClosure
+from app.services.analytics_service import list_manager_spans
+from app.services.rollup_service import rebuild_rollups
+
+pytestmark = pytest.mark.anyio
+
+
+async def spans_from_closure(db):
+    # What the counters must match: aggregated straight from employee_closure
+    result = await db.execute(
+        select(
+            EmployeeClosure.ancestor_id,
+            func.count().filter(EmployeeClosure.depth == 1),
+            func.count()
+        )
+        .where(EmployeeClosure.depth > 0)
+        .group_by(EmployeeClosure.ancestor_id)
+    )
+    return {manager_id: (direct, total) for manager_id, direct, total in result}
+
+
+async def all_spans(db, sort):
+    spans, cursor = [], None
+    while True:
+        rows, cursor = await list_manager_spans(db, sort, cursor, limit=2)
+        spans.extend(rows)
+        if cursor is None:
+            return spans
+
+
+async def assert_spans_match(db):
+    expected = await spans_from_closure(db)
+    for sort in ("direct", "total"):
+        spans = await all_spans(db, sort)
+        assert {r.id: (r.direct_reports, r.total_reports) for r in spans} == expected
+        keys = [(r.direct_reports if sort == "direct" else r.total_reports, r.id) for r in spans]
+        assert keys == sorted(keys, reverse=True)
+
+
+async def test_spans_follow_hierarchy_writes(client, db):
+    async def create(name, manager_id=None):
+        return (await client.post("/employees/", json={"name": name, "manager_id": manager_id})).json()["id"]
+
+    ceo = await create("CEO")
+    vp = await create("VP", ceo)
+    leads = [await create(f"Lead {i}", vp) for i in range(3)]
+    for i, lead in enumerate(leads):
+        for j in range(i + 1):
+            await create(f"IC {i}.{j}", lead)
+    await assert_spans_match(db)
+
+    # Move a subtree, delete a manager, re-parent in bulk, import under an existing manager
+    await client.put(f"/employees/{leads[2]}", json={"manager_id": ceo})
+    await assert_spans_match(db)
+    await client.delete(f"/employees/{leads[1]}")
+    await assert_spans_match(db)
+    await client.request("PATCH", "/employees/bulk", json={"ids": [leads[0]], "changes": {"manager_id": leads[2]}})
+    await assert_spans_match(db)
+    body = "\n".join(json.dumps(r) for r in (
+        {"name": "New Lead", "ref": "nl", "manager_id": vp},
+        {"name": "New IC", "manager_ref": "nl"},
+    ))
+    await client.post("/employees/bulk", content=body)
+    await assert_spans_match(db)
+
+    incremental = [tuple(r) for r in await all_spans(db, "total")]
+    await rebuild_rollups(db)
+    assert [tuple(r) for r in await all_spans(db, "total")] == incremental
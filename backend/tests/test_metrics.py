@@ -0,0 +1,19 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_metric_types(client):
+    await client.get("/departments/")
+    text = (await client.get("/metrics")).text
+
+    types = dict(
+        line.split()[2:4] for line in text.splitlines() if line.startswith("# TYPE ")
+    )
+    assert types["fasthr_http_requests_total"] == "counter"
+    assert types["fasthr_response_cache_requests_total"] == "counter"
+    assert types["fasthr_db_pool_checkout_timeouts_total"] == "counter"
+    assert types["fasthr_response_cache_entries"] == "gauge"
+    # Every *_total series is a counter
+    assert all(kind == "counter" for name, kind in types.items() if name.endswith("_total"))
+    assert 'fasthr_response_cache_requests_total{result="miss"}' in text
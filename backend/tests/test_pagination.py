@@ -0,0 +1,43 @@
+import pytest
+
+from app.services.pagination import encode_cursor
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def employees(client):
+    for i in range(3):
+        await client.post("/employees/", json={"name": f"E{i}", "experience": i})
+
+
+async def test_cursor_walks_every_page(client, employees):
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get("/employees/", params=params)).json()
+        seen += [e["name"] for e in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == ["E0", "E1", "E2"]
+
+
+@pytest.mark.parametrize("path, values", [
+    ("/employees/", ["1"]),
+    ("/employees/", [True]),
+    ("/employees/", [None]),
+    ("/employees/", [1, 2]),
+    ("/employees/sort/?by=name", [1, 1]),
+    ("/employees/sort/?by=experience", ["x", 1]),
+    ("/employees/filter/?min_exp=0", [{"id": 1}]),
+])
+async def test_tampered_cursor_is_rejected(client, employees, path, values):
+    separator = "&" if "?" in path else "?"
+    response = await client.get(f"{path}{separator}cursor={encode_cursor(values)}")
+    assert response.status_code == 400, response.text
+
+
+async def test_undecodable_cursor_is_rejected(client, employees):
+    response = await client.get("/employees/?cursor=not-base64!")
+    assert response.status_code == 400
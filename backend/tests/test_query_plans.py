@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import insert, select, text
+
+from app.database import engine
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.role import Role
+from app.services.employee_service import build_employee_query
+from app.services.pagination import DEFAULT_PAGE_SIZE, apply_keyset
+
+pytestmark = [pytest.mark.anyio, pytest.mark.postgres]
+
+# Enough rows, spread thin enough per key, that a sequential or primary key scan loses
+EMPLOYEES = 20000
+GROUPS = 500
+
+
+@pytest.fixture
+async def org(db):
+    await db.execute(insert(Department), [{"name": f"Department {i}"} for i in range(GROUPS)])
+    await db.execute(insert(Role), [{"title": f"Role {i}", "level": 1} for i in range(GROUPS)])
+    # Employee n reports to employee n / 10; ids restart at 1 for every test
+    await db.execute(text(
+        "INSERT INTO employees (name, department_id, role_id, manager_id, year_of_joining) "
+        "SELECT 'Employee ' || n, 1 + n % :groups, 1 + n % :groups, NULLIF(n / 10, 0), 1000 + n % :groups "
+        "FROM generate_series(1, :employees) AS n"
+    ), {"groups": GROUPS, "employees": EMPLOYEES})
+    await db.commit()
+    await db.execute(text("ANALYZE employees"))
+
+
+async def explain(db, query) -> str:
+    sql = query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+    result = await db.execute(text(f"EXPLAIN {sql}"))
+    return "\n".join(result.scalars().all())
+
+
+def first_page(**filters):
+    # The query behind GET /employees/filter/ (and the department / role listings)
+    return apply_keyset(build_employee_query(**filters), [Employee.id], None, DEFAULT_PAGE_SIZE)
+
+
+@pytest.mark.parametrize("query, index", [
+    (first_page(department_id=7), "ix_employees_department_id"),
+    (first_page(role_id=7), "ix_employees_role_id"),
+    (first_page(year_of_joining=1007), "ix_employees_year_of_joining"),
+    (first_page(name="Employee 1234"), "ix_employees_name_trgm"),
+    # GET /employees/{id}/subordinates
+    (select(Employee).where(Employee.manager_id == 7), "ix_employees_manager_id"),
+])
+async def test_filter_uses_index(org, db, query, index):
+    plan = await explain(db, query)
+    assert index in plan, plan
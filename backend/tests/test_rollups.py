@@ -0,0 +1,38 @@
+from collections import Counter
+
+import pytest
+from sqlalchemy import select
+
+from app.models.analytics_rollup import AnalyticsRollup
+from app.services.rollup_service import (
+    DEPARTMENT,
+    UNASSIGNED_BUCKET,
+    apply_rollup_deltas,
+    list_rollup,
+    rebuild_rollups
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_unassigned_bucket_is_one_counter(db):
+    # Two "first" writes to the unassigned bucket land on the same row
+    await apply_rollup_deltas(db, Counter({(DEPARTMENT, None): 1}))
+    await apply_rollup_deltas(db, Counter({(DEPARTMENT, None): 2, (DEPARTMENT, 7): 1}))
+    await db.commit()
+
+    rows = (await db.execute(select(AnalyticsRollup.bucket, AnalyticsRollup.count))).all()
+    assert sorted(rows) == [(UNASSIGNED_BUCKET, 3), (7, 1)]
+    assert [tuple(r) for r in await list_rollup(db, DEPARTMENT)] == [(7, 1), (None, 3)]
+
+
+async def test_rebuild_matches_incremental_counts(client, db):
+    department = (await client.post("/departments/", json={"name": "Ops"})).json()
+    for i in range(3):
+        await client.post("/employees/", json={"name": f"E{i}", "department_id": department["id"]})
+    await client.post("/employees/", json={"name": "Floating"})
+
+    incremental = [tuple(r) for r in await list_rollup(db, DEPARTMENT)]
+    await rebuild_rollups(db)
+    assert [tuple(r) for r in await list_rollup(db, DEPARTMENT)] == incremental
+    assert incremental == [(department["id"], 3), (None, 1)]
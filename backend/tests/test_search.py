@@ -0,0 +1,56 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+NAMES = ["Ada Lovelace", "Adam Smith", "Grace Hopper", "Madame Curie", "Alan Turing"]
+
+
+@pytest.fixture
+async def people(client):
+    return {
+        name: (await client.post("/employees/", json={"name": name})).json()["id"]
+        for name in NAMES
+    }
+
+
+async def _names(client, **params):
+    response = await client.get("/employees/search/", params=params)
+    assert response.status_code == 200, response.text
+    return [e["name"] for e in response.json()["items"]]
+
+
+async def test_substring_match_ranks_leading_hits_first(client, people):
+    names = await _names(client, q="ada")
+    assert sorted(names) == ["Ada Lovelace", "Adam Smith", "Madame Curie"]
+    assert names[-1] == "Madame Curie"
+
+
+async def test_match_is_case_insensitive(client, people):
+    assert await _names(client, q="HOPPER") == ["Grace Hopper"]
+
+
+async def test_prefix_matches_word_starts_only(client, people):
+    assert sorted(await _names(client, q="ada", prefix=True)) == ["Ada Lovelace", "Adam Smith"]
+    assert await _names(client, q="tur", prefix=True) == ["Alan Turing"]
+
+
+async def test_like_wildcards_are_literal(client, people):
+    assert await _names(client, q="%") == []
+    assert await _names(client, q="_") == []
+
+
+async def test_search_pages_through_all_matches(client, people):
+    seen, cursor = [], None
+    while True:
+        params = {"q": "a", "limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get("/employees/search/", params=params)).json()
+        seen += [e["name"] for e in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert sorted(seen) == sorted(NAMES)
+
+
+async def test_empty_query_is_rejected(client):
+    response = await client.get("/employees/search/", params={"q": ""})
+    assert response.status_code == 422
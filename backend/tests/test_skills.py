@@ -0,0 +1,73 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def people(client):
+    stacks = {
+        "Backend": "Python, SQL",
+        "Frontend": "TypeScript, React",
+        "Fullstack": "python, typescript, postgres",
+        "Data": " python , pandas, Python",
+    }
+    return {
+        name: (await client.post("/employees/", json={"name": name, "tech_stack": stack})).json()["id"]
+        for name, stack in stacks.items()
+    }
+
+
+async def _search(client, params):
+    response = await client.get("/analytics/search/skills", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def test_any_mode_matches_either_skill(client, people):
+    page = await _search(client, [("skill", "sql"), ("skill", "react")])
+    assert [e["name"] for e in page["items"]] == ["Backend", "Frontend"]
+    assert page["skill_counts"] == {"sql": 1, "react": 1}
+
+
+async def test_all_mode_needs_every_skill(client, people):
+    page = await _search(client, {"skill": "Python,TypeScript", "mode": "all"})
+    assert [e["name"] for e in page["items"]] == ["Fullstack"]
+    assert page["skill_counts"] == {"python": 3, "typescript": 2}
+
+
+async def test_duplicate_skills_count_once(client, people):
+    page = await _search(client, {"skill": "python,PYTHON", "mode": "all"})
+    assert [e["name"] for e in page["items"]] == ["Backend", "Fullstack", "Data"]
+
+
+async def test_skill_follows_tech_stack_updates(client, people):
+    await client.put(f"/employees/{people['Frontend']}", json={"tech_stack": "python"})
+    page = await _search(client, {"skill": "react"})
+    assert page["items"] == [] and page["skill_counts"] == {"react": 0}
+
+
+async def test_blank_skill_is_rejected(client, people):
+    response = await client.get("/analytics/search/skills", params={"skill": " , "})
+    assert response.status_code == 400
+
+
+async def test_unknown_mode_is_rejected(client, people):
+    response = await client.get("/analytics/search/skills", params={"skill": "python", "mode": "some"})
+    assert response.status_code == 422
+
+
+async def test_top_skills_by_headcount(client, people):
+    response = await client.get("/analytics/skills", params={"limit": 2})
+    assert response.json() == [{"skill": "python", "count": 3}, {"skill": "typescript", "count": 2}]
+
+
+async def test_top_skills_prefix(client, people):
+    response = await client.get("/analytics/skills", params={"prefix": "P"})
+    assert response.json() == [
+        {"skill": "python", "count": 3},
+        {"skill": "pandas", "count": 1},
+        {"skill": "postgres", "count": 1},
+    ]
+
+    response = await client.get("/analytics/skills", params={"prefix": "%"})
+    assert response.json() == []
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import inspect, select
+from sqlalchemy.exc import InvalidRequestError
+
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.role import Role
+
+pytestmark = pytest.mark.anyio
+
+REPORTS = 12
+
+
+@pytest.fixture
+async def org(client):
+    department = (await client.post("/departments/", json={"name": "Engineering"})).json()
+    role = (await client.post("/roles/", json={"title": "Engineer", "level": 2})).json()
+    manager = (await client.post("/employees/", json={
+        "name": "Manager", "department_id": department["id"], "role_id": role["id"]
+    })).json()
+    for i in range(REPORTS):
+        await client.post("/employees/", json={
+            "name": f"Report {i}",
+            "tech_stack": "python, sql",
+            "department_id": department["id"],
+            "role_id": role["id"],
+            "manager_id": manager["id"],
+        })
+    return {"department": department["id"], "role": role["id"], "manager": manager["id"]}
+
+
+# Statements per read, independent of how many rows come back (REPORTS + 1 employees)
+READS = [
+    ("/employees/", 1),
+    ("/employees/?fields=id,name", 1),
+    ("/employees/{manager}", 1),
+    ("/employees/{manager}/subordinates", 2),
+    ("/employees/{manager}/hierarchy", 1),
+    ("/employees/{manager}/descendants", 1),
+    ("/employees/department/{department}", 1),
+    ("/employees/role/{role}", 1),
+    ("/employees/filter/?min_exp=0", 1),
+    ("/employees/sort/?by=name", 1),
+    ("/departments/", 1),
+    ("/departments/{department}", 1),
+    ("/departments/{department}/employees", 2),
+    ("/roles/", 1),
+    ("/roles/{role}", 1),
+    ("/roles/{role}/employees", 1),
+    ("/structure/tree", 1),
+]
+
+
+@pytest.mark.parametrize("path, expected", READS)
+async def test_read_statement_count(client, org, statements, path, expected):
+    statements.clear()
+    response = await client.get(path.format(**org))
+
+    assert response.status_code == 200, response.text
+    assert len(statements) == expected, statements
+
+
+async def test_relationships_never_load_implicitly():
+    for model in (Employee, Department, Role):
+        for rel in inspect(model).relationships:
+            assert rel.lazy == "raise", f"{model.__name__}.{rel.key} is lazy={rel.lazy!r}"
+
+
+async def test_relationship_access_raises(org, db):
+    # A serializer or service touching a relationship without a loader option fails loudly
+    employee = await db.get(Employee, org["manager"])
+    for attribute in ("department", "role_details", "manager", "subordinates"):
+        with pytest.raises(InvalidRequestError):
+            getattr(employee, attribute)
+
+    department = (await db.execute(select(Department))).scalars().first()
+    with pytest.raises(InvalidRequestError):
+        department.employees